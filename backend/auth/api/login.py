@@ -8,8 +8,9 @@ from starlette.status import (
 )
 from backend.log.service.user_log_manager import UserLogManager
 from backend.auth.service.user_manager import UserManager
+from backend.middleware import ProfiledRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 session_manager = SessionManager()
 user_manager = UserManager()
 user_log_manager = UserLogManager()
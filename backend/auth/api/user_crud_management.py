@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from typing import Literal
 from backend.auth.service.user_manager import UserManager
-from backend.auth.service.session_manager import verify_admin_session
+from backend.auth.service.session_manager import SessionManager, verify_admin_session
 from backend.log.service.user_log_manager import UserLogManager
 from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
@@ -8,17 +10,22 @@ from starlette.status import (
 )
 from backend.config import (
     DEFAULT_ROOT_ACCOUNT_ID,
+    USER_BULK_BATCH_SIZE,
 )
+from backend.auth.service.user_bulk_import import BulkUserParser, iter_lines
 from backend.auth.service.user_schemas import (
     UserCreateRequest,
     UserInfoResponse,
     ChangePasswordRequest,
     AdminRequest,
+    BulkUserTargetRequest,
 )
+from backend.middleware import ProfiledRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 user_manager = UserManager()
 user_log_manager = UserLogManager()
+session_manager = SessionManager()
 
 
 @router.post("/")
@@ -65,13 +72,97 @@ def create_user(
         )
 
 
+def create_user_batch(entries, seen_user_ids, request_user):
+    results = user_manager.create_users_bulk(entries, seen_user_ids)
+    counts = {"created": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
+    # 사용자마다 감사 로그를 남기지 않고 배치마다 요약 로그를 하나만 남김
+    user_log_manager.save_user_log(
+        user_id=request_user,
+        action="사용자 일괄 생성",
+        success=True,
+        error_code=None,
+        details=(
+            f"사용자 {counts['created']}명이 일괄 생성되었습니다. "
+            f"(중복 {counts['duplicate']}건, 잘못된 요청 {counts['invalid']}건)"
+        ),
+    )
+    return results
+
+
+@router.post("/bulk")
+async def create_users_bulk(
+    request: Request,
+    request_user: str = Query(..., description="ID of the admin making the request"),
+    format: Literal["ndjson", "csv"] = Query(
+        "ndjson", description="Body format: one JSON object per line, or CSV with a header"
+    ),
+    _: None = Depends(verify_admin_session),
+):
+    parser = BulkUserParser(format)
+    seen_user_ids = set()
+    results = []
+    batch = []
+    try:
+        async for line in iter_lines(request.stream()):
+            entry = parser.parse_line(line)
+            if entry is None:
+                continue
+            batch.append(entry)
+            if len(batch) >= USER_BULK_BATCH_SIZE:
+                results += await run_in_threadpool(
+                    create_user_batch, batch, seen_user_ids, request_user
+                )
+                batch = []
+        if batch:
+            results += await run_in_threadpool(
+                create_user_batch, batch, seen_user_ids, request_user
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"{str(e)}",
+        )
+    except Exception as e:
+        user_log_manager.save_user_log(
+            user_id=request_user,
+            action="사용자 일괄 생성",
+            success=False,
+            error_code=500,
+            details=f"사용자 일괄 생성 중 예기치 못한 오류가 발생하였습니다. {str(e)}",
+        )
+        created = sum(1 for result in results if result["status"] == "created")
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"예기치 못한 오류가 발생하였습니다. (이미 생성된 사용자 {created}명) {str(e)}",
+        )
+
+    return {
+        "created": sum(1 for result in results if result["status"] == "created"),
+        "duplicate": sum(1 for result in results if result["status"] == "duplicate"),
+        "invalid": sum(1 for result in results if result["status"] == "invalid"),
+        "results": results,
+    }
+
+
 @router.get("/")
 def get_user_list(
     page: int = Query(1, ge=1, description="Page number (1-based index)"),
     per_page: int = Query(10, ge=1, le=100, description="Number of users per page"),
     is_locked: bool = Query(False, description="Filter by lock status"),
     user_id: str = Query(None, description="Filter by user ID (optional)"),
+    search_mode: Literal["exact", "prefix", "contains", "fulltext"] = Query(
+        "prefix", description="How `user_id` is matched"
+    ),
     role: str = Query(None, description="Filter by user role (optional)"),
+    estimate_total: bool = Query(
+        False, description="Allow an estimated total when an exact count is expensive"
+    ),
+    after: str = Query(
+        None, description="Return users after this cursor (`next_cursor`) instead of `page`"
+    ),
     _: None = Depends(verify_admin_session),
 ):
     try:
@@ -81,8 +172,21 @@ def get_user_list(
             is_locked=is_locked,
             user_id=user_id,
             role=role,
+            search_mode=search_mode,
+            with_total=not estimate_total,
+            after=after,
         )
 
+        is_estimate = False
+        if estimate_total:
+            total, is_estimate = user_manager.count_users(
+                is_locked=is_locked,
+                user_id=user_id,
+                role=role,
+                estimate=True,
+                search_mode=search_mode,
+            )
+
         return {
             "users": [
                 UserInfoResponse(
@@ -94,6 +198,8 @@ def get_user_list(
                 for user in users
             ],
             "total": total,
+            "is_estimate": is_estimate,
+            "next_cursor": users[-1].id if len(users) == per_page else None,
         }
     except HTTPException as e:
         raise e
@@ -183,3 +289,46 @@ def delete_user(data: AdminRequest, _: None = Depends(verify_admin_session)):
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="사용자 삭제 중 오류가 발생했습니다.",
         )
+
+
+@router.delete("/bulk")
+def delete_users_bulk(
+    data: BulkUserTargetRequest, _: None = Depends(verify_admin_session)
+):
+    try:
+        deleted_user_ids = user_manager.delete_users(
+            data.user_ids,
+            data.role,
+            data.inactive_days,
+            exclude_user_id=data.request_user,
+        )
+        session_manager.delete_sessions_user_ids(deleted_user_ids)
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 일괄 삭제",
+            success=True,
+            error_code=None,
+            details=f"사용자 {len(deleted_user_ids)}명이 일괄 삭제되었습니다.",
+        )
+        return {"count": len(deleted_user_ids), "user_ids": deleted_user_ids}
+    except HTTPException as e:
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 일괄 삭제",
+            success=False,
+            error_code=e.status_code,
+            details=f"사용자 일괄 삭제 중 오류가 발생하였습니다. {e.detail}",
+        )
+        raise e
+    except Exception as e:
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 일괄 삭제",
+            success=False,
+            error_code=500,
+            details=f"사용자 일괄 삭제 중 오류가 발생하였습니다. {str(e)}",
+        )
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사용자 일괄 삭제 중 오류가 발생했습니다.",
+        )
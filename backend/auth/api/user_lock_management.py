@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from fastapi import APIRouter, HTTPException, Response, Request, Depends
+from fastapi import APIRouter, HTTPException, Query, Response, Request, Depends
 from backend.auth.service.user_manager import UserManager
 from backend.auth.service.session_manager import SessionManager, verify_admin_session
 from backend.log.service.user_log_manager import UserLogManager
@@ -7,21 +7,38 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_400_BAD_REQUEST,
 )
-from backend.auth.service.user_schemas import LockUserResponse, AdminRequest
+from backend.auth.service.user_schemas import (
+    LockUserResponse,
+    AdminRequest,
+    BulkUserTargetRequest,
+)
 from backend.config import (
     DEFAULT_ROOT_ACCOUNT_ID,
 )
+from backend.middleware import ProfiledRoute
 
 user_log_manager = UserLogManager()
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 session_manager = SessionManager()
 user_manager = UserManager()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("/locked")
-def get_lock_user_list(_: None = Depends(verify_admin_session)):
+def get_lock_user_list(
+    response: Response,
+    per_page: int = Query(25, ge=1, le=100, description="Number of users per page"),
+    after: str = Query(
+        None, description="Return users after this cursor (`X-Next-Cursor` header)"
+    ),
+    _: None = Depends(verify_admin_session),
+):
     try:
-        locked_users = user_manager.get_all_lock_users()
+        locked_users = user_manager.get_locked_users(per_page=per_page, after=after)
+        # 기존 클라이언트가 그대로 동작하도록 응답 본문은 목록으로 유지하고 커서는 헤더로 전달함
+        if len(locked_users) == per_page:
+            response.headers[NEXT_CURSOR_HEADER] = locked_users[-1].id
         return [
             LockUserResponse(
                 user_id=locked_user.id,
@@ -42,8 +59,9 @@ def get_lock_user_list(_: None = Depends(verify_admin_session)):
 @router.get("/locked/count")
 def get_lock_user_count(_: None = Depends(verify_admin_session)):
     try:
-        locked_users = user_manager.get_all_lock_users()
-        return len(locked_users)
+        # 응답이 숫자 하나뿐이라 추정치임을 알릴 수 없으므로 항상 정확한 값을 셈
+        locked_user_count = user_manager.count_users(is_locked=True, estimate=False)[0]
+        return locked_user_count
     except Exception as e:
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
@@ -124,3 +142,83 @@ def lock_user(data: AdminRequest, _: None = Depends(verify_admin_session)):
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="사용자 계정 비활성화 실패",
         )
+
+
+@router.post("/unlock/bulk")
+def unlock_users_bulk(
+    data: BulkUserTargetRequest, _: None = Depends(verify_admin_session)
+):
+    try:
+        unlocked_user_ids = user_manager.unlock_accounts(
+            data.user_ids, data.role, data.inactive_days
+        )
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 계정 일괄 활성화",
+            success=True,
+            error_code=None,
+            details=f"사용자 계정 {len(unlocked_user_ids)}개가 일괄 활성화되었습니다.",
+        )
+        return {"count": len(unlocked_user_ids), "user_ids": unlocked_user_ids}
+    except HTTPException as e:
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 계정 일괄 활성화",
+            success=False,
+            error_code=e.status_code,
+            details=f"사용자 계정 일괄 활성화 중 오류가 발생하였습니다. {e.detail}",
+        )
+        raise e
+    except Exception as e:
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 계정 일괄 활성화",
+            success=False,
+            error_code=500,
+            details=f"사용자 계정 일괄 활성화 중 오류가 발생하였습니다. {str(e)}",
+        )
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사용자 계정 일괄 활성화 실패",
+        )
+
+
+@router.post("/lock/bulk")
+def lock_users_bulk(data: BulkUserTargetRequest, _: None = Depends(verify_admin_session)):
+    try:
+        locked_user_ids = user_manager.lock_accounts(
+            data.user_ids,
+            data.role,
+            data.inactive_days,
+            exclude_user_id=data.request_user,
+        )
+        session_manager.delete_sessions_user_ids(locked_user_ids)
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 계정 일괄 비활성화",
+            success=True,
+            error_code=None,
+            details=f"사용자 계정 {len(locked_user_ids)}개가 일괄 비활성화되었습니다.",
+        )
+        return {"count": len(locked_user_ids), "user_ids": locked_user_ids}
+    except HTTPException as e:
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 계정 일괄 비활성화",
+            success=False,
+            error_code=e.status_code,
+            details=f"사용자 계정 일괄 비활성화 중 오류가 발생하였습니다. {e.detail}",
+        )
+        raise e
+    except Exception as e:
+        user_log_manager.save_user_log(
+            user_id=data.request_user,
+            action="사용자 계정 일괄 비활성화",
+            success=False,
+            error_code=500,
+            details=f"사용자 계정 일괄 비활성화 중 오류가 발생하였습니다. {str(e)}",
+        )
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사용자 계정 일괄 비활성화 실패",
+        )
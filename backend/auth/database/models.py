@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Boolean, Index
 from sqlalchemy.orm import declarative_base  
 from datetime import datetime
 from backend.database.base_database_manager import Base
@@ -18,12 +18,20 @@ class User(Base):
     failed_attempts = Column(Integer, nullable=False, default=0)
     is_locked = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
+    last_login_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 사용자 목록 조회(잠금/권한 필터, id 정렬)가 테이블을 읽지 않고 인덱스만으로 처리되도록 함
+        Index("ix_user_is_locked_role_id", "is_locked", "role", "id", "created_at"),
+        # 잠긴 사용자 목록(id 커서 정렬)과 잠긴 사용자 수를 권한 구분 없이 인덱스 범위로 처리함
+        Index("ix_user_is_locked_id", "is_locked", "id", "role", "last_failed_login"),
+    )
 
 
 class SessionModel(BaseSession):
     __tablename__ = "session"
 
     session_id = Column(String(255), primary_key=True)
-    user_id = Column(String(255))
+    user_id = Column(String(255), index=True)
     role = Column(String(255))
-    expires_at = Column(DateTime)
+    expires_at = Column(DateTime, index=True)
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+import logging
 import uuid
 from fastapi import HTTPException, Response, Request, Depends
 from starlette.status import (
@@ -15,11 +16,22 @@ from backend.config import (
     SESSION_DATABASE_URI,
     IS_DOCKER,
     SESSION_EXPIRE_MINUTE,
+    SESSION_CLEANUP_BATCH_SIZE,
+    USER_BULK_BATCH_SIZE,
+    REQUEST_PROFILING_ENABLED,
+)
+from backend.database.query_profiler import timed_stage
+from backend.monitoring.service.request_profiling import (
+    PROFILE_HEADER,
+    start_request_profile,
+    wants_request_profile,
 )
 from backend.log.service.user_log_manager import UserLogManager
 from typing import Optional
+from sqlalchemy import func
 
 user_log_manager = UserLogManager()
+logger = logging.getLogger(__name__)
 
 
 class SessionManager(BaseManager):
@@ -115,6 +127,7 @@ class SessionManager(BaseManager):
             samesite="Lax",
         )
 
+    @timed_stage("session-check")
     def validate_session(self, request: Request, response: Response, role=None):
         session = self.get_session()
         try:
@@ -235,43 +248,92 @@ class SessionManager(BaseManager):
             session.close()
 
     def delete_session_user_id(self, user_id: str):
+        self.delete_sessions_user_ids([user_id])
+
+    def delete_sessions_user_ids(self, user_ids: list[str]) -> int:
+        if not user_ids:
+            return 0
+
         session = self.get_session()
         try:
-            db_sessions = (
-                session.query(SessionModel)
-                .filter(SessionModel.user_id == user_id)
-                .all()
-            )
-            for db_session in db_sessions:
-                session.delete(db_session)
+            deleted = 0
+            for start in range(0, len(user_ids), USER_BULK_BATCH_SIZE):
+                deleted += (
+                    session.query(SessionModel)
+                    .filter(
+                        SessionModel.user_id.in_(
+                            user_ids[start : start + USER_BULK_BATCH_SIZE]
+                        )
+                    )
+                    .delete(synchronize_session=False)
+                )
             session.commit()
+            return deleted
         except Exception as e:
             session.rollback()
             raise e
         finally:
             session.close()
 
-    def delete_expired_sessions(self):
+    def oldest_expired_session_age(self):
         session = self.get_session()
         try:
             now = datetime.now()
-            expired_sessions = (
-                session.query(SessionModel).filter(SessionModel.expires_at < now).all()
-            )
-
-            for db_session in expired_sessions:
-                session.delete(db_session)
-
-            session.commit()
-            print(
-                f"\033[32m[SessionManager] Deleted {len(expired_sessions)} expired sessions.\033[0m"
+            oldest = (
+                session.query(func.min(SessionModel.expires_at))
+                .filter(SessionModel.expires_at < now)
+                .scalar()
             )
+            if oldest is None:
+                return None
+            return round((now - oldest).total_seconds(), 1)
         except Exception as e:
             session.rollback()
             raise e
         finally:
             session.close()
 
+    def delete_expired_sessions(self, stats: dict = None) -> int:
+        now = datetime.now()
+        total_deleted = 0
+        while True:
+            session = self.get_session()
+            try:
+                # 잠금을 오래 잡지 않도록 expires_at 인덱스로 한 배치씩 골라 한 번의 DELETE로 지움
+                expired_ids = [
+                    row.session_id
+                    for row in session.query(SessionModel.session_id)
+                    .filter(SessionModel.expires_at < now)
+                    .limit(SESSION_CLEANUP_BATCH_SIZE)
+                    .all()
+                ]
+                if stats is not None:
+                    stats["scanned"] = stats.get("scanned", 0) + len(expired_ids)
+                if expired_ids:
+                    # 그사이 연장된 세션은 지우지 않도록 만료 조건을 다시 걺
+                    total_deleted += (
+                        session.query(SessionModel)
+                        .filter(
+                            SessionModel.session_id.in_(expired_ids),
+                            SessionModel.expires_at < now,
+                        )
+                        .delete(synchronize_session=False)
+                    )
+                    session.commit()
+            except Exception as e:
+                session.rollback()
+                raise e
+            finally:
+                session.close()
+
+            if len(expired_ids) < SESSION_CLEANUP_BATCH_SIZE:
+                break
+
+        if stats is not None:
+            stats["affected"] = total_deleted
+        logger.info("Deleted %d expired sessions.", total_deleted)
+        return total_deleted
+
 
 session_manager_instance = SessionManager()
 
@@ -291,4 +353,7 @@ def verify_admin_session(
     session_manager: SessionManager = Depends(lambda: session_manager_instance),
 ):
     """Dependency to validate session for admin users only."""
-    session_manager.validate_session(request, response, role="admin")
\ No newline at end of file
+    session_manager.validate_session(request, response, role="admin")
+    # 관리자 세션이 확인된 요청만 프로파일링할 수 있음
+    if REQUEST_PROFILING_ENABLED == "true" and wants_request_profile(request):
+        response.headers[PROFILE_HEADER] = start_request_profile(request)
\ No newline at end of file
@@ -0,0 +1,61 @@
+import codecs
+import csv
+import json
+
+BULK_FORMATS = ("ndjson", "csv")
+CSV_COLUMNS = ("user_id", "password", "role")
+
+
+async def iter_lines(stream):
+    # 요청 본문을 모두 읽지 않고 청크 단위로 받아 줄 단위로 나눔
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in stream:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+class BulkUserParser:
+    def __init__(self, bulk_format: str):
+        if bulk_format not in BULK_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: `{bulk_format}`")
+        self.bulk_format = bulk_format
+        self.columns = None
+        self.line_number = 0
+
+    def parse_line(self, line: str):
+        """Return an entry dict for a data line, or None for blank and header lines."""
+        self.line_number += 1
+        if not line.strip():
+            return None
+
+        if self.bulk_format == "csv" and self.columns is None:
+            self.columns = [field.strip() for field in next(csv.reader([line]))]
+            missing = set(CSV_COLUMNS[:2]) - set(self.columns)
+            if missing:
+                raise ValueError(
+                    f"CSV 헤더에 필요한 컬럼이 없습니다: {', '.join(sorted(missing))}"
+                )
+            return None
+
+        entry = {"line": self.line_number, "error": None}
+        try:
+            if self.bulk_format == "ndjson":
+                values = json.loads(line)
+                if not isinstance(values, dict):
+                    raise ValueError("각 줄은 JSON 객체여야 합니다.")
+            else:
+                values = dict(zip(self.columns, next(csv.reader([line]))))
+        except ValueError as e:
+            entry["error"] = f"잘못된 형식의 줄입니다. {str(e)}"
+            values = {}
+
+        for column in CSV_COLUMNS:
+            value = values.get(column)
+            entry[column] = str(value).strip() if value is not None else None
+        return entry
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple, Optional
+import time
+
+
+class UserSnapshot(NamedTuple):
+    id: str
+    role: str
+    password: str
+    salt: str
+    is_locked: bool
+    logins_before_rehash: int
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(
+            id=user.id,
+            role=user.role,
+            password=user.password,
+            salt=user.salt,
+            is_locked=bool(user.is_locked),
+            logins_before_rehash=user.logins_before_rehash or 0,
+        )
+
+
+class UserCache:
+    """사용자 인증 정보의 읽기 전용 스냅샷을 보관하는 LRU 캐시.
+
+    스냅샷은 DB를 읽지 않고 쓰기를 시도하기 위한 용도로만 사용하며, 쓰기는 항상
+    스냅샷의 비밀번호 해시와 잠금 상태를 조건으로 걸어 다른 워커에서 변경된 경우
+    적용되지 않도록 합니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        # MySQL 기본 collation은 대소문자를 구분하지 않으므로 같은 사용자를 한 항목으로 관리함
+        return user_id.lower()
+
+    def get(self, user_id: str) -> Optional[UserSnapshot]:
+        if not self.enabled or user_id is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(self._key(user_id))
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at < time.monotonic():
+                del self._entries[self._key(user_id)]
+                return None
+            self._entries.move_to_end(self._key(user_id))
+        # 대소문자가 다른 ID로 조회한 경우 DB의 비교 규칙을 따르도록 캐시를 사용하지 않음
+        if snapshot.id != user_id:
+            return None
+        return snapshot
+
+    def set(self, snapshot: UserSnapshot):
+        if not self.enabled:
+            return
+        with self._lock:
+            key = self._key(snapshot.id)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids=None):
+        with self._lock:
+            if user_ids is None:
+                self._entries.clear()
+                return
+            if isinstance(user_ids, str):
+                user_ids = [user_ids]
+            for user_id in user_ids:
+                self._entries.pop(self._key(user_id), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
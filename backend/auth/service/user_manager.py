@@ -19,16 +19,42 @@ from backend.config import (
     MAX_FAILURES,
     REHASH_COUNT_STANDARD,
     DEFAULT_ROOT_ACCOUNT_ID,
+    COUNT_CACHE_TTL_SECONDS,
+    COUNT_CACHE_MAX_ENTRIES,
+    COUNT_ESTIMATE_THRESHOLD,
+    USER_ID_FULLTEXT_INDEX,
+    USER_BULK_BATCH_SIZE,
+    USER_CACHE_MAX_ENTRIES,
+    USER_CACHE_TTL_SECONDS,
+    USER_CACHE_WARM_SIZE,
 )
 from backend.database.base_database_manager import Base
+from backend.database.count_cache import CountCache
+from backend.database.user_id_search import DEFAULT_SEARCH_MODE, user_id_condition
+from backend.auth.service.user_cache import UserCache, UserSnapshot
+from backend.database.query_profiler import timed_stage
 from datetime import datetime, timedelta
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.exc import IntegrityError
+import base64
 import hashlib
 import os
-import base64
 
 user_log_manager = UserLogManager()
 
 
+# 사용자 목록 응답에 필요한 컬럼만 조회함 (비밀번호와 salt는 읽지 않음)
+USER_LIST_COLUMNS = (User.id, User.role, User.created_at, User.is_locked)
+LOCKED_USER_COLUMNS = (User.id, User.role, User.last_failed_login)
+
+
+def _hash_password(sha256_hashed_password: str) -> tuple[str, str]:
+    salt = base64.b64encode(os.urandom(16)).decode("utf-8")
+    salted_hash = f"{salt}{sha256_hashed_password}"
+    final_hashed_password = hashlib.sha256(salted_hash.encode("utf-8")).hexdigest()
+    return salt, final_hashed_password
+
+
 class UserManager(BaseManager):
     _instance = None
 
@@ -47,6 +73,17 @@ class UserManager(BaseManager):
             super().__init__(
                 Base, user_database_uri, docker_user_database_uri, is_docker
             )
+            self.count_cache = CountCache(
+                ttl_seconds=COUNT_CACHE_TTL_SECONDS,
+                max_entries=COUNT_CACHE_MAX_ENTRIES,
+            )
+            self.user_cache = UserCache(
+                max_entries=USER_CACHE_MAX_ENTRIES,
+                ttl_seconds=USER_CACHE_TTL_SECONDS,
+            )
+            self.user_id_fulltext = USER_ID_FULLTEXT_INDEX == "true" and (
+                self.ensure_fulltext_index(User.__tablename__, "id", "ft_user_id")
+            )
             self.create_user(
                 DEFAULT_ROOT_ACCOUNT_ID,
                 hashlib.sha256(
@@ -82,6 +119,8 @@ class UserManager(BaseManager):
             )
             session.add(new_user)
             session.commit()
+            self.count_cache.invalidate()
+            self.user_cache.invalidate(user_id)
             session.refresh(new_user)
             return True
         except Exception as e:
@@ -90,12 +129,115 @@ class UserManager(BaseManager):
         finally:
             session.close()
 
+    @timed_stage("hash")
     def hash_password(self, sha256_hashed_password: str) -> tuple[str, str]:
-        salt = base64.b64encode(os.urandom(16)).decode("utf-8")
-        salted_hash = f"{salt}{sha256_hashed_password}"
-        final_hashed_password = hashlib.sha256(salted_hash.encode("utf-8")).hexdigest()
-        return salt, final_hashed_password
+        return _hash_password(sha256_hashed_password)
+
+    @timed_stage("hash")
+    def hash_passwords(self, passwords: list[str]) -> list[tuple[str, str]]:
+        return [_hash_password(password) for password in passwords]
+
+    def create_users_bulk(self, entries: list[dict], seen_user_ids: set) -> list[dict]:
+        results = {}
+        candidates = []
+        for entry in entries:
+            user_id, role = entry["user_id"], entry["role"] or "user"
+            error = entry["error"]
+            if error is None and not user_id:
+                error = "사용자 ID가 비어 있습니다."
+            elif error is None and not entry["password"]:
+                error = "비밀번호가 비어 있습니다."
+            elif error is None and role not in ["admin", "user"]:
+                error = f"적절하지 않은 권한입니다.: `{role}`"
+
+            if error is not None:
+                results[entry["line"]] = self._bulk_result(entry, "invalid", error)
+            elif user_id.lower() in seen_user_ids:
+                results[entry["line"]] = self._bulk_result(
+                    entry, "duplicate", "요청 안에서 중복된 사용자 ID입니다."
+                )
+            else:
+                # MySQL 기본 collation과 같이 대소문자를 구분하지 않고 중복을 판단함
+                seen_user_ids.add(user_id.lower())
+                candidates.append({**entry, "role": role})
+
+        if not candidates:
+            return [results[entry["line"]] for entry in entries]
 
+        session = self.get_session()
+        try:
+            for attempt in range(2):
+                existing = {
+                    row.id.lower()
+                    for row in session.query(User.id)
+                    .filter(User.id.in_([entry["user_id"] for entry in candidates]))
+                    .all()
+                }
+                for entry in candidates:
+                    if entry["user_id"].lower() in existing:
+                        results[entry["line"]] = self._bulk_result(
+                            entry,
+                            "duplicate",
+                            f"사용자 `{entry['user_id']}`이(가) 이미 존재합니다.",
+                        )
+                candidates = [
+                    entry
+                    for entry in candidates
+                    if entry["user_id"].lower() not in existing
+                ]
+                if not candidates:
+                    break
+
+                hashed = self.hash_passwords(
+                    [entry["password"] for entry in candidates]
+                )
+                now = datetime.now()
+                try:
+                    session.execute(
+                        insert(User),
+                        [
+                            {
+                                "id": entry["user_id"],
+                                "password": hashed_password,
+                                "salt": salt,
+                                "role": entry["role"],
+                                "logins_before_rehash": 0,
+                                "failed_attempts": 0,
+                                "is_locked": False,
+                                "created_at": now,
+                            }
+                            for entry, (salt, hashed_password) in zip(candidates, hashed)
+                        ],
+                    )
+                    session.commit()
+                    break
+                except IntegrityError as e:
+                    # 동시에 같은 ID가 생성된 경우 중복을 다시 확인하고 한 번만 재시도함
+                    session.rollback()
+                    if attempt == 1:
+                        raise e
+
+            for entry in candidates:
+                results[entry["line"]] = self._bulk_result(entry, "created", None)
+            if candidates:
+                self.count_cache.invalidate()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+        return [results[entry["line"]] for entry in entries]
+
+    def _bulk_result(self, entry, status, detail):
+        return {
+            "line": entry["line"],
+            "user_id": entry["user_id"],
+            "status": status,
+            "detail": detail,
+        }
+
+    @timed_stage("hash")
     def verify_password(
         self, sha256_hashed_password: str, stored_password: str, salt: str
     ) -> bool:
@@ -104,6 +246,7 @@ class UserManager(BaseManager):
         return final_hashed_password == stored_password
 
     def handle_failed_attempt(self, user):
+        self.user_cache.invalidate(user.id)
         session = self.get_session()
         try:
             now = datetime.now()
@@ -121,6 +264,7 @@ class UserManager(BaseManager):
                     )
                     user.is_locked = True
                     session.commit()
+                    self._adjust_locked_counts({user.role: 1})
                     raise HTTPException(
                         status_code=HTTP_403_FORBIDDEN,
                         detail="로그인 시도 실패 횟수가 초과되어 계정이 잠겼습니다. 관리자에게 문의해주세요.",
@@ -135,11 +279,103 @@ class UserManager(BaseManager):
         finally:
             session.close()
 
+    def warm_user_cache(self, limit: int = USER_CACHE_WARM_SIZE) -> int:
+        if not self.user_cache.enabled or limit <= 0:
+            return 0
+        session = self.get_session()
+        try:
+            users = (
+                session.query(User)
+                .filter(User.last_login_at.isnot(None))
+                .order_by(User.last_login_at.desc())
+                .limit(limit)
+                .all()
+            )
+            # 오래된 사용자부터 넣어서 최근에 로그인한 사용자가 LRU에서 가장 늦게 밀려나도록 함
+            for user in reversed(users):
+                self.user_cache.set(UserSnapshot.from_user(user))
+            return len(users)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def _update_from_snapshot(self, snapshot: UserSnapshot, values: dict) -> bool:
+        session = self.get_session()
+        try:
+            if snapshot.is_locked:
+                lock_condition = User.is_locked == True
+            else:
+                lock_condition = User.is_locked.isnot(True)
+
+            # 다른 워커에서 비밀번호나 잠금 상태가 바뀌었다면 갱신되는 행이 없음
+            updated = (
+                session.query(User)
+                .filter(
+                    User.id == snapshot.id,
+                    User.password == snapshot.password,
+                    User.salt == snapshot.salt,
+                    lock_condition,
+                )
+                .update(values, synchronize_session=False)
+            )
+            session.commit()
+            if not updated:
+                self.user_cache.invalidate(snapshot.id)
+            return bool(updated)
+        except Exception as e:
+            session.rollback()
+            self.user_cache.invalidate(snapshot.id)
+            raise e
+        finally:
+            session.close()
+
+    def _login_cached(self, user_id: str, password: str):
+        snapshot = self.user_cache.get(user_id)
+        if (
+            snapshot is None
+            or snapshot.is_locked
+            or not self.verify_password(password, snapshot.password, snapshot.salt)
+        ):
+            # 실패나 잠김은 캐시만으로 판단하지 않고 DB에서 다시 확인함
+            return None
+
+        values = {
+            User.failed_attempts: 0,
+            User.logins_before_rehash: User.logins_before_rehash + 1,
+            User.last_login_at: datetime.now(),
+        }
+        refreshed = snapshot._replace(
+            logins_before_rehash=snapshot.logins_before_rehash + 1
+        )
+        if refreshed.logins_before_rehash >= REHASH_COUNT_STANDARD:
+            salt, hashed_password = self.hash_password(password)
+            values.update(
+                {
+                    User.salt: salt,
+                    User.password: hashed_password,
+                    User.logins_before_rehash: 0,
+                }
+            )
+            refreshed = refreshed._replace(
+                salt=salt, password=hashed_password, logins_before_rehash=0
+            )
+
+        if not self._update_from_snapshot(snapshot, values):
+            return None
+        self.user_cache.set(refreshed)
+        return refreshed
+
     def login(
         self,
         user_id: str,
         password: str,
     ):
+        cached_user = self._login_cached(user_id, password)
+        if cached_user is not None:
+            return cached_user
+
         session = self.get_session()
         try:
             user = session.query(User).filter(User.id == user_id).one_or_none()
@@ -166,13 +402,17 @@ class UserManager(BaseManager):
 
             user.failed_attempts = 0
             user.logins_before_rehash += 1
+            user.last_login_at = datetime.now()
 
             if user.logins_before_rehash >= REHASH_COUNT_STANDARD:
                 user.salt, user.password = self.hash_password(password)
                 user.logins_before_rehash = 0
             session.commit()
             session.refresh(user)
-            return user
+            # 캐시 경로와 같은 타입을 반환하도록 세션에 묶이지 않은 스냅샷을 돌려줌
+            snapshot = UserSnapshot.from_user(user)
+            self.user_cache.set(snapshot)
+            return snapshot
         except Exception as e:
             session.rollback()
             raise e
@@ -189,6 +429,50 @@ class UserManager(BaseManager):
         finally:
             session.close()
 
+    def _filter_users(
+        self,
+        query,
+        is_locked=False,
+        user_id=None,
+        role=None,
+        search_mode=DEFAULT_SEARCH_MODE,
+    ):
+        if is_locked:
+            query = query.filter(User.is_locked == is_locked)
+
+        if user_id is not None:
+            query = query.filter(
+                user_id_condition(User.id, user_id, search_mode, self.user_id_fulltext)
+            )
+
+        if role is not None:
+            query = query.filter(User.role == role)
+
+        return query
+
+    def _adjust_locked_counts(self, deltas_by_role: dict):
+        # 잠금 상태 변경은 잠금 필터가 걸린 개수에만 영향을 주므로 다시 세지 않고 증감만 반영함
+        total = sum(deltas_by_role.values())
+
+        def delta_for(filters):
+            if not filters.get("is_locked"):
+                return 0
+            if "user_id" in filters:
+                return None
+            if "role" in filters:
+                return deltas_by_role.get(filters["role"], 0)
+            return total
+
+        self.count_cache.adjust(delta_for)
+
+    def _count_cache_key(self, is_locked, user_id, role, search_mode):
+        return self.count_cache.make_key(
+            is_locked=is_locked or None,
+            user_id=user_id,
+            search_mode=search_mode if user_id is not None else None,
+            role=role,
+        )
+
     def get_paginated_users(
         self,
         page: int = 1,
@@ -196,25 +480,70 @@ class UserManager(BaseManager):
         is_locked: bool = False,
         user_id: str = None,
         role: str = None,
+        with_total: bool = True,
+        search_mode: str = DEFAULT_SEARCH_MODE,
+        after: str = None,
     ):
         session = self.get_session()
         try:
-            query = session.query(User).order_by(User.id.asc())
+            query = self._filter_users(
+                session.query(*USER_LIST_COLUMNS),
+                is_locked,
+                user_id,
+                role,
+                search_mode,
+            )
 
-            if is_locked:
-                query = query.filter(User.is_locked == is_locked)
+            total = None
+            if with_total:
+                total = self.count_cache.get_or_compute(
+                    self._count_cache_key(is_locked, user_id, role, search_mode),
+                    query.count,
+                )
+
+            if after is not None:
+                # 커서(마지막으로 받은 id) 이후부터 읽으므로 페이지가 깊어져도 건너뛰는 행이 없음
+                query = query.filter(User.id > after).order_by(User.id.asc())
+            else:
+                offset = (page - 1) * per_page
+                query = query.order_by(User.id.asc()).offset(offset)
+            users = query.limit(per_page).all()
 
-            if user_id is not None:
-                query = query.filter(User.id.like(f"%{user_id}%"))
+            return users, total
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def count_users(
+        self,
+        is_locked: bool = False,
+        user_id: str = None,
+        role: str = None,
+        estimate: bool = False,
+        search_mode: str = DEFAULT_SEARCH_MODE,
+    ) -> tuple[int, bool]:
+        key = self._count_cache_key(is_locked, user_id, role, search_mode)
+        cached = self.count_cache.get(key)
+        if cached is not None:
+            return cached, False
 
-            if role is not None:
-                query = query.filter(User.role == role)
+        session = self.get_session()
+        try:
+            query = self._filter_users(
+                session.query(User), is_locked, user_id, role, search_mode
+            )
 
-            total = query.count()
-            offset = (page - 1) * per_page
-            users = query.offset(offset).limit(per_page).all()
+            if estimate:
+                if key:
+                    estimated = self.estimate_query_rows(session, query)
+                else:
+                    estimated = self.estimate_table_rows(session, User.__tablename__)
+                if estimated is not None and estimated >= COUNT_ESTIMATE_THRESHOLD:
+                    return estimated, True
 
-            return users, total
+            return self.count_cache.get_or_compute(key, query.count), False
         except Exception as e:
             session.rollback()
             raise e
@@ -224,6 +553,19 @@ class UserManager(BaseManager):
     def delete_user(self, user_id: str) -> bool:
         session = self.get_session()
         try:
+            snapshot = self.user_cache.get(user_id)
+            if snapshot is not None:
+                deleted = (
+                    session.query(User)
+                    .filter(User.id == snapshot.id)
+                    .delete(synchronize_session=False)
+                )
+                session.commit()
+                self.user_cache.invalidate(user_id)
+                if deleted:
+                    self.count_cache.invalidate()
+                    return
+
             user = session.query(User).filter(User.id == user_id).one_or_none()
             if not user:
                 raise HTTPException(
@@ -233,16 +575,21 @@ class UserManager(BaseManager):
 
             session.delete(user)
             session.commit()
+            self.user_cache.invalidate(user_id)
+            self.count_cache.invalidate()
         except Exception as e:
             session.rollback()
             raise e
         finally:
             session.close()
 
-    def get_all_lock_users(self):
+    def get_locked_users(self, per_page: int = 25, after: str = None):
         session = self.get_session()
         try:
-            return session.query(User).filter(User.is_locked == True).all()
+            query = session.query(*LOCKED_USER_COLUMNS).filter(User.is_locked == True)
+            if after is not None:
+                query = query.filter(User.id > after)
+            return query.order_by(User.id.asc()).limit(per_page).all()
         except Exception as e:
             session.rollback()
             raise e
@@ -250,6 +597,18 @@ class UserManager(BaseManager):
             session.close()
 
     def unlock_account(self, user_id: str) -> bool:
+        snapshot = self.user_cache.get(user_id)
+        if (
+            snapshot is not None
+            and snapshot.is_locked
+            and self._update_from_snapshot(
+                snapshot, {User.is_locked: False, User.failed_attempts: 0}
+            )
+        ):
+            self.user_cache.set(snapshot._replace(is_locked=False))
+            self._adjust_locked_counts({snapshot.role: -1})
+            return
+
         session = self.get_session()
         try:
             user = session.query(User).filter(User.id == user_id).one_or_none()
@@ -268,6 +627,8 @@ class UserManager(BaseManager):
             user.is_locked = False
             user.failed_attempts = 0
             session.commit()
+            self.user_cache.invalidate(user_id)
+            self._adjust_locked_counts({user.role: -1})
         except Exception as e:
             session.rollback()
             raise e
@@ -275,6 +636,18 @@ class UserManager(BaseManager):
             session.close()
 
     def lock_account(self, user_id: str) -> bool:
+        snapshot = self.user_cache.get(user_id)
+        if (
+            snapshot is not None
+            and not snapshot.is_locked
+            and self._update_from_snapshot(
+                snapshot, {User.is_locked: True, User.failed_attempts: 0}
+            )
+        ):
+            self.user_cache.set(snapshot._replace(is_locked=True))
+            self._adjust_locked_counts({snapshot.role: 1})
+            return
+
         session = self.get_session()
         try:
             user = session.query(User).filter(User.id == user_id).one_or_none()
@@ -293,6 +666,123 @@ class UserManager(BaseManager):
             user.is_locked = True
             user.failed_attempts = 0
             session.commit()
+            self.user_cache.invalidate(user_id)
+            self._adjust_locked_counts({user.role: 1})
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def _filter_bulk_targets(
+        self, query, user_ids=None, role=None, inactive_days=None, exclude_user_id=None
+    ):
+        if user_ids is None and role is None and inactive_days is None:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail="대상 사용자 ID 목록이나 필터(권한, 미접속 기간)를 지정해야 합니다.",
+            )
+
+        # 기본 관리자 계정은 일괄 작업 대상에서 항상 제외함
+        query = query.filter(User.id != DEFAULT_ROOT_ACCOUNT_ID)
+
+        # 요청한 관리자가 자기 계정을 잠그거나 삭제하지 않도록 제외함
+        if exclude_user_id is not None:
+            query = query.filter(User.id != exclude_user_id)
+
+        if user_ids is not None:
+            query = query.filter(User.id.in_(user_ids))
+
+        if role is not None:
+            query = query.filter(User.role == role)
+
+        if inactive_days is not None:
+            cutoff = datetime.now() - timedelta(days=inactive_days)
+            query = query.filter(
+                or_(
+                    User.last_login_at < cutoff,
+                    and_(User.last_login_at.is_(None), User.created_at < cutoff),
+                )
+            )
+
+        return query
+
+    def _set_accounts_locked(
+        self,
+        is_locked: bool,
+        user_ids=None,
+        role=None,
+        inactive_days=None,
+        exclude_user_id=None,
+    ) -> list[str]:
+        session = self.get_session()
+        try:
+            query = self._filter_bulk_targets(
+                session.query(User.id, User.role),
+                user_ids,
+                role,
+                inactive_days,
+                exclude_user_id,
+            )
+            if is_locked:
+                query = query.filter(User.is_locked.isnot(True))
+            else:
+                query = query.filter(User.is_locked == True)
+            targets = query.all()
+            target_ids = [row.id for row in targets]
+            deltas_by_role = {}
+            for row in targets:
+                deltas_by_role[row.role] = deltas_by_role.get(row.role, 0) + (
+                    1 if is_locked else -1
+                )
+
+            for start in range(0, len(target_ids), USER_BULK_BATCH_SIZE):
+                session.query(User).filter(
+                    User.id.in_(target_ids[start : start + USER_BULK_BATCH_SIZE])
+                ).update(
+                    {User.is_locked: is_locked, User.failed_attempts: 0},
+                    synchronize_session=False,
+                )
+            session.commit()
+            if target_ids:
+                self.user_cache.invalidate(target_ids)
+                self._adjust_locked_counts(deltas_by_role)
+            return target_ids
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def lock_accounts(
+        self, user_ids=None, role=None, inactive_days=None, exclude_user_id=None
+    ) -> list[str]:
+        return self._set_accounts_locked(
+            True, user_ids, role, inactive_days, exclude_user_id
+        )
+
+    def unlock_accounts(self, user_ids=None, role=None, inactive_days=None) -> list[str]:
+        return self._set_accounts_locked(False, user_ids, role, inactive_days)
+
+    def delete_users(
+        self, user_ids=None, role=None, inactive_days=None, exclude_user_id=None
+    ) -> list[str]:
+        session = self.get_session()
+        try:
+            query = self._filter_bulk_targets(
+                session.query(User.id), user_ids, role, inactive_days, exclude_user_id
+            )
+            target_ids = [row.id for row in query.all()]
+
+            for start in range(0, len(target_ids), USER_BULK_BATCH_SIZE):
+                session.query(User).filter(
+                    User.id.in_(target_ids[start : start + USER_BULK_BATCH_SIZE])
+                ).delete(synchronize_session=False)
+            session.commit()
+            if target_ids:
+                self.user_cache.invalidate(target_ids)
+                self.count_cache.invalidate()
+            return target_ids
         except Exception as e:
             session.rollback()
             raise e
@@ -302,6 +792,30 @@ class UserManager(BaseManager):
     def change_password(
         self, user_id: str, old_password: str, new_password: str
     ) -> bool:
+        snapshot = self.user_cache.get(user_id)
+        if (
+            snapshot is not None
+            and old_password != new_password
+            and self.verify_password(old_password, snapshot.password, snapshot.salt)
+        ):
+            salt, final_hashed_password = self.hash_password(new_password)
+            if self._update_from_snapshot(
+                snapshot,
+                {
+                    User.password: final_hashed_password,
+                    User.salt: salt,
+                    User.logins_before_rehash: 0,
+                },
+            ):
+                self.user_cache.set(
+                    snapshot._replace(
+                        password=final_hashed_password,
+                        salt=salt,
+                        logins_before_rehash=0,
+                    )
+                )
+                return
+
         session = self.get_session()
         try:
             user = session.query(User).filter(User.id == user_id).one_or_none()
@@ -328,6 +842,7 @@ class UserManager(BaseManager):
             user.salt = salt
             user.logins_before_rehash = 0
             session.commit()
+            self.user_cache.invalidate(user_id)
         except Exception as e:
             session.rollback()
             raise e
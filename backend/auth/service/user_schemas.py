@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import Literal, Optional
 
 class BaseRequest(BaseModel):
     user_id: str
@@ -17,6 +18,13 @@ class UserCreateRequest(LoginRequest):
     role: str
 
 
+class BulkUserTargetRequest(BaseModel):
+    request_user: str
+    user_ids: Optional[list[str]] = None
+    role: Optional[Literal["admin", "user"]] = None
+    inactive_days: Optional[int] = Field(None, ge=1)
+
+
 class ChangePasswordRequest(BaseRequest):
     request_user: str
     old_password: str
@@ -34,4 +42,4 @@ class UserInfoResponse(BaseResponse):
 
 
 class LockUserResponse(BaseResponse):
-    last_failed_login: datetime
+    last_failed_login: Optional[datetime] = None
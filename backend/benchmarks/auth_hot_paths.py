@@ -0,0 +1,283 @@
+"""로그인, 세션 확인, 사용자 목록, 감사 로그 조회 API의 처리량과 꼬리 지연 시간 벤치마크.
+
+앱을 같은 프로세스에서 실행하고 ASGI로 직접 요청하므로 서버를 띄우지 않아도 됩니다.
+데이터베이스를 지정하지 않으면 임시 디렉터리의 SQLite 파일을 사용하며, 지정할 때는
+운영 데이터베이스가 아닌 별도의 데이터베이스를 사용해야 합니다. 사용자 수마다 기존 행을 지우고
+``dataset_generator``로 데이터를 다시 만듭니다.
+
+    python -m backend.benchmarks.auth_hot_paths \
+        --sizes 1000,10000 --concurrency 1,8,32 --output bench.json
+
+같은 장비에서 ``--save-baseline``으로 기준 결과를 저장해 두고 ``--baseline``으로 비교하면,
+p95 지연 시간이나 처리량이 ``--threshold`` 비율 이상 나빠진 항목이 있을 때 종료 코드 1로 끝납니다.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import httpx
+
+BENCH_ADMIN_ID = "bench_admin"
+BENCH_ADMIN_PASSWORD = "bench_admin_password"
+PER_PAGE = 25
+
+
+def configure_environment(args, workdir: str):
+    # backend.config는 import할 때 환경 변수를 읽으므로 앱을 import하기 전에 설정해야 함
+    os.environ["MYSQL_DATABASE_URI"] = args.database_uri or f"sqlite:///{workdir}/bench.db"
+    os.environ["SESSION_DATABASE_URI"] = (
+        args.session_database_uri or f"sqlite:///{workdir}/bench_session.db"
+    )
+    os.environ["IS_DOCKER"] = "false"
+    os.environ["DEFAULT_ROOT_ACCOUNT_ID"] = BENCH_ADMIN_ID
+    os.environ["DEFAULT_ROOT_ACCOUNT_PASSWORD"] = BENCH_ADMIN_PASSWORD
+    # 세션 연장 경로를 타지 않도록 만료 시간을 넉넉하게 잡음
+    os.environ["SESSION_EXPIRE_MINUTE"] = "600"
+    for name, path in (
+        ("AUDIT_SPOOL_DIR", "spool"),
+        ("METRICS_DIR", "metrics"),
+        ("REQUEST_PROFILE_DIR", "profiles"),
+        ("OPERATION_LOG_ARCHIVE_DIR", "archive"),
+        ("MAINTENANCE_LOCK_FILE", "maintenance.lock"),
+    ):
+        os.environ[name] = os.path.join(workdir, path)
+
+
+class RotatingClientTransport(httpx.ASGITransport):
+    """요청마다 다른 클라이언트 주소를 사용해서 IP별 요청 제한에 걸리지 않게 하는 트랜스포트."""
+
+    def __init__(self, app):
+        super().__init__(app=app)
+        self._addresses = itertools.count(1)
+
+    async def handle_async_request(self, request):
+        # ASGI scope는 첫 await 전에 만들어지므로 동시에 보낸 요청끼리 주소가 섞이지 않음
+        index = next(self._addresses) % (1 << 24)
+        self.client = (f"10.{index >> 16}.{(index >> 8) & 255}.{index & 255}", 50000)
+        return await super().handle_async_request(request)
+
+
+def dataset_options(args, users: int):
+    from backend.benchmarks.dataset_generator import add_dataset_arguments
+
+    parser = argparse.ArgumentParser()
+    add_dataset_arguments(
+        parser,
+        users=users,
+        sessions=users * args.sessions_per_user,
+        logs=users * args.logs_per_user,
+    )
+    return parser.parse_args(["--seed", str(args.seed), "--truncate"])
+
+
+def scenarios() -> dict:
+    password = hashlib.sha256(BENCH_ADMIN_PASSWORD.encode("utf-8")).hexdigest()
+    return {
+        "login": (
+            "POST",
+            "/api/login",
+            {"json": {"user_id": BENCH_ADMIN_ID, "password": password}},
+        ),
+        "session": ("GET", "/api/session", {}),
+        "session_role": ("GET", "/api/session/role", {}),
+        "user_list": ("GET", "/api/user/", {"params": {"per_page": PER_PAGE}}),
+        "user_log": ("GET", "/api/log/user", {"params": {"per_page": PER_PAGE}}),
+    }
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+    }
+
+
+async def run_load(app, request, cookies: dict, concurrency: int, requests: int, warmup: int):
+    method, url, kwargs = request
+    async with httpx.AsyncClient(
+        transport=RotatingClientTransport(app), base_url="http://bench", cookies=cookies
+    ) as client:
+        for _ in range(warmup):
+            await client.request(method, url, **kwargs)
+
+        latencies = []
+        errors = 0
+        remaining = iter(range(requests))
+
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.request(method, url, **kwargs)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def admin_cookies(app) -> dict:
+    method, url, kwargs = scenarios()["login"]
+    async with httpx.AsyncClient(
+        transport=RotatingClientTransport(app), base_url="http://bench"
+    ) as client:
+        response = await client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return {"session_id": response.cookies["session_id"]}
+
+
+def result_key(result: dict) -> tuple:
+    return result["scenario"], result["users"], result["concurrency"]
+
+
+def compare(results: list[dict], baseline: dict, threshold: float, min_delta_ms: float):
+    previous = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        name = "{} users={} concurrency={}".format(*result_key(result))
+        if result["errors"]:
+            regressions.append(f"{name}: {result['errors']} requests failed")
+        base = previous.get(result_key(result))
+        if base is None:
+            continue
+        # 매우 짧은 요청은 측정 잡음만으로 비율이 크게 흔들리므로 절대 차이도 함께 봄
+        if (
+            result["p95_ms"] > base["p95_ms"] * (1 + threshold)
+            and result["p95_ms"] - base["p95_ms"] > min_delta_ms
+        ):
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {result['p95_ms']}ms")
+        if result["throughput_rps"] < base["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {base['throughput_rps']} -> {result['throughput_rps']} req/s"
+            )
+    return regressions
+
+
+def parse_int_list(value: str) -> list[int]:
+    return sorted({int(item) for item in value.split(",") if item.strip()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="auth hot path throughput and tail latency benchmark")
+    parser.add_argument("--database-uri", help="user/user_log database (default: temporary SQLite)")
+    parser.add_argument("--session-database-uri", help="session database (default: temporary SQLite)")
+    parser.add_argument("--sizes", type=parse_int_list, default=[1000, 10000], help="user counts")
+    parser.add_argument("--logs-per-user", type=int, default=10)
+    parser.add_argument("--sessions-per-user", type=int, default=1)
+    parser.add_argument("--concurrency", type=parse_int_list, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=300, help="requests per measurement")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--scenarios", default=",".join(scenarios()))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to --baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    if args.requests < 2:
+        parser.error("--requests must be at least 2")
+
+    workdir = tempfile.mkdtemp(prefix="auth_bench_")
+    configure_environment(args, workdir)
+
+    from backend.benchmarks.dataset_generator import seed_dataset
+    from backend.main import app, session_manager, user_log_manager, user_manager
+
+    requests = scenarios()
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(selected) - set(requests)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = []
+    for users in args.sizes:
+        seed_dataset(user_manager, session_manager, dataset_options(args, users))
+        # 기존 행을 지우면서 관리자 계정도 지워지므로 다시 만듦
+        user_manager.create_user(
+            BENCH_ADMIN_ID, hashlib.sha256(BENCH_ADMIN_PASSWORD.encode("utf-8")).hexdigest(), "admin"
+        )
+        user_manager.user_cache.invalidate()
+        user_manager.count_cache.invalidate()
+        user_log_manager.count_cache.invalidate()
+        cookies = asyncio.run(admin_cookies(app))
+
+        for name in selected:
+            for concurrency in args.concurrency:
+                result = asyncio.run(
+                    run_load(
+                        app,
+                        requests[name],
+                        {} if name == "login" else cookies,
+                        concurrency,
+                        args.requests,
+                        args.warmup,
+                    )
+                )
+                result = {"scenario": name, "users": users, "concurrency": concurrency, **result}
+                results.append(result)
+                print(
+                    f"{name:<13} users {users:>8} c {concurrency:>3}  "
+                    f"{result['throughput_rps']:>8.1f} req/s  p50 {result['p50_ms']:>8.2f}ms  "
+                    f"p95 {result['p95_ms']:>8.2f}ms  p99 {result['p99_ms']:>8.2f}ms  "
+                    f"errors {result['errors']}"
+                )
+
+    report = {
+        "environment": {
+            "database": user_manager.engine.dialect.name,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "settings": {
+            "logs_per_user": args.logs_per_user,
+            "sessions_per_user": args.sessions_per_user,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "per_page": PER_PAGE,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report))
+
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"no regressions against {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,19 @@ load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
 
 SESSION_EXPIRE_MINUTE = int(os.getenv("SESSION_EXPIRE_MINUTE", 30))
 
+# 감사 로그(아카이브, 스풀)가 소스 트리나 이미지 레이어에 쌓이지 않도록 별도의 데이터 경로를 사용함
+DATA_DIR = os.path.expanduser(os.getenv("DATA_DIR", "~/.local/share/session-login"))
+
 DOCKER_MYSQL_DATABASE_URI = os.getenv("DOCKER_MYSQL_DATABASE_URI")
 MYSQL_DATABASE_URI = os.getenv("MYSQL_DATABASE_URI")
 DOCKER_SESSION_DATABASE_URI = os.getenv("DOCKER_SESSION_DATABASE_URI")
 SESSION_DATABASE_URI = os.getenv("SESSION_DATABASE_URI")
 
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", 65536))
+
 DEFAULT_ROOT_ACCOUNT_ID = os.getenv("DEFAULT_ROOT_ACCOUNT_ID")
 DEFAULT_ROOT_ACCOUNT_PASSWORD = os.getenv("DEFAULT_ROOT_ACCOUNT_PASSWORD")
 
@@ -17,7 +25,76 @@ MAX_FAILURES = int(os.getenv("MAX_FAILURES", 5))
 FAILURE_TRACKING_WINDOW_MINUTES = int(os.getenv("FAILURE_TRACKING_WINDOW_MINUTES", 5))
 REHASH_COUNT_STANDARD = int(os.getenv("REHASH_COUNT_STANDARD", 10))
 
+USER_BULK_BATCH_SIZE = int(os.getenv("USER_BULK_BATCH_SIZE", 1000))
+
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 10000))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 300))
+USER_CACHE_WARM_SIZE = int(os.getenv("USER_CACHE_WARM_SIZE", 1000))
+
 OPERATION_LOG_RETENTION_PERIOD = int(os.getenv("OPERATION_LOG_RETENTION_PERIOD", 60))
+OPERATION_LOG_PURGE_BATCH_SIZE = int(os.getenv("OPERATION_LOG_PURGE_BATCH_SIZE", 5000))
+LOG_EXPORT_BATCH_SIZE = int(os.getenv("LOG_EXPORT_BATCH_SIZE", 1000))
+LOG_BURST_WINDOW_SECONDS = int(os.getenv("LOG_BURST_WINDOW_SECONDS", 60))
+LOG_BURST_FLUSH_SECONDS = int(os.getenv("LOG_BURST_FLUSH_SECONDS", 5))
+LOG_BURST_MAX_KEYS = int(os.getenv("LOG_BURST_MAX_KEYS", 10000))
+LOG_STREAM_QUEUE_SIZE = int(os.getenv("LOG_STREAM_QUEUE_SIZE", 100))
+LOG_STREAM_HEARTBEAT_SECONDS = int(os.getenv("LOG_STREAM_HEARTBEAT_SECONDS", 15))
+OPERATION_LOG_ARCHIVE_ENABLED = os.getenv("OPERATION_LOG_ARCHIVE_ENABLED", "true")
+OPERATION_LOG_ARCHIVE_DIR = os.getenv(
+    "OPERATION_LOG_ARCHIVE_DIR", os.path.join(DATA_DIR, "archive", "user_log")
+)
+OPERATION_LOG_ARCHIVE_RETENTION_PERIOD = int(os.getenv("OPERATION_LOG_ARCHIVE_RETENTION_PERIOD", 365))
+OPERATION_LOG_ARCHIVE_BLOCK_ROWS = int(os.getenv("OPERATION_LOG_ARCHIVE_BLOCK_ROWS", 1000))
+
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", 5))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", 1024))
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", 100000))
+
+USER_ID_FULLTEXT_INDEX = os.getenv("USER_ID_FULLTEXT_INDEX", "false")
+
+AUDIT_SPOOL_ENABLED = os.getenv("AUDIT_SPOOL_ENABLED", "true")
+AUDIT_SPOOL_DIR = os.getenv("AUDIT_SPOOL_DIR", os.path.join(DATA_DIR, "spool", "audit"))
+AUDIT_SPOOL_FSYNC_BATCH_SIZE = int(os.getenv("AUDIT_SPOOL_FSYNC_BATCH_SIZE", 32))
+AUDIT_SPOOL_FSYNC_INTERVAL_MS = int(os.getenv("AUDIT_SPOOL_FSYNC_INTERVAL_MS", 50))
+AUDIT_SPOOL_SEGMENT_MAX_BYTES = int(os.getenv("AUDIT_SPOOL_SEGMENT_MAX_BYTES", 8 * 1024 * 1024))
+AUDIT_SPOOL_REPLAY_SECONDS = int(os.getenv("AUDIT_SPOOL_REPLAY_SECONDS", 30))
+AUDIT_DB_TIMEOUT_SECONDS = int(os.getenv("AUDIT_DB_TIMEOUT_SECONDS", 2))
+AUDIT_DB_RETRY_SECONDS = int(os.getenv("AUDIT_DB_RETRY_SECONDS", 10))
+
+MAINTENANCE_LEADER_LOCK = os.getenv("MAINTENANCE_LEADER_LOCK", "auto")
+MAINTENANCE_LOCK_NAME = os.getenv("MAINTENANCE_LOCK_NAME", "maintenance_leader")
+MAINTENANCE_LOCK_FILE = os.getenv(
+    "MAINTENANCE_LOCK_FILE", os.path.join(os.path.dirname(__file__), "run", "maintenance.lock")
+)
+MAINTENANCE_JITTER_RATIO = float(os.getenv("MAINTENANCE_JITTER_RATIO", 0.1))
+MAINTENANCE_HISTORY_SIZE = int(os.getenv("MAINTENANCE_HISTORY_SIZE", 200))
+SESSION_CLEANUP_SECONDS = int(os.getenv("SESSION_CLEANUP_SECONDS", 300))
+SESSION_CLEANUP_BATCH_SIZE = int(os.getenv("SESSION_CLEANUP_BATCH_SIZE", 5000))
+OPERATION_LOG_PURGE_SECONDS = int(os.getenv("OPERATION_LOG_PURGE_SECONDS", 86400))
+OPERATION_LOG_PURGE_MIN_SECONDS = int(os.getenv("OPERATION_LOG_PURGE_MIN_SECONDS", 60))
+OPERATION_LOG_PURGE_MAX_BATCHES = int(os.getenv("OPERATION_LOG_PURGE_MAX_BATCHES", 20))
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true")
+METRICS_DIR = os.getenv("METRICS_DIR", os.path.join(os.path.dirname(__file__), "run", "metrics"))
+METRICS_SNAPSHOT_SECONDS = int(os.getenv("METRICS_SNAPSHOT_SECONDS", 5))
+METRICS_STALE_SECONDS = int(os.getenv("METRICS_STALE_SECONDS", 60))
+METRICS_BEARER_TOKEN = os.getenv("METRICS_BEARER_TOKEN", "")
+
+QUERY_PROFILING_ENABLED = os.getenv("QUERY_PROFILING_ENABLED", "true")
+SLOW_QUERY_THRESHOLD_MS = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+QUERY_PROFILE_MAX_STATEMENTS = int(os.getenv("QUERY_PROFILE_MAX_STATEMENTS", 200))
+SERVICE_METRICS_ENABLED = os.getenv("SERVICE_METRICS_ENABLED", "false")
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false")
+# 이벤트 루프 스레드는 모든 요청이 함께 쓰므로 async 엔드포인트는 프로파일링하지 않음 (X-Profile: unsupported)
+REQUEST_PROFILING_ENABLED = os.getenv("REQUEST_PROFILING_ENABLED", "true")
+REQUEST_PROFILE_DIR = os.getenv(
+    "REQUEST_PROFILE_DIR", os.path.join(os.path.dirname(__file__), "run", "profiles")
+)
+REQUEST_PROFILE_MAX_PER_WINDOW = int(os.getenv("REQUEST_PROFILE_MAX_PER_WINDOW", 5))
+REQUEST_PROFILE_WINDOW_SECONDS = int(os.getenv("REQUEST_PROFILE_WINDOW_SECONDS", 600))
+REQUEST_PROFILE_INTERVAL_MS = float(os.getenv("REQUEST_PROFILE_INTERVAL_MS", 5))
+REQUEST_PROFILE_MAX_SECONDS = int(os.getenv("REQUEST_PROFILE_MAX_SECONDS", 30))
+REQUEST_PROFILE_MAX_FILES = int(os.getenv("REQUEST_PROFILE_MAX_FILES", 100))
 
 IS_DOCKER = os.getenv("IS_DOCKER", "false")
 
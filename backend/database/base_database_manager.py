@@ -1,26 +1,123 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.orm import declarative_base  
+from backend.config import (
+    METRICS_ENABLED,
+    QUERY_PROFILING_ENABLED,
+    SERVICE_METRICS_ENABLED,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_KB,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_SYNCHRONOUS,
+)
+from backend.monitoring.service.metrics import (
+    TimedQueuePool,
+    instrument_engine,
+    instrument_method,
+    query_profiler,
+)
+from contextlib import contextmanager
+from inspect import iscoroutinefunction, isfunction, isgeneratorfunction
+from threading import Lock
+import os
 Base = declarative_base()
 
+# 메모리 DB는 연결마다 따로 만들어지므로 같은 URI를 쓰는 매니저끼리 엔진을 공유함
+_sqlite_memory_engines = {}
+_sqlite_memory_engines_lock = Lock()
+
+SCHEMA_LOCK_TIMEOUT_SECONDS = 60
+# MySQL: 테이블(1050), 컬럼(1060), 인덱스(1061)가 이미 있음
+_ALREADY_EXISTS_ERROR_CODES = (1050, 1060, 1061)
+
+
+def is_sqlite_memory(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def is_already_exists_error(error: DBAPIError) -> bool:
+    args = getattr(error.orig, "args", ())
+    if args and args[0] in _ALREADY_EXISTS_ERROR_CODES:
+        return True
+    message = str(error.orig).lower()
+    return "already exists" in message or "duplicate column name" in message
+
 
 class BaseManager:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 비활성화된 경우 메서드를 감싸지 않으므로 호출 비용이 전혀 늘지 않음
+        if SERVICE_METRICS_ENABLED != "true":
+            return
+        for name, attribute in list(vars(cls).items()):
+            if (
+                name.startswith("_")
+                or not isfunction(attribute)
+                or isgeneratorfunction(attribute)
+                or iscoroutinefunction(attribute)
+            ):
+                continue
+            setattr(cls, name, instrument_method(f"{cls.__name__}.{name}", attribute))
+
     def __init__(self, base, database_uri, docker_database_uri, is_docker):
         self.database_uri = docker_database_uri if is_docker == "true" else database_uri
-        base_url, db_name = self.extract_db_url_and_name(self.database_uri)
-        base_engine = create_engine(base_url)
-        self.create_database_if_not_exists(base_engine, db_name)
+        url = make_url(self.database_uri)
+        created = True
+        if url.get_backend_name() == "sqlite":
+            self.engine, created = self.create_sqlite_engine(url)
+        else:
+            base_url, db_name = self.extract_db_url_and_name(self.database_uri)
+            base_engine = create_engine(base_url)
+            self.create_database_if_not_exists(base_engine, db_name)
 
-        self.engine = create_engine(
-            self.database_uri,
-            pool_size=10,
-            pool_recycle=1800,
-            pool_pre_ping=True,
-        )
+            self.engine = create_engine(
+                self.database_uri,
+                pool_size=10,
+                pool_recycle=1800,
+                pool_pre_ping=True,
+                poolclass=TimedQueuePool,
+            )
+        # 공유 엔진은 처음 만든 매니저만 계측해야 SQL 문이 중복으로 기록되지 않음
+        if created and METRICS_ENABLED == "true":
+            instrument_engine(self.engine, type(self).__name__)
+        if created and QUERY_PROFILING_ENABLED == "true":
+            query_profiler.instrument(self.engine, type(self).__name__)
         self.SessionLocal = scoped_session(
             sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         )
-        base.metadata.create_all(bind=self.engine)
+        self.create_schema(base)
+
+    def create_sqlite_engine(self, url):
+        connect_args = {
+            # 요청은 스레드풀에서 처리되므로 연결을 만든 스레드가 아닌 곳에서도 사용함
+            "check_same_thread": False,
+            "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+        }
+        if is_sqlite_memory(url):
+            # 모든 스레드가 하나의 연결을 같이 쓰므로 동시 요청이 많은 부하 테스트에는 파일 DB를 사용해야 함
+            with _sqlite_memory_engines_lock:
+                engine = _sqlite_memory_engines.get(str(url))
+                if engine is not None:
+                    return engine, False
+                engine = create_engine(url, poolclass=StaticPool, connect_args=connect_args)
+                event.listen(engine, "connect", set_sqlite_pragmas)
+                _sqlite_memory_engines[str(url)] = engine
+                return engine, True
+
+        if url.database and not url.database.startswith("file:"):
+            os.makedirs(os.path.dirname(os.path.abspath(url.database)), exist_ok=True)
+        engine = create_engine(
+            url,
+            pool_size=10,
+            poolclass=TimedQueuePool,
+            connect_args=connect_args,
+        )
+        event.listen(engine, "connect", set_sqlite_pragmas)
+        return engine, True
 
     def extract_db_url_and_name(self, database_url):
         base_url = database_url.rsplit("/", 1)[0]
@@ -31,11 +128,136 @@ class BaseManager:
         with engine.connect() as connection:
             connection.execute(text(f"CREATE DATABASE IF NOT EXISTS {db_name}"))
 
+    def create_schema(self, base):
+        # 여러 워커가 동시에 시작하므로 DDL은 잠금을 잡은 워커가 하나씩 실행하고,
+        # 잠금이 없는 DB에서 다른 워커가 먼저 만든 테이블, 컬럼, 인덱스는 건너뜀
+        with self.schema_lock():
+            for table in base.metadata.sorted_tables:
+                self.execute_ddl(lambda: table.create(bind=self.engine, checkfirst=True))
+            self.create_missing_columns(base)
+            self.create_missing_indexes(base)
+
+    @contextmanager
+    def schema_lock(self):
+        if self.engine.dialect.name != "mysql":
+            yield
+            return
+        # GET_LOCK은 서버 전체에서 공유되므로 데이터베이스 이름을 잠금 이름에 넣음
+        lock_name = f"schema:{self.engine.url.database}"[:64]
+        with self.engine.connect() as connection:
+            acquired = connection.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": lock_name, "timeout": SCHEMA_LOCK_TIMEOUT_SECONDS},
+            ).scalar()
+            if acquired != 1:
+                raise RuntimeError(f"스키마 잠금 `{lock_name}`을 얻지 못했습니다.")
+            try:
+                yield
+            finally:
+                connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+
+    def execute_ddl(self, create):
+        try:
+            create()
+        except DBAPIError as e:
+            if not is_already_exists_error(e):
+                raise
+
+    def create_missing_columns(self, base):
+        # create_all은 기존 테이블에 새로 추가된 컬럼을 만들지 않음
+        inspector = inspect(self.engine)
+        preparer = self.engine.dialect.identifier_preparer
+        for table in base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_ddl = CreateColumn(column).compile(dialect=self.engine.dialect)
+                statement = text(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {column_ddl}"
+                )
+                self.execute_ddl(lambda: self._execute_in_transaction(statement))
+
+    def create_missing_indexes(self, base):
+        # create_all은 기존 테이블에 새로 추가된 인덱스를 만들지 않음
+        for table in base.metadata.sorted_tables:
+            for index in table.indexes:
+                self.execute_ddl(lambda: index.create(bind=self.engine, checkfirst=True))
+
+    def _execute_in_transaction(self, statement):
+        with self.engine.begin() as connection:
+            connection.execute(statement)
+
+    def ensure_fulltext_index(self, table_name, column_name, index_name) -> bool:
+        if self.engine.dialect.name != "mysql":
+            return False
+        with self.schema_lock(), self.engine.begin() as connection:
+            exists = connection.execute(
+                text(
+                    "SELECT COUNT(*) FROM information_schema.STATISTICS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+                    "AND INDEX_NAME = :index_name"
+                ),
+                {"table_name": table_name, "index_name": index_name},
+            ).scalar()
+            if not exists:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE `{table_name}` ADD FULLTEXT INDEX `{index_name}` "
+                        f"(`{column_name}`) WITH PARSER ngram"
+                    )
+                )
+        return True
+
     def get_session(self):
         return self.SessionLocal()
 
+    def estimate_table_rows(self, session, table_name):
+        if session.get_bind().dialect.name != "mysql":
+            return None
+        return session.execute(
+            text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+            ),
+            {"table_name": table_name},
+        ).scalar()
+
+    def estimate_query_rows(self, session, query):
+        dialect = session.get_bind().dialect
+        if dialect.name != "mysql":
+            return None
+        # 검색어를 SQL에 직접 넣으면 `:word`가 바인딩 변수로 해석되므로 값은 따로 넘김
+        statement = query.statement.compile(
+            dialect=dialect, compile_kwargs={"render_postcompile": True}
+        )
+        plan = (
+            session.connection()
+            .exec_driver_sql(f"EXPLAIN {statement}", statement.params)
+            .mappings()
+            .first()
+        )
+        if not plan or plan.get("rows") is None:
+            return None
+        return int(plan["rows"] * float(plan.get("filtered") or 100) / 100)
+
     def __del__(self):
         if hasattr(self, "SessionLocal"):
             self.SessionLocal.remove()
-        if hasattr(self, "engine"):
-            self.engine.dispose()
\ No newline at end of file
+        # 공유하는 메모리 DB는 연결을 닫으면 데이터가 사라지므로 프로세스가 끝날 때까지 유지함
+        if hasattr(self, "engine") and not (
+            self.engine.dialect.name == "sqlite" and is_sqlite_memory(self.engine.url)
+        ):
+            self.engine.dispose()
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        # WAL은 쓰는 동안에도 다른 연결이 읽을 수 있게 하며, 메모리 DB에서는 무시됨
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
\ No newline at end of file
@@ -0,0 +1,81 @@
+from threading import Lock
+import time
+
+
+class CountCache:
+    def __init__(self, ttl_seconds: float = 5, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+        self._generation = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(**filters) -> tuple:
+        return tuple(
+            (name, value) for name, value in sorted(filters.items()) if value is not None
+        )
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, generation=None):
+        with self._lock:
+            # 계산 도중 쓰기가 발생했다면 오래된 값을 저장하지 않음
+            if generation is not None and generation != self._generation:
+                return
+            if len(self._entries) >= self.max_entries:
+                self._evict_locked()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def get_or_compute(self, key, compute):
+        if self.ttl_seconds <= 0:
+            return compute()
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        value = compute()
+        self.set(key, value, generation)
+        return value
+
+    def invalidate(self, predicate=None):
+        with self._lock:
+            self._generation += 1
+            if predicate is None:
+                self._entries.clear()
+                return
+            stale = [key for key in self._entries if predicate(dict(key))]
+            for key in stale:
+                del self._entries[key]
+
+    def adjust(self, delta_for):
+        """Apply ``delta_for(filters)`` to cached counts; a ``None`` delta drops the entry."""
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                delta = delta_for(dict(key))
+                if delta is None:
+                    del self._entries[key]
+                elif delta:
+                    expires_at, value = self._entries[key]
+                    self._entries[key] = (expires_at, value + delta)
+
+    def _evict_locked(self):
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at < now]
+        for key in expired:
+            del self._entries[key]
+        if len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda key: self._entries[key][0])
+            del self._entries[oldest]
@@ -0,0 +1,283 @@
+from collections import deque
+from datetime import datetime
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from threading import Lock
+import asyncio
+import heapq
+import itertools
+import os
+import random
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경에서는 파일 잠금 없이 항상 리더로 동작함
+    fcntl = None
+
+
+class FileLeaderLock:
+    """같은 노드의 워커 중 하나만 잡을 수 있는 파일 잠금."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._file is not None or fcntl is None:
+                return True
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            lock_file = open(self.path, "a+")
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+            self._file = lock_file
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            finally:
+                self._file.close()
+                self._file = None
+
+
+class MySQLLeaderLock:
+    """MySQL GET_LOCK으로 클러스터 전체에서 리더 하나를 선출하는 잠금.
+
+    잠금은 연결에 묶여 있으므로 리더인 동안 연결 하나를 계속 유지하며, 연결이 끊기면
+    MySQL이 잠금을 풀어 다른 워커가 리더가 됩니다. 요청용 연결 풀을 줄이지 않고 풀이
+    연결을 재사용하거나 정리하면서 잠금이 풀리지 않도록 풀 없이 전용 연결을 만듭니다.
+    """
+
+    def __init__(self, database_url, name: str):
+        self.engine = create_engine(database_url, poolclass=NullPool)
+        self.name = name
+        self._connection = None
+        self._lock = Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    held = self._scalar(
+                        "SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"
+                    )
+                    if held:
+                        return True
+                except Exception:
+                    pass
+                self._close()
+
+            connection = self.engine.connect()
+            try:
+                self._connection = connection
+                acquired = self._scalar("SELECT GET_LOCK(:name, 0)")
+            except Exception:
+                acquired = None
+            if acquired != 1:
+                self._close()
+                return False
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._scalar("SELECT RELEASE_LOCK(:name)")
+            except Exception:
+                pass
+            self._close()
+
+    def _scalar(self, statement: str):
+        value = self._connection.execute(text(statement), {"name": self.name}).scalar()
+        # 읽기 뷰를 오래 붙잡지 않도록 조회마다 트랜잭션을 끝냄
+        self._connection.commit()
+        return value
+
+    def _close(self):
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+
+class MaintenanceJob:
+    """주기적으로 실행할 유지보수 작업.
+
+    ``func``는 처리한 건수나 ``{"scanned": ..., "affected": ...}`` 형태의 통계를 반환합니다.
+    처리한 건수가 ``busy_threshold`` 이상이면 ``min_interval_seconds`` 뒤에 다시 실행하고,
+    처리할 것이 없을 때는 ``max_interval_seconds``까지 간격을 늘립니다. ``backlog_age``는
+    실행 후 남아 있는 가장 오래된 처리 대상의 경과 시간(초)을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func,
+        interval_seconds: float,
+        min_interval_seconds: float = None,
+        max_interval_seconds: float = None,
+        busy_threshold: int = None,
+        leader_only: bool = True,
+        backlog_age=None,
+    ):
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.min_interval_seconds = min_interval_seconds or interval_seconds
+        self.max_interval_seconds = max_interval_seconds or interval_seconds
+        self.busy_threshold = busy_threshold
+        self.leader_only = leader_only
+        self.backlog_age = backlog_age
+        self.current_interval_seconds = interval_seconds
+        self.last_run = None
+
+    def next_delay(self, processed) -> float:
+        if not isinstance(processed, int):
+            self.current_interval_seconds = self.interval_seconds
+        elif self.busy_threshold and processed >= self.busy_threshold:
+            self.current_interval_seconds = self.min_interval_seconds
+        elif processed == 0:
+            self.current_interval_seconds = min(
+                max(self.current_interval_seconds, self.interval_seconds) * 2,
+                self.max_interval_seconds,
+            )
+        else:
+            self.current_interval_seconds = self.interval_seconds
+        return self.current_interval_seconds
+
+
+class MaintenanceRunner:
+    def __init__(
+        self,
+        jobs: list[MaintenanceJob],
+        leader_lock=None,
+        jitter_ratio: float = 0.1,
+        history_size: int = 200,
+    ):
+        self.jobs = jobs
+        self.leader_lock = leader_lock
+        self.jitter_ratio = jitter_ratio
+        self.is_leader = False
+        self.history_size = history_size
+        # 자주 도는 작업이 다른 작업의 기록을 밀어내지 않도록 작업마다 링 버퍼를 따로 둠
+        self.history = {job.name: deque(maxlen=history_size) for job in jobs}
+        self._sequence = itertools.count()
+        self._tasks = []
+
+    def recent_runs(self, job_name: str = None, limit: int = 50) -> list[dict]:
+        if job_name is not None:
+            histories = [self.history.get(job_name, ())]
+        else:
+            histories = list(self.history.values())
+        # 각 버퍼는 기록 순서대로 쌓이므로 최신 기록부터 합쳐서 필요한 만큼만 꺼냄
+        runs = heapq.merge(
+            *(reversed(history) for history in histories),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+        return [run for _, run in itertools.islice(runs, limit)]
+
+    def job_status(self) -> list[dict]:
+        return [
+            {
+                "job": job.name,
+                "leader_only": job.leader_only,
+                "interval_seconds": job.interval_seconds,
+                "current_interval_seconds": job.current_interval_seconds,
+                "last_run": job.last_run,
+            }
+            for job in self.jobs
+        ]
+
+    def start(self):
+        self._tasks = [
+            asyncio.create_task(self._run(job), name=f"maintenance:{job.name}")
+            for job in self.jobs
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.leader_lock is not None:
+            await asyncio.to_thread(self.leader_lock.release)
+        self.is_leader = False
+
+    def elect(self) -> bool:
+        if self.leader_lock is None:
+            self.is_leader = True
+        else:
+            try:
+                self.is_leader = self.leader_lock.try_acquire()
+            except Exception as e:
+                print(f"\033[31m[MaintenanceRunner] Leader election failed: {str(e)}\033[0m")
+                self.is_leader = False
+        return self.is_leader
+
+    def _jittered(self, delay: float) -> float:
+        # 여러 노드의 작업이 같은 시각에 몰리지 않도록 간격을 조금씩 흩뜨림
+        return max(0, delay * (1 + random.uniform(-self.jitter_ratio, self.jitter_ratio)))
+
+    async def _run(self, job: MaintenanceJob):
+        # 시작하자마자 한 번 실행하고, 이후로는 실행 결과에 따라 정한 간격마다 실행함
+        delay = 0
+        while True:
+            await asyncio.sleep(self._jittered(delay))
+            lock_wait_ms = None
+            if job.leader_only:
+                started = time.perf_counter()
+                is_leader = await asyncio.to_thread(self.elect)
+                lock_wait_ms = round((time.perf_counter() - started) * 1000, 2)
+                if not is_leader:
+                    delay = job.interval_seconds
+                    continue
+            run = await asyncio.to_thread(self.run_job, job, lock_wait_ms)
+            delay = job.next_delay(run["rows_affected"] if run["error"] is None else None)
+
+    def run_job(self, job: MaintenanceJob, lock_wait_ms: float = None) -> dict:
+        run = {
+            "job": job.name,
+            "started_at": datetime.now(),
+            "duration_ms": None,
+            "rows_scanned": None,
+            "rows_affected": None,
+            "lock_wait_ms": lock_wait_ms,
+            "backlog_age_seconds": None,
+            "error": None,
+        }
+        started = time.perf_counter()
+        try:
+            result = job.func()
+            if isinstance(result, dict):
+                run["rows_scanned"] = result.get("scanned")
+                run["rows_affected"] = result.get("affected")
+            else:
+                run["rows_affected"] = result
+        except Exception as e:
+            print(f"\033[31m[MaintenanceRunner] {job.name} failed: {str(e)}\033[0m")
+            run["error"] = str(e)
+        run["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        if job.backlog_age is not None:
+            try:
+                run["backlog_age_seconds"] = job.backlog_age()
+            except Exception as e:
+                print(f"\033[31m[MaintenanceRunner] {job.name} backlog check failed: {str(e)}\033[0m")
+
+        job.last_run = run
+        self.history.setdefault(job.name, deque(maxlen=self.history_size)).append(
+            (next(self._sequence), run)
+        )
+        return run
@@ -0,0 +1,322 @@
+from bisect import bisect_left
+from threading import Lock, local
+import json
+import math
+import os
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def log_linear_buckets(min_exponent: int, max_exponent: int, sub_buckets: int = 4) -> tuple:
+    """HDR 히스토그램처럼 2의 거듭제곱 구간을 ``sub_buckets``개로 균등하게 나눈 경계.
+
+    값의 크기와 관계없이 상대 오차가 ``1 / sub_buckets`` 이하로 유지됩니다.
+    """
+    bounds = []
+    for exponent in range(min_exponent, max_exponent):
+        base = 2.0**exponent
+        bounds.extend(base * (1 + step / sub_buckets) for step in range(sub_buckets))
+    bounds.append(2.0**max_exponent)
+    return tuple(bounds)
+
+
+def bucket_percentile(buckets, counts, quantile: float):
+    """구간별 개수(마지막은 +Inf)에서 분위수를 구간 안 선형 보간으로 추정함."""
+    total = sum(counts)
+    if total == 0:
+        return None
+    target = quantile * total
+    cumulative = 0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= target:
+            if index == len(buckets):
+                return buckets[-1]
+            lower = buckets[index - 1] if index else 0.0
+            return lower + (buckets[index] - lower) * (target - cumulative) / count
+        cumulative += count
+    return buckets[-1]
+
+
+class _ShardedMetric:
+    """스레드마다 따로 쌓은 값을 수집할 때만 합치는 지표.
+
+    값을 올리는 쪽은 자기 스레드의 샤드만 수정하므로 잠금 없이 기록할 수 있고,
+    잠금은 스레드가 처음 기록할 때 샤드를 등록하는 한 번만 사용합니다.
+    """
+
+    type_name = None
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = local()
+        self._shards = []
+        self._shards_lock = Lock()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _shard_items(self):
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # dict.copy는 GIL 안에서 한 번에 실행되므로 기록 중인 스레드와 충돌하지 않음
+            yield from shard.copy().items()
+
+
+class Counter(_ShardedMetric):
+    type_name = "counter"
+
+    def inc(self, *labelvalues, amount: float = 1):
+        shard = self._shard()
+        shard[labelvalues] = shard.get(labelvalues, 0) + amount
+
+    def collect(self) -> list:
+        totals = {}
+        for labelvalues, value in self._shard_items():
+            totals[labelvalues] = totals.get(labelvalues, 0) + value
+        return [[list(labelvalues), value] for labelvalues, value in totals.items()]
+
+
+class Histogram(_ShardedMetric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labelvalues):
+        shard = self._shard()
+        state = shard.get(labelvalues)
+        if state is None:
+            # 구간별 개수(마지막은 +Inf), 합계
+            state = shard[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def collect(self) -> list:
+        totals = {}
+        for labelvalues, state in self._shard_items():
+            state = list(state)
+            total = totals.get(labelvalues)
+            if total is None:
+                totals[labelvalues] = state
+            else:
+                totals[labelvalues] = [a + b for a, b in zip(total, state)]
+        return [
+            [list(labelvalues), state[:-1], state[-1]]
+            for labelvalues, state in totals.items()
+        ]
+
+
+class Gauge:
+    """수집 시점에 콜백으로 현재 값을 읽는 지표.
+
+    ``aggregate``는 여러 워커의 값을 합칠 방법으로, 워커마다 따로 가진 값은 ``sum``,
+    같은 노드의 워커가 함께 보는 값(공유 디렉터리 크기 등)은 ``max``를 사용합니다.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), aggregate: str = "sum"):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.aggregate = aggregate
+        self._callbacks = []
+
+    def add_callback(self, callback):
+        """``callback``은 숫자 하나 또는 ``{레이블 값 튜플: 값}``을 반환합니다."""
+        self._callbacks.append(callback)
+
+    def collect(self) -> list:
+        samples = []
+        for callback in self._callbacks:
+            try:
+                values = callback()
+            except Exception:
+                continue
+            if not isinstance(values, dict):
+                values = {(): values}
+            samples.extend([list(labelvalues), value] for labelvalues, value in values.items())
+        return samples
+
+
+class MetricsRegistry:
+    """워커별 지표를 모아 Prometheus 텍스트 형식으로 내보내는 레지스트리.
+
+    ``snapshot_dir``를 지정하면 각 워커가 자신의 누적 값을 ``<pid>.json``으로 기록하고,
+    내보낼 때 같은 디렉터리의 스냅샷을 모두 합쳐 노드 전체의 값을 보여줍니다.
+    ``stale_seconds``보다 오래 갱신되지 않은 스냅샷은 종료된 워커의 것으로 보고 삭제합니다.
+    """
+
+    def __init__(self, snapshot_dir: str = None, stale_seconds: float = 60):
+        self.snapshot_dir = snapshot_dir
+        self.stale_seconds = stale_seconds
+        self._metrics = {}
+        self._lock = Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} is already registered")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames=(), aggregate: str = "sum") -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, aggregate))
+
+    def collect(self) -> dict:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        snapshot = {}
+        for metric in metrics:
+            entry = {
+                "type": metric.type_name,
+                "help": metric.documentation,
+                "labels": list(metric.labelnames),
+                "samples": metric.collect(),
+            }
+            if isinstance(metric, Histogram):
+                entry["buckets"] = list(metric.buckets)
+            if isinstance(metric, Gauge):
+                entry["aggregate"] = metric.aggregate
+            snapshot[metric.name] = entry
+        return snapshot
+
+    def _snapshot_path(self, pid: int = None) -> str:
+        return os.path.join(self.snapshot_dir, f"{pid or os.getpid()}.json")
+
+    def write_snapshot(self) -> dict:
+        snapshot = self.collect()
+        if self.snapshot_dir:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            path = self._snapshot_path()
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file, separators=(",", ":"))
+            # 읽는 쪽이 쓰다 만 파일을 보지 않도록 이름을 바꿔서 교체함
+            os.replace(temp_path, path)
+        return snapshot
+
+    def remove_snapshot(self):
+        if not self.snapshot_dir:
+            return
+        try:
+            os.remove(self._snapshot_path())
+        except FileNotFoundError:
+            pass
+
+    def read_snapshots(self) -> list[dict]:
+        own = self.write_snapshot()
+        if not self.snapshot_dir:
+            return [own]
+        snapshots = [own]
+        own_name = os.path.basename(self._snapshot_path())
+        now = time.time()
+        for name in os.listdir(self.snapshot_dir):
+            if not name.endswith(".json") or name == own_name:
+                continue
+            path = os.path.join(self.snapshot_dir, name)
+            try:
+                if now - os.path.getmtime(path) > self.stale_seconds:
+                    os.remove(path)
+                    continue
+                with open(path, encoding="utf-8") as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                # 다른 워커가 교체하거나 삭제하는 중인 파일
+                continue
+        return snapshots
+
+    @staticmethod
+    def merge(snapshots: list[dict]) -> dict:
+        merged = {}
+        for snapshot in snapshots:
+            for name, entry in snapshot.items():
+                target = merged.setdefault(
+                    name, {**entry, "samples": {}}
+                )
+                samples = target["samples"]
+                for sample in entry["samples"]:
+                    labelvalues = tuple(sample[0])
+                    if entry["type"] == "histogram":
+                        if entry["buckets"] != target["buckets"]:
+                            continue
+                        counts, total = sample[1], sample[2]
+                        previous = samples.get(labelvalues)
+                        if previous is not None:
+                            counts = [a + b for a, b in zip(previous[0], counts)]
+                            total += previous[1]
+                        samples[labelvalues] = (counts, total)
+                    elif entry["type"] == "gauge" and entry.get("aggregate") == "max":
+                        samples[labelvalues] = max(samples.get(labelvalues, -math.inf), sample[1])
+                    else:
+                        samples[labelvalues] = samples.get(labelvalues, 0) + sample[1]
+        return merged
+
+    def render(self) -> str:
+        lines = []
+        for name, entry in sorted(self.merge(self.read_snapshots()).items()):
+            lines.append(f"# HELP {name} {_escape_help(entry['help'])}")
+            lines.append(f"# TYPE {name} {entry['type']}")
+            labelnames = entry["labels"]
+            for labelvalues, value in sorted(entry["samples"].items()):
+                labels = list(zip(labelnames, labelvalues))
+                if entry["type"] != "histogram":
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                    continue
+                counts, total = value
+                cumulative = 0
+                for bound, count in zip(entry["buckets"] + ["+Inf"], counts):
+                    cumulative += count
+                    le = bound if bound == "+Inf" else _format_value(bound)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels + [('le', le)])} {cumulative}"
+                    )
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,172 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from threading import Lock
+import re
+import time
+
+_PARAMETER = re.compile(r"%\([^)]*\)s|%s|\?|:\w+|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """바인딩 변수와 리터럴을 ``?``로 바꾸고 IN 목록은 길이와 관계없이 한 형태로 합침."""
+    statement = _PARAMETER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PARAMETER_LIST.sub("(?, ...)", statement)
+
+
+class QueryProfile:
+    """한 요청(또는 테스트 구간)에서 실행된 SQL 문과 단계별 소요 시간 기록.
+
+    단계(``timed_stage``) 안에서 실행된 SQL 문의 시간은 그 단계에 포함되므로 ``db``
+    단계에는 다른 단계 밖에서 실행된 SQL 문의 시간만 더합니다.
+    """
+
+    def __init__(self, label: str = None, max_statements: int = 200):
+        self.label = label
+        self.max_statements = max_statements
+        self.started = time.perf_counter()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements = []
+        self.stages = {}
+        self.endpoint_finished = None
+        self.sampler = None
+        self._active_stages = 0
+        self._lock = Lock()
+
+    def record(self, pool_name: str, statement: str, duration_seconds: float, rows: int):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += duration_seconds
+            if not self._active_stages:
+                self.stages["db"] = self.stages.get("db", 0.0) + duration_seconds
+            if len(self.statements) < self.max_statements:
+                self.statements.append((pool_name, statement, duration_seconds, rows))
+
+    def add_stage(self, name: str, duration_seconds: float):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + duration_seconds
+
+    def summary(self) -> list[dict]:
+        # 요청 처리 중에는 원문만 모아두고 정규화는 읽을 때 함
+        return [
+            {
+                "pool": pool_name,
+                "statement": normalize_statement(statement),
+                "duration_ms": round(duration_seconds * 1000, 3),
+                "rows": rows,
+            }
+            for pool_name, statement, duration_seconds, rows in self.statements
+        ]
+
+
+current_query_profile: ContextVar = ContextVar("current_query_profile", default=None)
+
+# 컨텍스트와 관계없이 모든 스레드의 SQL 문을 받는 기록 (테스트용)
+_global_profiles = []
+_global_profiles_lock = Lock()
+
+
+@contextmanager
+def profile_queries(label: str = None, max_statements: int = 200):
+    profile = QueryProfile(label, max_statements)
+    token = current_query_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        current_query_profile.reset(token)
+
+
+@contextmanager
+def timed_stage(name: str):
+    profile = current_query_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile._lock:
+        profile._active_stages += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        with profile._lock:
+            profile._active_stages -= 1
+        profile.add_stage(name, time.perf_counter() - started)
+
+
+def mark_endpoint_finished():
+    profile = current_query_profile.get()
+    if profile is not None:
+        profile.endpoint_finished = time.perf_counter()
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, label: str = None):
+    """구간 안에서 실행된 SQL 문이 ``max_queries``개를 넘으면 실패시킴.
+
+    TestClient는 다른 스레드의 이벤트 루프에서 앱을 실행하므로 컨텍스트 변수 대신
+    프로세스 전체의 SQL 문을 셉니다.
+    """
+    profile = QueryProfile(label)
+    with _global_profiles_lock:
+        _global_profiles.append(profile)
+    try:
+        yield profile
+    finally:
+        with _global_profiles_lock:
+            _global_profiles.remove(profile)
+    if profile.count > max_queries:
+        statements = "\n".join(
+            f"  [{entry['pool']}] {entry['statement']}" for entry in profile.summary()
+        )
+        raise AssertionError(
+            f"{label or 'block'} executed {profile.count} queries "
+            f"(max {max_queries}):\n{statements}"
+        )
+
+
+class QueryProfiler:
+    """엔진의 SQL 문마다 실행 시간과 행 수를 재서 현재 요청의 기록과 느린 쿼리 로그에 남김.
+
+    ``slow_query_seconds``가 0이면 느린 쿼리 로그를 남기지 않고, ``on_query``는
+    ``(pool_name, duration_seconds)``로 모든 SQL 문마다 호출됩니다.
+    """
+
+    def __init__(self, slow_query_seconds: float = 0.2, on_query=None):
+        self.slow_query_seconds = slow_query_seconds
+        self.on_query = on_query
+
+    def instrument(self, engine, pool_name: str):
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info["query_started"].pop()
+            self.record(pool_name, statement, time.perf_counter() - started, cursor.rowcount)
+
+        @event.listens_for(engine, "handle_error")
+        def handle_error(exception_context):
+            # 실패한 SQL 문은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+            connection = exception_context.connection
+            if connection is not None and connection.info.get("query_started"):
+                connection.info["query_started"].pop()
+
+    def record(self, pool_name: str, statement: str, duration_seconds: float, rows: int):
+        profile = current_query_profile.get()
+        if profile is not None:
+            profile.record(pool_name, statement, duration_seconds, rows)
+        if _global_profiles:
+            for global_profile in list(_global_profiles):
+                global_profile.record(pool_name, statement, duration_seconds, rows)
+        if self.on_query is not None:
+            self.on_query(pool_name, duration_seconds)
+        if self.slow_query_seconds and duration_seconds >= self.slow_query_seconds:
+            label = profile.label if profile is not None else "background"
+            print(
+                f"\033[33m[SlowQuery] {duration_seconds * 1000:.1f}ms rows={rows} "
+                f"pool={pool_name} request={label}: {normalize_statement(statement)}\033[0m"
+            )
@@ -0,0 +1,152 @@
+from collections import Counter
+from datetime import datetime
+from threading import Event, Lock, Thread
+import os
+import re
+import sys
+import time
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class StackSampler:
+    """등록된 스레드의 호출 스택을 일정 간격으로 읽어 collapsed-stack 형식으로 모으는 프로파일러.
+
+    cProfile과 달리 대상 스레드의 실행에 끼어들지 않으므로 운영 중인 요청에도 쓸 수 있습니다.
+    """
+
+    def __init__(self, interval_seconds: float = 0.005, max_seconds: float = 30, path: str = None):
+        self.interval_seconds = interval_seconds
+        self.max_seconds = max_seconds
+        self.path = path
+        self.samples = Counter()
+        self.sample_count = 0
+        self._thread_ids = set()
+        self._labels = {}
+        self._stopped = Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def track(self, thread_id: int):
+        self._thread_ids.add(thread_id)
+
+    def untrack(self, thread_id: int):
+        self._thread_ids.discard(thread_id)
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        deadline = time.perf_counter() + self.max_seconds
+        while not self._stopped.wait(self.interval_seconds):
+            if time.perf_counter() > deadline:
+                return
+            frames = sys._current_frames()
+            for thread_id in list(self._thread_ids):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.samples[self._stack(frame)] += 1
+                    self.sample_count += 1
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            try:
+                filename = os.path.relpath(filename)
+            except ValueError:
+                pass
+            label = self._labels[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+        return label
+
+    def _stack(self, frame) -> str:
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def write(self):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(self.collapsed())
+
+
+class RequestProfiler:
+    """요청 하나를 프로파일링해서 ``directory``에 ``.collapsed`` 파일로 남기는 관리자.
+
+    ``max_profiles``개를 ``window_seconds`` 안에 이미 남겼다면 새 프로파일링을 거절합니다.
+    개수는 디렉터리의 파일로 세므로 같은 디렉터리를 쓰는 워커 전체에 적용되며,
+    ``max_files``를 넘는 오래된 파일은 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_profiles: int = 5,
+        window_seconds: float = 600,
+        interval_seconds: float = 0.005,
+        max_seconds: float = 30,
+        max_files: int = 100,
+    ):
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self.window_seconds = window_seconds
+        self.interval_seconds = interval_seconds
+        self.max_seconds = max_seconds
+        self.max_files = max_files
+        self._lock = Lock()
+
+    def _profile_files(self) -> list[tuple[float, str]]:
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".collapsed"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                files.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                pass
+        return sorted(files)
+
+    def reserve(self, label: str):
+        """프로파일 파일을 미리 만들어 자리를 잡고 경로를 반환함. 한도를 넘으면 None."""
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            files = self._profile_files()
+            now = time.time()
+            recent = [path for mtime, path in files if now - mtime < self.window_seconds]
+            if len(recent) >= self.max_profiles:
+                return None
+            for _, path in files[: max(0, len(files) + 1 - self.max_files)]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            name = "{}-{}-{}.collapsed".format(
+                datetime.now().strftime("%Y%m%d-%H%M%S-%f"),
+                os.getpid(),
+                _UNSAFE_NAME.sub("_", label).strip("_")[:80],
+            )
+            path = os.path.join(self.directory, name)
+            open(path, "x").close()
+            return path
+
+    def start(self, label: str):
+        path = self.reserve(label)
+        if path is None:
+            return None
+        sampler = StackSampler(self.interval_seconds, self.max_seconds, path)
+        sampler.start()
+        return sampler
+
+    def finish(self, sampler: StackSampler):
+        sampler.stop()
+        sampler.write()
@@ -0,0 +1,44 @@
+from sqlalchemy import and_, text
+
+SEARCH_MODES = ("exact", "prefix", "contains", "fulltext")
+DEFAULT_SEARCH_MODE = "prefix"
+
+# MySQL ngram 파서의 기본 토큰 길이(ngram_token_size)
+NGRAM_TOKEN_SIZE = 2
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def user_id_condition(column, user_id: str, mode: str = DEFAULT_SEARCH_MODE, fulltext=False):
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"지원하지 않는 검색 방식입니다: `{mode}`")
+
+    if mode == "exact":
+        return column == user_id
+
+    if mode == "prefix":
+        return column.like(f"{escape_like(user_id)}%", escape="\\")
+
+    contains = column.like(f"%{escape_like(user_id)}%", escape="\\")
+    if mode == "fulltext" and fulltext and len(user_id) >= NGRAM_TOKEN_SIZE:
+        # ngram 구문 검색으로 후보를 좁힌 뒤 LIKE로 정확한 부분 문자열만 남김
+        phrase = '"' + user_id.replace('"', " ") + '"'
+        match = text(
+            f"MATCH(`{column.table.name}`.`{column.name}`) "
+            "AGAINST (:user_id_phrase IN BOOLEAN MODE)"
+        ).bindparams(user_id_phrase=phrase)
+        return and_(match, contains)
+    return contains
+
+
+def user_id_matches(pattern: str, user_id: str, mode: str = DEFAULT_SEARCH_MODE) -> bool:
+    # MySQL 기본 collation과 같이 대소문자를 구분하지 않고 비교함
+    pattern = pattern.lower()
+    user_id = user_id.lower()
+    if mode == "exact":
+        return pattern == user_id
+    if mode == "prefix":
+        return user_id.startswith(pattern)
+    return pattern in user_id
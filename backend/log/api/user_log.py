@@ -1,19 +1,32 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import Literal, Optional
+from datetime import datetime
+import asyncio
 from backend.log.service.user_log_manager import UserLogManager
+from backend.log.service.user_log_export import encode_user_logs, EXPORT_MEDIA_TYPES
+from backend.log.service.user_log_schemas import (
+    UserLogOccurrenceResponse,
+    UserLogResponse,
+)
 from backend.auth.service.session_manager import verify_admin_session
+from backend.config import LOG_STREAM_HEARTBEAT_SECONDS
 from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_400_BAD_REQUEST
 )
+from backend.middleware import ProfiledRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 user_log_manager = UserLogManager()
 
 
 @router.get("/user")
 async def get_user_log(
     user_id: Optional[str] = Query(None, description="User ID"),
+    search_mode: Literal["exact", "prefix", "contains", "fulltext"] = Query(
+        "prefix", description="How `user_id` is matched"
+    ),
     success: Optional[bool] = Query(None, description="Filter by success status"),
     start_date: Optional[str] = Query(
         None, description="Start date for filtering logs"
@@ -21,6 +34,9 @@ async def get_user_log(
     end_date: Optional[str] = Query(None, description="End date for filtering logs"),
     page: int = Query(1, ge=1, description="Page number (1-based index)"),
     per_page: int = Query(10, ge=1, le=100, description="Number of logs per page"),
+    estimate_total: bool = Query(
+        False, description="Allow an estimated total when an exact count is expensive"
+    ),
     _: None = Depends(verify_admin_session),
 ):
     try:
@@ -29,11 +45,41 @@ async def get_user_log(
             success=success,
             start_date=start_date,
             end_date=end_date,
+            search_mode=search_mode,
             page=page,
             per_page=per_page,
+            with_total=not estimate_total,
         )
 
-        return {"logs": logs, "total": total}
+        is_estimate = False
+        if estimate_total:
+            total, is_estimate = user_log_manager.count_user_logs(
+                user_id=user_id,
+                success=success,
+                start_date=start_date,
+                end_date=end_date,
+                estimate=True,
+                search_mode=search_mode,
+            )
+
+        return {
+            "logs": [
+                UserLogResponse(
+                    id=log.id,
+                    user_id=log.user_id,
+                    action=log.action,
+                    success=log.success,
+                    error_code=log.error_code,
+                    details=log.details,
+                    log_timestamp=log.log_timestamp,
+                    occurrence_count=log.occurrence_count,
+                    first_seen_at=log.first_seen_at,
+                )
+                for log in logs
+            ],
+            "total": total,
+            "is_estimate": is_estimate,
+        }
     except ValueError as e:
         raise HTTPException(
         status_code=HTTP_400_BAD_REQUEST,
@@ -46,3 +92,165 @@ async def get_user_log(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"사용자 로그를 불러오는 중 예기치 않은 오류가 발생했습니다: {str(e)}",
         )
+
+
+@router.get("/user/stream")
+async def stream_user_log(
+    user_id: Optional[str] = Query(None, description="User ID"),
+    search_mode: Literal["exact", "prefix", "contains", "fulltext"] = Query(
+        "prefix", description="How `user_id` is matched"
+    ),
+    success: Optional[bool] = Query(None, description="Filter by success status"),
+    _: None = Depends(verify_admin_session),
+):
+    subscription = user_log_manager.event_bus.subscribe(
+        user_id=user_id, success=success, search_mode=search_mode
+    )
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), timeout=LOG_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event is None:
+                    # 버퍼가 가득 찬 구독자는 연결을 끊고 클라이언트가 다시 조회하게 함
+                    yield "event: dropped\ndata: {}\n\n"
+                    break
+
+                if event.get("type") == "occurrence":
+                    # 묶인 실패는 기존 행의 발생 횟수만 갱신함
+                    data = UserLogOccurrenceResponse(**event).model_dump_json()
+                    yield f"event: occurrence\ndata: {data}\n\n"
+                    continue
+
+                data = UserLogResponse(**event).model_dump_json()
+                event_id = f"id: {event['id']}\n" if event["id"] is not None else ""
+                yield f"{event_id}event: log\ndata: {data}\n\n"
+        finally:
+            user_log_manager.event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/user/rollup")
+def get_user_log_rollup(
+    start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
+    end_date: str = Query(..., description="End date (YYYY-MM-DD)"),
+    action: Optional[str] = Query(None, description="Filter by action"),
+    success: Optional[bool] = Query(None, description="Filter by success status"),
+    _: None = Depends(verify_admin_session),
+):
+    try:
+        rollups = user_log_manager.get_log_rollups(
+            start_date=start_date,
+            end_date=end_date,
+            action=action,
+            success=success,
+        )
+
+        return {
+            "rollups": [
+                {
+                    "day": rollup.day,
+                    "action": rollup.action,
+                    "success": rollup.success,
+                    "count": rollup.count,
+                }
+                for rollup in rollups
+            ]
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"{str(e)}",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"사용자 로그 통계를 불러오는 중 예기치 않은 오류가 발생했습니다: {str(e)}",
+        )
+
+
+@router.post("/user/rollup/rebuild")
+def rebuild_user_log_rollup(
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    _: None = Depends(verify_admin_session),
+):
+    try:
+        rebuilt = user_log_manager.rebuild_log_rollups(
+            start_date=start_date, end_date=end_date
+        )
+        return {"rebuilt": rebuilt}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"{str(e)}",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"사용자 로그 통계를 재구성하는 중 예기치 않은 오류가 발생했습니다: {str(e)}",
+        )
+
+
+@router.get("/user/export")
+def export_user_log(
+    user_id: Optional[str] = Query(None, description="User ID"),
+    search_mode: Literal["exact", "prefix", "contains", "fulltext"] = Query(
+        "prefix", description="How `user_id` is matched"
+    ),
+    success: Optional[bool] = Query(None, description="Filter by success status"),
+    start_date: Optional[str] = Query(
+        None, description="Start date for filtering logs"
+    ),
+    end_date: Optional[str] = Query(None, description="End date for filtering logs"),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    gzip: bool = Query(False, description="Compress the export with gzip"),
+    _: None = Depends(verify_admin_session),
+):
+    try:
+        rows = user_log_manager.stream_user_logs(
+            user_id=user_id,
+            success=success,
+            start_date=start_date,
+            end_date=end_date,
+            search_mode=search_mode,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"{str(e)}",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"사용자 로그를 내보내는 중 예기치 않은 오류가 발생했습니다: {str(e)}",
+        )
+
+    filename = f"user_log_{datetime.now().strftime('%Y%m%d%H%M%S')}.{format}"
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        encode_user_logs(rows, export_format=format, use_gzip=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,134 @@
+import json
+import re
+
+# 작업명 코드표. 코드는 저장된 로그가 참조하므로 변경하거나 재사용하지 않음
+LOG_ACTIONS = {
+    1: "로그인",
+    2: "사용자 로그인",
+    3: "User Login",
+    4: "로그인 실패",
+    5: "사용자 생성",
+    6: "비밀번호 변경",
+    7: "사용자 삭제",
+    8: "사용자 계정 활성화",
+    9: "사용자 계정 비활성화",
+    10: "사용자 일괄 생성",
+    11: "사용자 계정 일괄 활성화",
+    12: "사용자 계정 일괄 비활성화",
+    13: "사용자 일괄 삭제",
+}
+
+# 상세 설명 템플릿. 코드는 저장된 로그가 참조하므로 변경하거나 재사용하지 않음
+LOG_DETAIL_TEMPLATES = {
+    1: "사용자가 성공적으로 로그인했습니다.",
+    2: "잘못된 계정 정보로 로그인에 실패하였습니다.",
+    3: "로그인 중 오류가 발생하였습니다. {error}",
+    4: "사용자 계정 `{user_id}` 성공적으로 활성화되었습니다.",
+    5: "사용자 계정 `{user_id}` 활성화에 실패하였습니다. {error}",
+    6: "사용자 계정 `{user_id}` 활성화 중 예기치 못한 오류가 발생하였습니다. {error}",
+    7: "사용자 계정 `{user_id}` 성공적으로 비활성화되었습니다.",
+    8: "사용자 계정 `{user_id}` 비활성화에 실패하였습니다. {error}",
+    9: "사용자 계정 `{user_id}` 비활성화 중 예기치 못한 오류가 발생하였습니다. {error}",
+    10: "사용자 `{user_id}`이(가) `{role}` 권한으로 생성되었습니다.",
+    11: "사용자 `{user_id}` 생성 중 오류가 발생하였습니다. {error}",
+    12: "사용자 `{user_id}` 생성 중 예기치 못한 오류가 발생하였습니다. {error}",
+    13: "사용자 `{user_id}`의 비밀번호가 성공적으로 변경되었습니다.",
+    14: "사용자 `{user_id}`의 비밀번호 변경 중 오류가 발생하였습니다. {error}",
+    15: "사용자 `{user_id}`의 비밀번호 변경 중 예기치 못한 오류가 발생하였습니다. {error}",
+    16: "사용자 `{user_id}`이(가) 성공적으로 삭제되었습니다.",
+    17: "사용자 `{user_id}` 삭제 중 오류가 발생하였습니다. {error}",
+    18: "사용자 `{user_id}` 삭제 중 예기치 못한 오류 발생하였습니다. {error}",
+    19: "사용자 계정 {user_id}이(가) 너무 많은 로그인 실패로 인해 잠겼습니다.",
+    20: "사용자 {created}명이 일괄 생성되었습니다. (중복 {duplicate}건, 잘못된 요청 {invalid}건)",
+    21: "사용자 일괄 생성 중 예기치 못한 오류가 발생하였습니다. {error}",
+    22: "사용자 계정 {count}개가 일괄 활성화되었습니다.",
+    23: "사용자 계정 일괄 활성화 중 오류가 발생하였습니다. {error}",
+    24: "사용자 계정 {count}개가 일괄 비활성화되었습니다.",
+    25: "사용자 계정 일괄 비활성화 중 오류가 발생하였습니다. {error}",
+    26: "사용자 {count}명이 일괄 삭제되었습니다.",
+    27: "사용자 일괄 삭제 중 오류가 발생하였습니다. {error}",
+}
+
+ACTION_CODES = {name: code for code, name in LOG_ACTIONS.items()}
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+def _compile_template(template: str):
+    literals = _PLACEHOLDER.split(template)[::2]
+    names = _PLACEHOLDER.findall(template)
+    pattern = "".join(
+        re.escape(literal) + ("(.*?)" if index < len(names) else "")
+        for index, literal in enumerate(literals)
+    )
+    return literals[0], names, re.compile(f"^{pattern}$", re.DOTALL)
+
+
+_COMPILED_TEMPLATES = {
+    template_id: _compile_template(template)
+    for template_id, template in LOG_DETAIL_TEMPLATES.items()
+}
+
+
+def compact_action(action):
+    if action is None:
+        return None, None
+    code = ACTION_CODES.get(action)
+    if code is None:
+        return None, action
+    return code, None
+
+
+def render_action(action_code, action_text):
+    if action_code is not None:
+        return LOG_ACTIONS.get(action_code, action_text)
+    return action_text
+
+
+def compact_details(details):
+    if details is None:
+        return None, None, None
+
+    for template_id, (prefix, names, pattern) in _COMPILED_TEMPLATES.items():
+        if not details.startswith(prefix):
+            continue
+        match = pattern.match(details)
+        if match is None:
+            continue
+        params = list(match.groups())
+        # 다시 렌더링했을 때 원문과 같을 때만 템플릿으로 저장함
+        if render_details(template_id, params, None) != details:
+            continue
+        if not params:
+            return template_id, None, None
+        return (
+            template_id,
+            json.dumps(params, ensure_ascii=False, separators=(",", ":")),
+            None,
+        )
+
+    return None, None, details
+
+
+def render_details(details_template, details_params, details_text):
+    if details_template is None or details_template not in LOG_DETAIL_TEMPLATES:
+        return details_text
+
+    _, names, _ = _COMPILED_TEMPLATES[details_template]
+    if isinstance(details_params, str):
+        details_params = json.loads(details_params)
+    return LOG_DETAIL_TEMPLATES[details_template].format(
+        **dict(zip(names, details_params or []))
+    )
+
+
+def compact_log_values(action, details) -> dict:
+    action_code, action_text = compact_action(action)
+    details_template, details_params, details_text = compact_details(details)
+    return {
+        "action_code": action_code,
+        "action_text": action_text,
+        "details_template": details_template,
+        "details_params": details_params,
+        "details_text": details_text,
+    }
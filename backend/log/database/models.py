@@ -1,13 +1,21 @@
 from sqlalchemy import (
     Column,
     Integer,
+    SmallInteger,
     String,
     DateTime,
+    Date,
     Text,
     Boolean
 )
 from datetime import datetime
 from backend.database.base_database_manager import Base
+from backend.log.database.log_templates import (
+    compact_action,
+    compact_details,
+    render_action,
+    render_details,
+)
 import pytz
 
 
@@ -16,13 +24,58 @@ def get_kst_now():
     return datetime.now(kst)
 
 
+class UserLogAction(Base):
+    __tablename__ = "user_log_action"
+
+    code = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(String(50), nullable=False, unique=True)
+
+
 class UserLog(Base):
     __tablename__ = "user_log"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(255), nullable=False)
-    action = Column(String(50), nullable=False)  # 어떤 작업인지
+    user_id = Column(String(255), nullable=False, index=True)
+    action_code = Column(SmallInteger, nullable=True)  # user_log_action.code
+    action_text = Column("action", String(50), nullable=True)  # 코드표에 없는 작업명
     success = Column(Boolean, nullable=False)  # "True" or "False"
     error_code = Column(Integer, nullable=True)  # 에러 코드 (예: 404, 500)
-    details = Column(Text, nullable=True)  # 추가 설명
-    log_timestamp = Column(DateTime, default=get_kst_now)
+    details_template = Column(SmallInteger, nullable=True)  # 상세 설명 템플릿 번호
+    details_params = Column(Text, nullable=True)  # 템플릿 인자 (JSON 배열)
+    details_text = Column("details", Text, nullable=True)  # 템플릿에 없는 추가 설명
+    log_timestamp = Column(DateTime, default=get_kst_now, index=True)  # 마지막 발생 시간
+    occurrence_count = Column(
+        Integer, nullable=False, default=1, server_default="1"
+    )  # 같은 실패가 묶여서 기록된 횟수
+    first_seen_at = Column(DateTime, nullable=True)  # 묶인 실패가 처음 발생한 시간
+
+    @property
+    def action(self):  # 어떤 작업인지
+        return render_action(self.action_code, self.action_text)
+
+    @action.setter
+    def action(self, value):
+        self.action_code, self.action_text = compact_action(value)
+
+    @property
+    def details(self):  # 추가 설명
+        return render_details(
+            self.details_template, self.details_params, self.details_text
+        )
+
+    @details.setter
+    def details(self, value):
+        (
+            self.details_template,
+            self.details_params,
+            self.details_text,
+        ) = compact_details(value)
+
+
+class UserLogDailyRollup(Base):
+    __tablename__ = "user_log_daily_rollup"
+
+    day = Column(Date, primary_key=True)
+    action = Column(String(50), primary_key=True)
+    success = Column(Boolean, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
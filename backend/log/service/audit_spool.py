@@ -0,0 +1,150 @@
+from threading import Lock
+import json
+import os
+import time
+
+OPEN_SUFFIX = ".open"
+SEALED_SUFFIX = ".jsonl"
+REPLAYING_SUFFIX = ".replaying"
+
+
+class AuditSpool:
+    def __init__(
+        self,
+        directory: str,
+        fsync_batch_size: int = 32,
+        fsync_interval_seconds: float = 0.05,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.fsync_batch_size = fsync_batch_size
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = Lock()
+        self._file = None
+        self._segment_path = None
+        self._segment_bytes = 0
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def append(self, record: dict):
+        line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            self._file.write(line)
+            self._file.flush()
+            self._segment_bytes += len(line)
+            self._unsynced += 1
+
+            # 레코드마다 fsync하지 않고 일정 개수나 시간 단위로 묶어서 디스크에 반영함
+            if (
+                self._unsynced >= self.fsync_batch_size
+                or time.monotonic() - self._last_fsync >= self.fsync_interval_seconds
+            ):
+                self._fsync()
+
+            if self._segment_bytes >= self.segment_max_bytes:
+                self._seal_segment()
+
+    def sync(self):
+        with self._lock:
+            if self._file is not None and self._unsynced:
+                self._fsync()
+
+    def seal(self):
+        with self._lock:
+            if self._file is not None:
+                self._seal_segment()
+
+    def pending_bytes(self) -> int:
+        total = 0
+        for name in os.listdir(self.directory):
+            try:
+                total += os.path.getsize(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+        return total
+
+    def claim_segments(self):
+        """Yield (path, records) for every sealed segment, claimed exclusively."""
+        self._recover_orphaned_segments()
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(SEALED_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            claimed_path = f"{path}{REPLAYING_SUFFIX}-{os.getpid()}"
+            try:
+                # 다른 워커가 먼저 가져간 세그먼트는 건너뜀
+                os.rename(path, claimed_path)
+            except FileNotFoundError:
+                continue
+            yield claimed_path, self._read_records(claimed_path)
+
+    def complete(self, claimed_path: str):
+        os.remove(claimed_path)
+
+    def release(self, claimed_path: str):
+        os.rename(claimed_path, claimed_path.split(REPLAYING_SUFFIX)[0])
+
+    def _open_segment(self):
+        name = f"audit-{os.getpid()}-{time.time_ns()}"
+        self._segment_path = os.path.join(self.directory, name)
+        self._file = open(f"{self._segment_path}{OPEN_SUFFIX}", "ab")
+        self._segment_bytes = 0
+
+    def _fsync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+
+    def _seal_segment(self):
+        self._fsync()
+        self._file.close()
+        os.rename(
+            f"{self._segment_path}{OPEN_SUFFIX}", f"{self._segment_path}{SEALED_SUFFIX}"
+        )
+        self._file = None
+        self._segment_path = None
+
+    def _recover_orphaned_segments(self):
+        # 비정상 종료된 프로세스가 남긴 세그먼트와 처리 중이던 세그먼트를 다시 재처리 대상으로 돌림
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(OPEN_SUFFIX):
+                owner_pid = int(name.split("-")[1])
+                if owner_pid != os.getpid() and not self._is_alive(owner_pid):
+                    self._rename_quietly(path, path[: -len(OPEN_SUFFIX)] + SEALED_SUFFIX)
+            elif REPLAYING_SUFFIX in name:
+                owner_pid = int(name.rsplit("-", 1)[1])
+                if owner_pid != os.getpid() and not self._is_alive(owner_pid):
+                    self._rename_quietly(path, path.split(REPLAYING_SUFFIX)[0])
+
+    def _read_records(self, path: str) -> list[dict]:
+        records = []
+        with open(path, "rb") as segment:
+            for line in segment:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 건너뜀
+                    continue
+        return records
+
+    @staticmethod
+    def _is_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def _rename_quietly(source: str, destination: str):
+        try:
+            os.rename(source, destination)
+        except FileNotFoundError:
+            pass
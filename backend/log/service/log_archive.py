@@ -0,0 +1,327 @@
+from backend.database.user_id_search import DEFAULT_SEARCH_MODE, user_id_matches
+from datetime import datetime
+from itertools import islice
+import base64
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import os
+import shutil
+import time
+
+TIMESTAMP_FIELDS = ("log_timestamp", "first_seen_at")
+SEGMENT_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".idx.json"
+TEMP_SUFFIX = ".tmp"
+
+
+class BloomFilter:
+    def __init__(self, size_bits: int, hash_count: int, bits: bytearray = None):
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.bits = bits if bits is not None else bytearray((size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        size_bits = max(
+            64, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        )
+        hash_count = max(1, round(size_bits / capacity * math.log(2)))
+        return cls(size_bits, hash_count)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size_bits for i in range(self.hash_count))
+
+    def add(self, value: str):
+        for position in self._positions(value):
+            self.bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(value)
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "size_bits": self.size_bits,
+            "hash_count": self.hash_count,
+            "bits": base64.b64encode(bytes(self.bits)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            data["size_bits"],
+            data["hash_count"],
+            bytearray(base64.b64decode(data["bits"])),
+        )
+
+
+class LogArchive:
+    """만료된 사용자 로그를 날짜별 gzip JSONL 세그먼트로 보관하는 저장소.
+
+    세그먼트는 독립적으로 압축된 블록(gzip member)들로 구성되며, 옆에 저장되는
+    인덱스 파일에 블록별 위치와 시간 범위, 세그먼트의 user_id Bloom 필터를 기록해
+    조회 시 필요한 블록만 읽습니다.
+    """
+
+    def __init__(self, directory: str, block_rows: int = 1000):
+        self.directory = directory
+        self.block_rows = block_rows
+        os.makedirs(self.directory, exist_ok=True)
+
+    def write(self, rows: list[dict]) -> list[str]:
+        """Archive rows (sorted by log_timestamp) and return the written segment paths."""
+        by_day = {}
+        for row in rows:
+            timestamp = row["log_timestamp"].replace(tzinfo=None)
+            by_day.setdefault(timestamp.date().isoformat(), []).append(
+                {**row, "log_timestamp": timestamp}
+            )
+
+        written = []
+        try:
+            for day, day_rows in by_day.items():
+                written.append(self._write_segment(day, day_rows))
+        except Exception:
+            self.discard(written)
+            raise
+        return written
+
+    def discard(self, segment_paths: list[str]):
+        for path in segment_paths:
+            for file_path in (f"{path}{INDEX_SUFFIX}", f"{path}{SEGMENT_SUFFIX}"):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+    def purge_before(self, day) -> int:
+        purged = 0
+        for name in self._days():
+            if name < day.isoformat():
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+                purged += 1
+        return purged
+
+    def search(
+        self,
+        user_id=None,
+        success=None,
+        start=None,
+        end=None,
+        search_mode=DEFAULT_SEARCH_MODE,
+        offset=0,
+        limit=None,
+    ) -> list[dict]:
+        rows = self._iter_rows(user_id, success, start, end, search_mode)
+        stop = offset + limit if limit is not None else None
+        return list(islice(rows, offset, stop))
+
+    def iterate(
+        self,
+        user_id=None,
+        success=None,
+        start=None,
+        end=None,
+        search_mode=DEFAULT_SEARCH_MODE,
+        newest_first=True,
+    ):
+        """Yield matching rows block by block instead of collecting them into a list."""
+        return self._iter_rows(user_id, success, start, end, search_mode, newest_first)
+
+    def count(
+        self,
+        user_id=None,
+        success=None,
+        start=None,
+        end=None,
+        search_mode=DEFAULT_SEARCH_MODE,
+    ) -> int:
+        total = 0
+        for day in self._candidate_days(start, end):
+            for path, index in self._candidate_segments(day, user_id, start, end, search_mode):
+                for block in index["blocks"]:
+                    if not self._block_overlaps(block, start, end):
+                        continue
+                    # 시간 외의 조건이 없고 블록 전체가 범위 안이면 압축을 풀지 않고 개수만 더함
+                    if (
+                        user_id is None
+                        and success is None
+                        and self._block_within(block, start, end)
+                    ):
+                        total += block["count"]
+                        continue
+                    total += sum(
+                        1
+                        for row in self._read_block(path, block)
+                        if self._row_matches(row, user_id, success, start, end, search_mode)
+                    )
+        return total
+
+    def _write_segment(self, day: str, rows: list[dict]) -> str:
+        day_directory = os.path.join(self.directory, day)
+        os.makedirs(day_directory, exist_ok=True)
+        path = os.path.join(day_directory, f"segment-{time.time_ns()}-{os.getpid()}")
+
+        bloom = BloomFilter.for_capacity(len({row["user_id"].lower() for row in rows}))
+        blocks = []
+        offset = 0
+        with open(f"{path}{SEGMENT_SUFFIX}{TEMP_SUFFIX}", "wb") as segment:
+            for start in range(0, len(rows), self.block_rows):
+                block_rows = rows[start : start + self.block_rows]
+                payload = gzip.compress(
+                    "".join(
+                        json.dumps(
+                            row,
+                            ensure_ascii=False,
+                            default=lambda value: value.isoformat(),
+                        )
+                        + "\n"
+                        for row in block_rows
+                    ).encode("utf-8")
+                )
+                segment.write(payload)
+                for row in block_rows:
+                    bloom.add(row["user_id"].lower())
+                blocks.append(
+                    {
+                        "offset": offset,
+                        "length": len(payload),
+                        "count": len(block_rows),
+                        "min_timestamp": block_rows[0]["log_timestamp"].isoformat(),
+                        "max_timestamp": block_rows[-1]["log_timestamp"].isoformat(),
+                    }
+                )
+                offset += len(payload)
+            segment.flush()
+            os.fsync(segment.fileno())
+
+        index = {
+            "count": len(rows),
+            "min_timestamp": blocks[0]["min_timestamp"],
+            "max_timestamp": blocks[-1]["max_timestamp"],
+            "blocks": blocks,
+            "user_id_bloom": bloom.to_dict(),
+        }
+        with open(f"{path}{INDEX_SUFFIX}{TEMP_SUFFIX}", "w", encoding="utf-8") as index_file:
+            json.dump(index, index_file)
+            index_file.flush()
+            os.fsync(index_file.fileno())
+
+        # 인덱스가 있는 세그먼트만 조회 대상이므로 데이터 파일을 먼저 확정함
+        os.rename(f"{path}{SEGMENT_SUFFIX}{TEMP_SUFFIX}", f"{path}{SEGMENT_SUFFIX}")
+        os.rename(f"{path}{INDEX_SUFFIX}{TEMP_SUFFIX}", f"{path}{INDEX_SUFFIX}")
+        return path
+
+    def _days(self) -> list[str]:
+        return sorted(
+            name
+            for name in os.listdir(self.directory)
+            if os.path.isdir(os.path.join(self.directory, name))
+        )
+
+    def _candidate_days(self, start, end) -> list[str]:
+        days = self._days()
+        if start is not None:
+            days = [day for day in days if day >= start.date().isoformat()]
+        if end is not None:
+            days = [day for day in days if day <= end.date().isoformat()]
+        return days
+
+    def _candidate_segments(self, day, user_id, start, end, search_mode):
+        day_directory = os.path.join(self.directory, day)
+        for name in sorted(os.listdir(day_directory)):
+            if not name.endswith(INDEX_SUFFIX):
+                continue
+            path = os.path.join(day_directory, name[: -len(INDEX_SUFFIX)])
+            with open(f"{path}{INDEX_SUFFIX}", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+
+            if not self._block_overlaps(index, start, end):
+                continue
+            # Bloom 필터는 정확히 일치하는 검색에서만 세그먼트를 건너뛰는 데 사용할 수 있음
+            if (
+                user_id is not None
+                and search_mode == "exact"
+                and user_id.lower() not in BloomFilter.from_dict(index["user_id_bloom"])
+            ):
+                continue
+            yield path, index
+
+    def _iter_rows(self, user_id, success, start, end, search_mode, newest_first=True):
+        # 날짜 디렉터리는 서로 겹치지 않으므로 날짜 순서대로 차례로 읽고,
+        # 같은 날짜의 세그먼트끼리만 병합해서 시간 순서를 유지함
+        days = self._candidate_days(start, end)
+        for day in reversed(days) if newest_first else days:
+            segments = list(self._candidate_segments(day, user_id, start, end, search_mode))
+            yield from heapq.merge(
+                *(
+                    self._iter_segment(
+                        path, index, user_id, success, start, end, search_mode, newest_first
+                    )
+                    for path, index in segments
+                ),
+                key=lambda row: row["log_timestamp"],
+                reverse=newest_first,
+            )
+
+    def _iter_segment(
+        self, path, index, user_id, success, start, end, search_mode, newest_first=True
+    ):
+        blocks = reversed(index["blocks"]) if newest_first else index["blocks"]
+        for block in blocks:
+            if not self._block_overlaps(block, start, end):
+                continue
+            rows = self._read_block(path, block)
+            for row in reversed(rows) if newest_first else rows:
+                if self._row_matches(row, user_id, success, start, end, search_mode):
+                    yield row
+
+    def _read_block(self, path: str, block: dict) -> list[dict]:
+        with open(f"{path}{SEGMENT_SUFFIX}", "rb") as segment:
+            segment.seek(block["offset"])
+            payload = gzip.decompress(segment.read(block["length"]))
+        rows = []
+        for line in payload.decode("utf-8").splitlines():
+            row = json.loads(line)
+            for field in TIMESTAMP_FIELDS:
+                if row.get(field) is not None:
+                    row[field] = datetime.fromisoformat(row[field])
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _block_overlaps(block: dict, start, end) -> bool:
+        if start is not None and datetime.fromisoformat(block["max_timestamp"]) < start:
+            return False
+        if end is not None and datetime.fromisoformat(block["min_timestamp"]) > end:
+            return False
+        return True
+
+    @staticmethod
+    def _block_within(block: dict, start, end) -> bool:
+        if start is not None and datetime.fromisoformat(block["min_timestamp"]) < start:
+            return False
+        if end is not None and datetime.fromisoformat(block["max_timestamp"]) > end:
+            return False
+        return True
+
+    @staticmethod
+    def _row_matches(row, user_id, success, start, end, search_mode) -> bool:
+        if start is not None and row["log_timestamp"] < start:
+            return False
+        if end is not None and row["log_timestamp"] > end:
+            return False
+        if success is not None and row["success"] != success:
+            return False
+        if user_id is not None and not user_id_matches(user_id, row["user_id"], search_mode):
+            return False
+        return True
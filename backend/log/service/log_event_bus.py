@@ -0,0 +1,86 @@
+from backend.database.user_id_search import DEFAULT_SEARCH_MODE, user_id_matches
+from threading import Lock
+import asyncio
+
+
+class LogSubscription:
+    def __init__(
+        self,
+        loop,
+        max_queued,
+        user_id=None,
+        success=None,
+        search_mode=DEFAULT_SEARCH_MODE,
+    ):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_queued)
+        self.user_id = user_id
+        self.success = success
+        self.search_mode = search_mode
+        self.dropped = False
+
+    def matches(self, event: dict) -> bool:
+        if self.success is not None and event["success"] != self.success:
+            return False
+        if self.user_id is not None and not user_id_matches(
+            self.user_id, event["user_id"], self.search_mode
+        ):
+            return False
+        return True
+
+    def _offer(self, event: dict):
+        # 이벤트 루프 스레드에서 실행됨
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 따라오지 못하는 구독자는 버퍼를 비우고 종료 신호만 남김
+            self.dropped = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self):
+        """Return the next event, or None once the subscriber has been dropped."""
+        return await self.queue.get()
+
+
+class LogEventBus:
+    def __init__(self, max_queued: int = 100):
+        self.max_queued = max_queued
+        self._lock = Lock()
+        self._subscriptions = []
+
+    def subscribe(
+        self, user_id=None, success=None, search_mode=DEFAULT_SEARCH_MODE
+    ) -> LogSubscription:
+        subscription = LogSubscription(
+            asyncio.get_running_loop(), self.max_queued, user_id, success, search_mode
+        )
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, event: dict):
+        """Deliver an event to matching subscribers; safe to call from any thread."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        for subscription in subscriptions:
+            if subscription.dropped or not subscription.matches(event):
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독자
+                self.unsubscribe(subscription)
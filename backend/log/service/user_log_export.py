@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+import zlib
+
+EXPORT_COLUMNS = [
+    "id",
+    "user_id",
+    "action",
+    "success",
+    "error_code",
+    "details",
+    "log_timestamp",
+    "occurrence_count",
+    "first_seen_at",
+]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def row_to_dict(row: dict) -> dict:
+    data = {column: row[column] for column in EXPORT_COLUMNS}
+    for column in ("log_timestamp", "first_seen_at"):
+        if data[column] is not None:
+            data[column] = data[column].isoformat()
+    return data
+
+
+def encode_ndjson(rows):
+    buffer = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row_to_dict(row), ensure_ascii=False) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def encode_csv(rows):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=EXPORT_COLUMNS)
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+    output.write("\ufeff")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row_to_dict(row))
+        if output.tell() >= CHUNK_SIZE:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def encode_user_logs(rows, export_format: str = "ndjson", use_gzip: bool = False):
+    if export_format == "csv":
+        chunks = encode_csv(rows)
+    else:
+        chunks = encode_ndjson(rows)
+    if use_gzip:
+        chunks = gzip_chunks(chunks)
+    return chunks
@@ -1,13 +1,70 @@
-from backend.log.database.models import UserLog
+from backend.log.database.models import (
+    UserLog,
+    UserLogAction,
+    UserLogDailyRollup,
+    get_kst_now,
+)
+from backend.log.database.log_templates import (
+    LOG_ACTIONS,
+    compact_log_values,
+    render_action,
+    render_details,
+)
 from backend.database.base_database_manager import BaseManager
 from backend.config import (
     DOCKER_MYSQL_DATABASE_URI,
     MYSQL_DATABASE_URI,
     IS_DOCKER,
     OPERATION_LOG_RETENTION_PERIOD,
+    OPERATION_LOG_PURGE_BATCH_SIZE,
+    OPERATION_LOG_ARCHIVE_ENABLED,
+    OPERATION_LOG_ARCHIVE_DIR,
+    OPERATION_LOG_ARCHIVE_RETENTION_PERIOD,
+    OPERATION_LOG_ARCHIVE_BLOCK_ROWS,
+    COUNT_CACHE_TTL_SECONDS,
+    COUNT_CACHE_MAX_ENTRIES,
+    COUNT_ESTIMATE_THRESHOLD,
+    LOG_EXPORT_BATCH_SIZE,
+    LOG_STREAM_QUEUE_SIZE,
+    LOG_BURST_WINDOW_SECONDS,
+    LOG_BURST_MAX_KEYS,
+    USER_ID_FULLTEXT_INDEX,
+    AUDIT_SPOOL_ENABLED,
+    AUDIT_SPOOL_DIR,
+    AUDIT_SPOOL_FSYNC_BATCH_SIZE,
+    AUDIT_SPOOL_FSYNC_INTERVAL_MS,
+    AUDIT_SPOOL_SEGMENT_MAX_BYTES,
+    AUDIT_DB_TIMEOUT_SECONDS,
+    AUDIT_DB_RETRY_SECONDS,
+    METRICS_ENABLED,
+    QUERY_PROFILING_ENABLED,
 )
 from backend.database.base_database_manager import Base
+from backend.database.count_cache import CountCache
+from backend.log.service.audit_spool import AuditSpool
+from backend.log.service.log_archive import LogArchive
+from backend.log.service.log_event_bus import LogEventBus
+from backend.database.query_profiler import timed_stage
+from backend.monitoring.service.metrics import (
+    TimedQueuePool,
+    instrument_engine,
+    query_profiler,
+    registry,
+)
+from backend.database.user_id_search import (
+    DEFAULT_SEARCH_MODE,
+    user_id_condition,
+    user_id_matches,
+)
+from sqlalchemy import create_engine, inspect, select, insert, func, text
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import sessionmaker, scoped_session
+from collections import Counter
+from itertools import chain
 from datetime import datetime, timedelta
+from threading import Lock
+import time
 import pytz
 
 
@@ -27,10 +84,138 @@ class UserLogManager(BaseManager):
     ):
         if not hasattr(self, "initialized"):
             super().__init__(Base, log_database_uri, docker_log_database_uri, is_docker)
+            self.relax_legacy_log_columns()
+            self.seed_log_actions()
+            self.count_cache = CountCache(
+                ttl_seconds=COUNT_CACHE_TTL_SECONDS,
+                max_entries=COUNT_CACHE_MAX_ENTRIES,
+            )
+            self.user_id_fulltext = USER_ID_FULLTEXT_INDEX == "true" and (
+                self.ensure_fulltext_index(
+                    UserLog.__tablename__, "user_id", "ft_user_log_user_id"
+                )
+            )
+            self.write_engine = self.create_write_engine()
+            self.WriteSessionLocal = scoped_session(
+                sessionmaker(autocommit=False, autoflush=False, bind=self.write_engine)
+            )
+            self.audit_spool = None
+            if AUDIT_SPOOL_ENABLED == "true":
+                self.audit_spool = AuditSpool(
+                    AUDIT_SPOOL_DIR,
+                    fsync_batch_size=AUDIT_SPOOL_FSYNC_BATCH_SIZE,
+                    fsync_interval_seconds=AUDIT_SPOOL_FSYNC_INTERVAL_MS / 1000,
+                    segment_max_bytes=AUDIT_SPOOL_SEGMENT_MAX_BYTES,
+                )
+            self.audit_db_retry_at = 0
+            self.event_bus = LogEventBus(max_queued=LOG_STREAM_QUEUE_SIZE)
+            self.log_bursts = {}
+            self.log_burst_backlog = []
+            self.log_burst_lock = Lock()
+            self.log_archive = None
+            if OPERATION_LOG_ARCHIVE_ENABLED == "true":
+                self.log_archive = LogArchive(
+                    OPERATION_LOG_ARCHIVE_DIR,
+                    block_rows=OPERATION_LOG_ARCHIVE_BLOCK_ROWS,
+                )
+            if METRICS_ENABLED == "true":
+                self.register_queue_metrics()
             self.initialized = True
 
-    def save_user_log(self, user_id, action, success, error_code=None, details=None):
+    def relax_legacy_log_columns(self):
+        # 작업명과 상세 설명은 코드/템플릿으로 저장되므로 기존 문자열 컬럼은 NULL을 허용해야 함
+        if self.engine.dialect.name != "mysql":
+            return
+        columns = {
+            column["name"]: column
+            for column in inspect(self.engine).get_columns(UserLog.__tablename__)
+        }
+        if not columns["action"]["nullable"]:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    text("ALTER TABLE `user_log` MODIFY `action` VARCHAR(50) NULL")
+                )
+
+    def seed_log_actions(self):
         session = self.get_session()
+        try:
+            existing = {code for (code,) in session.query(UserLogAction.code).all()}
+            for code, name in LOG_ACTIONS.items():
+                if code not in existing:
+                    session.add(UserLogAction(code=code, name=name))
+            session.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 등록한 경우
+            session.rollback()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def create_write_engine(self):
+        if self.engine.dialect.name != "mysql":
+            return self.engine
+        # 감사 로그 쓰기는 짧은 타임아웃을 사용해서 DB 장애가 요청 지연으로 이어지지 않게 함
+        write_engine = create_engine(
+            self.database_uri,
+            pool_size=5,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            pool_timeout=AUDIT_DB_TIMEOUT_SECONDS,
+            poolclass=TimedQueuePool,
+            connect_args={
+                "connect_timeout": AUDIT_DB_TIMEOUT_SECONDS,
+                "read_timeout": AUDIT_DB_TIMEOUT_SECONDS,
+                "write_timeout": AUDIT_DB_TIMEOUT_SECONDS,
+            },
+        )
+        if METRICS_ENABLED == "true":
+            instrument_engine(write_engine, "UserLogManager.write")
+        if QUERY_PROFILING_ENABLED == "true":
+            query_profiler.instrument(write_engine, "UserLogManager.write")
+        return write_engine
+
+    def register_queue_metrics(self):
+        registry.gauge(
+            "audit_burst_keys",
+            "Failure log keys currently being merged in this worker.",
+        ).add_callback(lambda: len(self.log_bursts))
+        registry.gauge(
+            "audit_burst_backlog",
+            "Merged failure log groups waiting to be flushed to the database.",
+        ).add_callback(lambda: len(self.log_burst_backlog))
+        if self.audit_spool is not None:
+            # 스풀 디렉터리는 같은 노드의 워커가 함께 쓰므로 워커별 값을 더하지 않음
+            registry.gauge(
+                "audit_spool_pending_bytes",
+                "Bytes of audit logs spooled locally and not yet replayed.",
+                aggregate="max",
+            ).add_callback(self.audit_spool.pending_bytes)
+
+    def get_write_session(self):
+        return self.WriteSessionLocal()
+
+    @timed_stage("audit")
+    def save_user_log(self, user_id, action, success, error_code=None, details=None):
+        log_timestamp = get_kst_now()
+        if not success:
+            burst = self._collapse_burst(user_id, action, error_code, log_timestamp)
+            if burst is not None:
+                # 새 행이 아니므로 실시간 목록에서 기존 행의 발생 횟수만 바꾸도록 알림
+                self._publish_occurrence(*burst, user_id, log_timestamp)
+                return
+
+        if self.audit_spool is not None and self.audit_db_retry_at > time.monotonic():
+            self._spool_user_log(
+                user_id, action, success, error_code, details, log_timestamp
+            )
+            self._publish_user_log(
+                None, user_id, action, success, error_code, details, log_timestamp
+            )
+            return
+
+        session = self.get_write_session()
         try:
             new_log = UserLog(
                 user_id=user_id,
@@ -38,15 +223,411 @@ class UserLogManager(BaseManager):
                 success=success,
                 error_code=error_code,
                 details=details,
+                log_timestamp=log_timestamp,
+                first_seen_at=None if success else log_timestamp,
             )
             session.add(new_log)
+            self._increment_rollup(session, log_timestamp.date(), action, success)
+            session.flush()
+            log_id = new_log.id
+            session.commit()
+            if not success:
+                self._track_burst(user_id, action, error_code, log_id, log_timestamp)
+            self.count_cache.invalidate(
+                lambda filters: self._log_matches_filters(
+                    filters, user_id, success, log_timestamp
+                )
+            )
+            self._publish_user_log(
+                log_id, user_id, action, success, error_code, details, log_timestamp
+            )
+        except SQLAlchemyError as e:
+            session.rollback()
+            if self.audit_spool is None:
+                raise e
+            self.audit_db_retry_at = time.monotonic() + AUDIT_DB_RETRY_SECONDS
+            print(
+                f"\033[33m[UserLogManager] Audit database unavailable, spooling logs locally: {str(e)}\033[0m"
+            )
+            self._spool_user_log(
+                user_id, action, success, error_code, details, log_timestamp
+            )
+            self._publish_user_log(
+                None, user_id, action, success, error_code, details, log_timestamp
+            )
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def _publish_user_log(
+        self, log_id, user_id, action, success, error_code, details, log_timestamp
+    ):
+        self.event_bus.publish(
+            {
+                "id": log_id,
+                "user_id": user_id,
+                "action": action,
+                "success": success,
+                "error_code": error_code,
+                "details": details,
+                "log_timestamp": log_timestamp,
+            }
+        )
+
+    def _publish_occurrence(self, log_id, occurrence_count, user_id, log_timestamp):
+        self.event_bus.publish(
+            {
+                "type": "occurrence",
+                "id": log_id,
+                "user_id": user_id,
+                "success": False,
+                "occurrence_count": occurrence_count,
+                "log_timestamp": log_timestamp,
+            }
+        )
+
+    def _collapse_burst(self, user_id, action, error_code, log_timestamp):
+        # 같은 실패가 짧은 시간 안에 반복되면 새 행을 쓰지 않고 기존 행의 발생 횟수만 올림
+        if LOG_BURST_WINDOW_SECONDS <= 0:
+            return None
+        with self.log_burst_lock:
+            burst = self.log_bursts.get((user_id, action, error_code))
+            if burst is None or burst["expires_at"] <= time.monotonic():
+                return None
+            burst["pending"][log_timestamp.date()] += 1
+            burst["last_seen"] = log_timestamp
+            burst["occurrence_count"] += 1
+            return burst["log_id"], burst["occurrence_count"]
+
+    def _track_burst(self, user_id, action, error_code, log_id, log_timestamp):
+        if LOG_BURST_WINDOW_SECONDS <= 0 or log_id is None:
+            return
+        key = (user_id, action, error_code)
+        with self.log_burst_lock:
+            previous = self.log_bursts.pop(key, None)
+            if previous is not None and previous["pending"]:
+                # 만료된 뒤 아직 반영되지 않은 횟수는 다음 flush에서 기록함
+                self.log_burst_backlog.append((key, previous))
+            if len(self.log_bursts) >= LOG_BURST_MAX_KEYS:
+                return
+            self.log_bursts[key] = {
+                "log_id": log_id,
+                "pending": Counter(),
+                "last_seen": log_timestamp,
+                "occurrence_count": 1,
+                "expires_at": time.monotonic() + LOG_BURST_WINDOW_SECONDS,
+            }
+
+    def flush_log_bursts(self) -> int:
+        now = time.monotonic()
+        with self.log_burst_lock:
+            flushing = self.log_burst_backlog
+            self.log_burst_backlog = []
+            for key, burst in list(self.log_bursts.items()):
+                if burst["pending"]:
+                    flushing.append((key, dict(burst)))
+                    burst["pending"] = Counter()
+                if burst["expires_at"] <= now:
+                    del self.log_bursts[key]
+
+        if not flushing:
+            return 0
+
+        session = self.get_write_session()
+        try:
+            for (_, action, _), burst in flushing:
+                session.query(UserLog).filter(UserLog.id == burst["log_id"]).update(
+                    {
+                        UserLog.occurrence_count: UserLog.occurrence_count
+                        + sum(burst["pending"].values()),
+                        UserLog.log_timestamp: burst["last_seen"],
+                    },
+                    synchronize_session=False,
+                )
+                for day, amount in burst["pending"].items():
+                    self._increment_rollup(session, day, action, False, amount)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            with self.log_burst_lock:
+                self.log_burst_backlog.extend(flushing)
+            raise e
+        finally:
+            session.close()
+
+        self.count_cache.invalidate()
+        return sum(sum(burst["pending"].values()) for _, burst in flushing)
+
+    def _spool_user_log(self, user_id, action, success, error_code, details, log_timestamp):
+        self.audit_spool.append(
+            {
+                "user_id": user_id,
+                "action": action,
+                "success": success,
+                "error_code": error_code,
+                "details": details,
+                "log_timestamp": log_timestamp.isoformat(),
+            }
+        )
+
+    def _insert_user_logs(self, session, records):
+        rows = [
+            {
+                "user_id": record["user_id"],
+                "success": record["success"],
+                "error_code": record["error_code"],
+                "log_timestamp": datetime.fromisoformat(record["log_timestamp"]),
+                **compact_log_values(record["action"], record["details"]),
+            }
+            for record in records
+        ]
+        session.execute(insert(UserLog), rows)
+
+        rollups = Counter(
+            (
+                datetime.fromisoformat(record["log_timestamp"]).date(),
+                record["action"],
+                record["success"],
+            )
+            for record in records
+        )
+        for (day, action, success), amount in rollups.items():
+            self._increment_rollup(session, day, action, success, amount)
+
+    def replay_spooled_logs(self) -> int:
+        if self.audit_spool is None:
+            return 0
+
+        self.audit_spool.seal()
+        replayed = 0
+        for claimed_path, records in self.audit_spool.claim_segments():
+            session = self.get_write_session()
+            try:
+                if records:
+                    self._insert_user_logs(session, records)
+                    session.commit()
+                self.audit_spool.complete(claimed_path)
+                replayed += len(records)
+            except Exception as e:
+                session.rollback()
+                self.audit_spool.release(claimed_path)
+                self.audit_db_retry_at = time.monotonic() + AUDIT_DB_RETRY_SECONDS
+                raise e
+            finally:
+                session.close()
+
+        if replayed:
+            self.audit_db_retry_at = 0
+            self.count_cache.invalidate()
+            print(
+                f"\033[32m[UserLogManager] Replayed {replayed} spooled user logs.\033[0m"
+            )
+        return replayed
+
+    def _increment_rollup(self, session, day, action, success, amount=1):
+        values = {"day": day, "action": action, "success": success, "count": amount}
+        dialect = session.get_bind().dialect.name
+
+        if dialect == "mysql":
+            statement = mysql.insert(UserLogDailyRollup).values(**values)
+            statement = statement.on_duplicate_key_update(
+                count=UserLogDailyRollup.count + statement.inserted.count
+            )
+            session.execute(statement)
+        elif dialect == "sqlite":
+            statement = sqlite.insert(UserLogDailyRollup).values(**values)
+            statement = statement.on_conflict_do_update(
+                index_elements=["day", "action", "success"],
+                set_={"count": UserLogDailyRollup.count + statement.excluded.count},
+            )
+            session.execute(statement)
+        else:
+            updated = (
+                session.query(UserLogDailyRollup)
+                .filter(
+                    UserLogDailyRollup.day == day,
+                    UserLogDailyRollup.action == action,
+                    UserLogDailyRollup.success == success,
+                )
+                .update({UserLogDailyRollup.count: UserLogDailyRollup.count + amount})
+            )
+            if not updated:
+                session.add(UserLogDailyRollup(**values))
+
+    def _parse_date(self, value, message):
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValueError(message)
+
+    def get_log_rollups(self, start_date, end_date, action=None, success=None):
+        start_day = self._parse_date(
+            start_date, "잘못된 시작 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+        end_day = self._parse_date(
+            end_date, "잘못된 종료 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+
+        session = self.get_session()
+        try:
+            query = session.query(UserLogDailyRollup).filter(
+                UserLogDailyRollup.day >= start_day,
+                UserLogDailyRollup.day <= end_day,
+            )
+
+            if action is not None:
+                query = query.filter(UserLogDailyRollup.action == action)
+
+            if success is not None:
+                query = query.filter(UserLogDailyRollup.success == success)
+
+            return query.order_by(
+                UserLogDailyRollup.day.asc(),
+                UserLogDailyRollup.action.asc(),
+                UserLogDailyRollup.success.asc(),
+            ).all()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def rebuild_log_rollups(self, start_date=None, end_date=None) -> int:
+        if start_date is not None:
+            start_day = self._parse_date(
+                start_date, "잘못된 시작 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요."
+            )
+        else:
+            # 보관 기간 경계의 날짜는 일부만 남아 있으므로 온전한 날짜부터 재구성함
+            start_day = (
+                get_kst_now() - timedelta(days=OPERATION_LOG_RETENTION_PERIOD - 1)
+            ).date()
+
+        if end_date is not None:
+            end_day = self._parse_date(
+                end_date, "잘못된 종료 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요."
+            )
+        else:
+            end_day = get_kst_now().date()
+
+        session = self.get_session()
+        try:
+            session.query(UserLogDailyRollup).filter(
+                UserLogDailyRollup.day >= start_day,
+                UserLogDailyRollup.day <= end_day,
+            ).delete(synchronize_session=False)
+
+            log_day = func.date(UserLog.log_timestamp)
+            action_name = func.coalesce(UserLogAction.name, UserLog.action_text)
+            # 묶인 실패는 한 행에 여러 번의 발생이 담기므로 행 수가 아니라 발생 횟수를 더함
+            aggregated = (
+                select(log_day, action_name, UserLog.success, func.sum(UserLog.occurrence_count))
+                .select_from(UserLog)
+                .outerjoin(UserLogAction, UserLogAction.code == UserLog.action_code)
+                .where(
+                    UserLog.log_timestamp >= datetime.combine(start_day, datetime.min.time()),
+                    UserLog.log_timestamp
+                    < datetime.combine(end_day + timedelta(days=1), datetime.min.time()),
+                )
+                .group_by(log_day, action_name, UserLog.success)
+            )
+            result = session.execute(
+                insert(UserLogDailyRollup).from_select(
+                    ["day", "action", "success", "count"], aggregated
+                )
+            )
             session.commit()
+            return result.rowcount
         except Exception as e:
             session.rollback()
             raise e
         finally:
             session.close()
 
+    def _filter_user_logs(
+        self,
+        query,
+        user_id=None,
+        success=None,
+        start_date=None,
+        end_date=None,
+        search_mode=DEFAULT_SEARCH_MODE,
+    ):
+        if user_id is not None:
+            query = query.filter(
+                user_id_condition(
+                    UserLog.user_id, user_id, search_mode, self.user_id_fulltext
+                )
+            )
+
+        if success is not None:
+            query = query.filter(UserLog.success == success)
+
+        if start_date is not None:
+            try:
+                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
+                query = query.filter(UserLog.log_timestamp >= start_date_obj)
+            except ValueError:
+                raise ValueError("잘못된 시작 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
+
+        if end_date is not None:
+            try:
+                end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
+                query = query.filter(UserLog.log_timestamp <= end_date_obj)
+            except ValueError:
+                raise ValueError("잘못된 시작 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
+
+        return query
+
+    def _log_matches_filters(self, filters, user_id, success, log_timestamp):
+        if "user_id" in filters and not user_id_matches(
+            filters["user_id"], user_id, filters.get("search_mode", DEFAULT_SEARCH_MODE)
+        ):
+            return False
+        if "success" in filters and filters["success"] != success:
+            return False
+        if "end_date" in filters:
+            try:
+                end_date_obj = datetime.strptime(filters["end_date"], "%Y-%m-%d")
+            except ValueError:
+                return False
+            if log_timestamp.replace(tzinfo=None) > end_date_obj:
+                return False
+        return True
+
+    def _count_cache_key(self, user_id, success, start_date, end_date, search_mode):
+        return self.count_cache.make_key(
+            user_id=user_id,
+            search_mode=search_mode if user_id is not None else None,
+            success=success,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    def _expired_before(self):
+        kst = pytz.timezone("Asia/Seoul")
+        return datetime.now(kst) - timedelta(days=OPERATION_LOG_RETENTION_PERIOD)
+
+    def _archive_range(self, start_date, end_date):
+        # 날짜 조건이 보관 기간보다 이전까지 포함할 때만 아카이브를 함께 조회함
+        if self.log_archive is None or (start_date is None and end_date is None):
+            return None
+
+        start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+        expired_before = self._expired_before().replace(tzinfo=None)
+        if start is not None and start > expired_before:
+            return None
+        return start, end
+
+    def _count_archived_logs(self, archive_range, user_id, success, search_mode):
+        if archive_range is None:
+            return 0
+        start, end = archive_range
+        return self.log_archive.count(user_id, success, start, end, search_mode)
+
     def get_user_logs(
         self,
         user_id=None,
@@ -55,39 +636,65 @@ class UserLogManager(BaseManager):
         end_date=None,
         page=None,
         per_page=None,
+        with_total=True,
+        search_mode=DEFAULT_SEARCH_MODE,
     ):
         session = self.get_session()
         try:
-            query = session.query(UserLog)
-
-            if user_id is not None:
-                query = query.filter(UserLog.user_id.like(f"%{user_id}%"))
-
-            if success is not None:
-                query = query.filter(UserLog.success == success)
-
-            if start_date is not None:
-                try:
-                    start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
-                    query = query.filter(UserLog.log_timestamp >= start_date_obj)
-                except ValueError:
-                    raise ValueError("잘못된 시작 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
-
-            if end_date is not None:
-                try:
-                    end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-                    query = query.filter(UserLog.log_timestamp <= end_date_obj)
-                except ValueError:
-                    raise ValueError("잘못된 시작 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
+            query = self._filter_user_logs(
+                session.query(UserLog),
+                user_id,
+                success,
+                start_date,
+                end_date,
+                search_mode,
+            )
+            archive_range = self._archive_range(start_date, end_date)
 
             query = query.order_by(UserLog.log_timestamp.desc())
-            
-            total = query.count()
 
+            total = None
+            if with_total:
+                total = self.count_cache.get_or_compute(
+                    self._count_cache_key(
+                        user_id, success, start_date, end_date, search_mode
+                    ),
+                    lambda: query.count()
+                    + self._count_archived_logs(
+                        archive_range, user_id, success, search_mode
+                    ),
+                )
+
+            offset = 0
+            page_query = query
             if page is not None and per_page is not None:
-                query = query.limit(per_page).offset((page - 1) * per_page)
+                offset = (page - 1) * per_page
+                page_query = query.limit(per_page).offset(offset)
             
-            logs = query.all()
+            logs = page_query.all()
+
+            if archive_range is not None and (per_page is None or len(logs) < per_page):
+                # 보관된 로그는 모두 DB에 남은 로그보다 오래되었으므로 DB 결과 뒤에 이어 붙임
+                if page is None or per_page is None:
+                    archive_offset, archive_limit = 0, None
+                else:
+                    database_total = offset + len(logs) if logs else query.count()
+                    archive_offset = max(0, offset - database_total)
+                    archive_limit = per_page - len(logs)
+
+                start, end = archive_range
+                logs += [
+                    UserLog(**row)
+                    for row in self.log_archive.search(
+                        user_id,
+                        success,
+                        start,
+                        end,
+                        search_mode,
+                        offset=archive_offset,
+                        limit=archive_limit,
+                    )
+                ]
             return logs, total
         except Exception as e:
             session.rollback()
@@ -95,22 +702,225 @@ class UserLogManager(BaseManager):
         finally:
             session.close()
 
-    def delete_expired_logs(self):
+    def count_user_logs(
+        self,
+        user_id=None,
+        success=None,
+        start_date=None,
+        end_date=None,
+        estimate=False,
+        search_mode=DEFAULT_SEARCH_MODE,
+    ) -> tuple[int, bool]:
+        key = self._count_cache_key(
+            user_id, success, start_date, end_date, search_mode
+        )
+        cached = self.count_cache.get(key)
+        if cached is not None:
+            return cached, False
+
         session = self.get_session()
         try:
-            kst = pytz.timezone("Asia/Seoul")
-            now = datetime.now(kst)
-            standard_date = now - timedelta(days=OPERATION_LOG_RETENTION_PERIOD)
-            old_logs = (
-                session.query(UserLog)
+            query = self._filter_user_logs(
+                session.query(UserLog),
+                user_id,
+                success,
+                start_date,
+                end_date,
+                search_mode,
+            )
+            archive_range = self._archive_range(start_date, end_date)
+
+            if estimate:
+                if key:
+                    estimated = self.estimate_query_rows(session, query)
+                else:
+                    estimated = self.estimate_table_rows(session, UserLog.__tablename__)
+                if estimated is not None and estimated >= COUNT_ESTIMATE_THRESHOLD:
+                    return (
+                        estimated
+                        + self._count_archived_logs(
+                            archive_range, user_id, success, search_mode
+                        ),
+                        True,
+                    )
+
+            return (
+                self.count_cache.get_or_compute(
+                    key,
+                    lambda: query.count()
+                    + self._count_archived_logs(
+                        archive_range, user_id, success, search_mode
+                    ),
+                ),
+                False,
+            )
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def _log_columns(self):
+        return (
+            UserLog.id,
+            UserLog.user_id,
+            UserLog.action_code,
+            UserLog.action_text.label("action_text"),
+            UserLog.success,
+            UserLog.error_code,
+            UserLog.details_template,
+            UserLog.details_params,
+            UserLog.details_text.label("details_text"),
+            UserLog.log_timestamp,
+            UserLog.occurrence_count,
+            UserLog.first_seen_at,
+        )
+
+    def _render_log_row(self, row) -> dict:
+        return {
+            "id": row.id,
+            "user_id": row.user_id,
+            "action": render_action(row.action_code, row.action_text),
+            "success": row.success,
+            "error_code": row.error_code,
+            "details": render_details(
+                row.details_template, row.details_params, row.details_text
+            ),
+            "log_timestamp": row.log_timestamp,
+            "occurrence_count": row.occurrence_count,
+            "first_seen_at": row.first_seen_at,
+        }
+
+    def stream_user_logs(
+        self,
+        user_id=None,
+        success=None,
+        start_date=None,
+        end_date=None,
+        batch_size=LOG_EXPORT_BATCH_SIZE,
+        search_mode=DEFAULT_SEARCH_MODE,
+    ):
+        # 필터 오류(ValueError)는 스트리밍 시작 전에 발생하도록 쿼리를 먼저 구성함
+        statement = self._filter_user_logs(
+            select(*self._log_columns()),
+            user_id,
+            success,
+            start_date,
+            end_date,
+            search_mode,
+        ).order_by(UserLog.log_timestamp.asc(), UserLog.id.asc())
+        rows = self._iterate_stream(statement, batch_size)
+
+        # 목록 조회, 개수와 같은 결과가 나오도록 보관된 로그도 포함하며,
+        # 보관된 로그는 모두 DB에 남은 로그보다 오래되었으므로 앞에 이어 붙임
+        archive_range = self._archive_range(start_date, end_date)
+        if archive_range is None:
+            return rows
+        start, end = archive_range
+        archived = self.log_archive.iterate(
+            user_id, success, start, end, search_mode, newest_first=False
+        )
+        return chain(archived, rows)
+
+    def _iterate_stream(self, statement, batch_size):
+        # scoped_session은 스레드별로 공유되므로 스트리밍에는 전용 커넥션을 사용함
+        with self.engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(statement)
+            try:
+                for row in result:
+                    yield self._render_log_row(row)
+            finally:
+                result.close()
+
+    def oldest_expired_log_age(self):
+        standard_date = self._expired_before()
+        session = self.get_session()
+        try:
+            oldest = (
+                session.query(func.min(UserLog.log_timestamp))
                 .filter(UserLog.log_timestamp <= standard_date)
-                .all()
+                .scalar()
+            )
+            if oldest is None:
+                return None
+            # 보관 기간이 지난 뒤 삭제되지 않고 남아 있는 시간
+            return round(
+                (standard_date.replace(tzinfo=None) - oldest.replace(tzinfo=None)).total_seconds(),
+                1,
             )
-            for old_log in old_logs:
-                session.delete(old_log)
-            session.commit()
         except Exception as e:
             session.rollback()
             raise e
         finally:
             session.close()
+
+    def delete_expired_logs(self, max_batches: int = None, stats: dict = None) -> int:
+        standard_date = self._expired_before()
+
+        total_deleted = 0
+        batches = 0
+        while True:
+            archived = []
+            session = self.get_session()
+            try:
+                if self.log_archive is not None:
+                    # 삭제 전에 같은 배치를 아카이브에 먼저 기록함
+                    expired_rows = [
+                        self._render_log_row(row)
+                        for row in session.query(*self._log_columns())
+                        .filter(UserLog.log_timestamp <= standard_date)
+                        .order_by(UserLog.log_timestamp.asc(), UserLog.id.asc())
+                        .limit(OPERATION_LOG_PURGE_BATCH_SIZE)
+                        .all()
+                    ]
+                    expired_ids = [row["id"] for row in expired_rows]
+                    if expired_rows:
+                        archived = self.log_archive.write(expired_rows)
+                else:
+                    expired_ids = [
+                        row.id
+                        for row in session.query(UserLog.id)
+                        .filter(UserLog.log_timestamp <= standard_date)
+                        .order_by(UserLog.log_timestamp.asc())
+                        .limit(OPERATION_LOG_PURGE_BATCH_SIZE)
+                        .all()
+                    ]
+                if stats is not None:
+                    stats["scanned"] = stats.get("scanned", 0) + len(expired_ids)
+                if expired_ids:
+                    total_deleted += (
+                        session.query(UserLog)
+                        .filter(UserLog.id.in_(expired_ids))
+                        .delete(synchronize_session=False)
+                    )
+                    session.commit()
+            except Exception as e:
+                session.rollback()
+                if archived:
+                    # 삭제되지 않은 배치의 아카이브는 다음 실행에서 다시 기록되므로 제거함
+                    self.log_archive.discard(archived)
+                raise e
+            finally:
+                session.close()
+
+            batches += 1
+            if len(expired_ids) < OPERATION_LOG_PURGE_BATCH_SIZE:
+                break
+            if max_batches is not None and batches >= max_batches:
+                # 남은 로그는 유지보수 작업이 짧은 간격으로 다시 실행되어 이어서 삭제함
+                break
+
+        if self.log_archive is not None:
+            self.log_archive.purge_before(
+                (
+                    get_kst_now() - timedelta(days=OPERATION_LOG_ARCHIVE_RETENTION_PERIOD)
+                ).date()
+            )
+
+        if total_deleted:
+            self.count_cache.invalidate()
+        if stats is not None:
+            stats["affected"] = total_deleted
+        return total_deleted
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class UserLogResponse(BaseModel):
+    id: Optional[int]
+    user_id: str
+    action: Optional[str]
+    success: bool
+    error_code: Optional[int]
+    details: Optional[str]
+    log_timestamp: Optional[datetime]
+    occurrence_count: Optional[int] = 1
+    first_seen_at: Optional[datetime] = None
+
+
+class UserLogOccurrenceResponse(BaseModel):
+    id: int
+    occurrence_count: int
+    log_timestamp: datetime
@@ -2,13 +2,24 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.auth.api import login, user_crud_management, user_lock_management, session
 from backend.auth.service.session_manager import SessionManager
+from backend.auth.service.user_manager import UserManager
 from backend.log.service.user_log_manager import UserLogManager
 from backend.log.api import user_log
-from apscheduler.schedulers.background import BackgroundScheduler
 from contextlib import asynccontextmanager
 import logging
-from backend.config import CORS_ALLOW_ORIGINS
-from backend.middleware import RateLimitMiddleware
+from backend.config import (
+    CORS_ALLOW_ORIGINS,
+    METRICS_ENABLED,
+    QUERY_PROFILING_ENABLED,
+    REQUEST_PROFILING_ENABLED,
+    SERVER_TIMING_ENABLED,
+)
+from backend.maintenance.api import maintenance
+from backend.maintenance.service.maintenance_jobs import maintenance_runner
+from backend.middleware import MetricsMiddleware, QueryProfileMiddleware, RateLimitMiddleware
+from backend.monitoring.api import metrics, service_methods
+from backend.monitoring.service.metrics import registry
+from backend.monitoring.service.request_profiling import PROFILE_HEADER
 
 
 class UvicornErrorFilter(logging.Filter):
@@ -21,25 +32,31 @@ for handler in logger.handlers:
     handler.addFilter(UvicornErrorFilter())
 
 session_manager = SessionManager()
+user_manager = UserManager()
 user_log_manager = UserLogManager()
-scheduler = BackgroundScheduler()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
-        scheduler.add_job(
-            session_manager.delete_expired_sessions, "interval", minutes=5
-        )
-        scheduler.add_job(user_log_manager.delete_expired_logs, "interval", hours=24)
-        scheduler.start()
+        user_manager.warm_user_cache()
+    except Exception as e:
+        print(f"Failed to warm the user cache: {str(e)}")
+    try:
+        maintenance_runner.start()
         yield
     except Exception as e:
         print(f"An error occurred: {str(e)}")
         raise
     finally:
-        scheduler.shutdown()
-        pass
+        await maintenance_runner.stop()
+        try:
+            user_log_manager.flush_log_bursts()
+        except Exception as e:
+            print(f"Failed to flush merged failure logs: {str(e)}")
+        if user_log_manager.audit_spool is not None:
+            user_log_manager.audit_spool.seal()
+        registry.remove_snapshot()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -51,6 +68,10 @@ app.include_router(user_lock_management.router, tags=["user"], prefix="/api/user
 app.include_router(login.router, tags=["login"], prefix="/api")
 app.include_router(session.router, tags=["session"], prefix="/api")
 app.include_router(user_log.router, tags=["log"], prefix="/api/log")
+app.include_router(maintenance.router, tags=["maintenance"], prefix="/api/maintenance")
+if METRICS_ENABLED == "true":
+    app.include_router(metrics.router, tags=["metrics"], prefix="/metrics")
+app.include_router(service_methods.router, tags=["monitoring"], prefix="/api/monitoring")
 
 origins = CORS_ALLOW_ORIGINS
 
@@ -60,8 +81,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[user_lock_management.NEXT_CURSOR_HEADER, "Server-Timing", PROFILE_HEADER],
 )
 app.add_middleware(RateLimitMiddleware, max_requests=20, window_seconds=1)
+# Server-Timing과 요청 프로파일링은 이 미들웨어가 만든 요청 기록을 사용하므로 하나라도 켜져 있으면 설치함
+if "true" in (QUERY_PROFILING_ENABLED, SERVER_TIMING_ENABLED, REQUEST_PROFILING_ENABLED):
+    app.add_middleware(QueryProfileMiddleware, timing_allow_origins=origins)
+# 가장 바깥에서 측정해야 RateLimitMiddleware가 거절한 요청도 함께 기록됨
+if METRICS_ENABLED == "true":
+    app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/")
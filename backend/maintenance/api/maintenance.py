@@ -0,0 +1,29 @@
+from fastapi import APIRouter, HTTPException, Query, Depends
+from backend.auth.service.session_manager import verify_admin_session
+from backend.maintenance.service.maintenance_jobs import maintenance_runner
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from backend.middleware import ProfiledRoute
+import os
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/jobs")
+def get_maintenance_jobs(
+    job: str = Query(None, description="Only return runs of this job (optional)"),
+    limit: int = Query(50, ge=1, le=500, description="Number of recent runs to return"),
+    _: None = Depends(verify_admin_session),
+):
+    try:
+        # 실행 기록은 워커마다 따로 보관되므로 어느 워커의 응답인지 함께 반환함
+        return {
+            "worker_pid": os.getpid(),
+            "is_leader": maintenance_runner.is_leader,
+            "jobs": maintenance_runner.job_status(),
+            "runs": maintenance_runner.recent_runs(job, limit),
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"유지보수 작업 정보를 불러오는 중 오류가 발생했습니다: {str(e)}",
+        )
@@ -0,0 +1,103 @@
+from backend.auth.service.session_manager import SessionManager
+from backend.log.service.user_log_manager import UserLogManager
+from backend.config import (
+    AUDIT_SPOOL_REPLAY_SECONDS,
+    LOG_BURST_FLUSH_SECONDS,
+    MAINTENANCE_LEADER_LOCK,
+    MAINTENANCE_LOCK_NAME,
+    MAINTENANCE_LOCK_FILE,
+    MAINTENANCE_JITTER_RATIO,
+    MAINTENANCE_HISTORY_SIZE,
+    SESSION_CLEANUP_SECONDS,
+    OPERATION_LOG_PURGE_SECONDS,
+    OPERATION_LOG_PURGE_MIN_SECONDS,
+    OPERATION_LOG_PURGE_MAX_BATCHES,
+    OPERATION_LOG_PURGE_BATCH_SIZE,
+    METRICS_ENABLED,
+    METRICS_SNAPSHOT_SECONDS,
+)
+from backend.database.maintenance_runner import (
+    FileLeaderLock,
+    MaintenanceJob,
+    MaintenanceRunner,
+    MySQLLeaderLock,
+)
+from backend.monitoring.service.metrics import write_metrics_snapshot
+
+session_manager = SessionManager()
+user_log_manager = UserLogManager()
+
+
+def create_leader_lock():
+    lock_type = MAINTENANCE_LEADER_LOCK
+    if lock_type == "auto":
+        lock_type = "mysql" if user_log_manager.engine.dialect.name == "mysql" else "file"
+    if lock_type == "mysql":
+        # URL 객체를 넘겨야 비밀번호가 가려지지 않은 채로 전용 연결을 만들 수 있음
+        return MySQLLeaderLock(user_log_manager.engine.url, MAINTENANCE_LOCK_NAME)
+    if lock_type == "file":
+        return FileLeaderLock(MAINTENANCE_LOCK_FILE)
+    return None
+
+
+def delete_expired_sessions():
+    stats = {}
+    session_manager.delete_expired_sessions(stats=stats)
+    return stats
+
+
+def delete_expired_logs():
+    stats = {}
+    user_log_manager.delete_expired_logs(
+        max_batches=OPERATION_LOG_PURGE_MAX_BATCHES, stats=stats
+    )
+    return stats
+
+
+maintenance_runner = MaintenanceRunner(
+    [
+        MaintenanceJob(
+            "delete_expired_sessions",
+            delete_expired_sessions,
+            interval_seconds=SESSION_CLEANUP_SECONDS,
+            backlog_age=session_manager.oldest_expired_session_age,
+        ),
+        MaintenanceJob(
+            "delete_expired_logs",
+            delete_expired_logs,
+            interval_seconds=OPERATION_LOG_PURGE_SECONDS,
+            min_interval_seconds=OPERATION_LOG_PURGE_MIN_SECONDS,
+            busy_threshold=OPERATION_LOG_PURGE_MAX_BATCHES * OPERATION_LOG_PURGE_BATCH_SIZE,
+            backlog_age=user_log_manager.oldest_expired_log_age,
+        ),
+        # 스풀 파일과 병합 중인 실패 로그는 워커마다 따로 있으므로 모든 워커에서 실행함
+        MaintenanceJob(
+            "replay_spooled_logs",
+            user_log_manager.replay_spooled_logs,
+            interval_seconds=AUDIT_SPOOL_REPLAY_SECONDS,
+            leader_only=False,
+        ),
+        MaintenanceJob(
+            "flush_log_bursts",
+            user_log_manager.flush_log_bursts,
+            interval_seconds=LOG_BURST_FLUSH_SECONDS,
+            leader_only=False,
+        ),
+    ]
+    + (
+        [
+            # /metrics가 다른 워커의 값도 합칠 수 있도록 워커마다 누적 값을 파일로 남김
+            MaintenanceJob(
+                "write_metrics_snapshot",
+                write_metrics_snapshot,
+                interval_seconds=METRICS_SNAPSHOT_SECONDS,
+                leader_only=False,
+            )
+        ]
+        if METRICS_ENABLED == "true"
+        else []
+    ),
+    leader_lock=create_leader_lock(),
+    jitter_ratio=MAINTENANCE_JITTER_RATIO,
+    history_size=MAINTENANCE_HISTORY_SIZE,
+)
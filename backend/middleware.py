@@ -1,8 +1,32 @@
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.routing import APIRoute
+from functools import wraps
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+from starlette.status import HTTP_429_TOO_MANY_REQUESTS, HTTP_500_INTERNAL_SERVER_ERROR
+from backend.config import (
+    METRICS_ENABLED,
+    QUERY_PROFILE_MAX_STATEMENTS,
+    SERVER_TIMING_ENABLED,
+    REQUEST_PROFILING_ENABLED,
+)
+from backend.database.query_profiler import (
+    current_query_profile,
+    mark_endpoint_finished,
+    profile_queries,
+)
+from backend.monitoring.service.request_profiling import request_profiler
+from backend.monitoring.service.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    HTTP_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    RATE_LIMIT_REJECTIONS,
+)
+import asyncio
+import threading
 import time
 
+SERVER_TIMING_STAGES = ("session-check", "db", "hash", "audit", "serialize")
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: FastAPI, max_requests: int = 5, window_seconds: int = 60):
@@ -21,6 +45,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 t for t in request_times if current_time - t < self.window_seconds
             ]
             if len(self.ip_cache[client_ip]) >= self.max_requests:
+                RATE_LIMIT_REJECTIONS.inc()
                 raise HTTPException(
                     status_code=HTTP_429_TOO_MANY_REQUESTS,
                     detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
@@ -33,3 +58,142 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         response = await call_next(request)
         return response
+
+
+def route_template(scope) -> str:
+    # 실제 경로를 레이블로 쓰면 사용자 ID 등으로 시계열이 무한히 늘어나므로 템플릿을 사용함
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+def server_timing_header(profile) -> str:
+    now = time.perf_counter()
+    stages = dict(profile.stages)
+    if profile.endpoint_finished is not None:
+        # 엔드포인트가 반환한 뒤 응답 헤더를 보내기 전까지는 응답 모델 검증과 JSON 변환 시간임
+        stages["serialize"] = now - profile.endpoint_finished
+    entries = [
+        f"{stage};dur={stages[stage] * 1000:.2f}"
+        for stage in SERVER_TIMING_STAGES
+        if stage in stages
+    ]
+    entries.append(f"total;dur={(now - profile.started) * 1000:.2f}")
+    return ", ".join(entries)
+
+
+def track_sampled_thread():
+    profile = current_query_profile.get()
+    sampler = getattr(profile, "sampler", None)
+    if sampler is None:
+        return None
+    thread_id = threading.get_ident()
+    sampler.track(thread_id)
+    return lambda: sampler.untrack(thread_id)
+
+
+class ProfiledRoute(APIRoute):
+    """엔드포인트가 끝난 시각을 요청 기록에 남기고, 프로파일링 중인 요청이면 동기 엔드포인트를
+    실행하는 스레드풀 스레드를 샘플러에 등록하는 라우트."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if (
+            SERVER_TIMING_ENABLED == "true" or REQUEST_PROFILING_ENABLED == "true"
+        ) and not hasattr(endpoint, "__profiled__"):
+            endpoint = self.profile_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def profile_endpoint(endpoint):
+        # FastAPI는 __wrapped__를 따라 원래 함수의 시그니처를 읽으므로 의존성 주입은 그대로 동작함
+        # 동기 엔드포인트는 관리자 확인 의존성과 다른 스레드풀 스레드에서 실행될 수 있음
+        if asyncio.iscoroutinefunction(endpoint):
+
+            @wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await endpoint(*args, **kwargs)
+                finally:
+                    mark_endpoint_finished()
+
+        else:
+
+            @wraps(endpoint)
+            def wrapper(*args, **kwargs):
+                untrack = track_sampled_thread()
+                try:
+                    return endpoint(*args, **kwargs)
+                finally:
+                    if untrack is not None:
+                        untrack()
+                    mark_endpoint_finished()
+
+        wrapper.__profiled__ = True
+        return wrapper
+
+
+class MetricsMiddleware:
+    """요청 수와 지연 시간을 라우트 경로 템플릿별로 기록하는 ASGI 미들웨어."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route_path = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method, route_path)
+            HTTP_REQUESTS.inc(method, route_path, str(status_code))
+
+
+class QueryProfileMiddleware:
+    """요청마다 SQL 문 기록을 시작해서 실행된 SQL 문을 그 요청에 귀속시키는 ASGI 미들웨어."""
+
+    def __init__(self, app, timing_allow_origins=()):
+        self.app = app
+        self.timing_allow_origins = set(timing_allow_origins)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 엔드포인트는 스레드풀에서 실행되지만 컨텍스트가 복사되므로 같은 기록에 쌓임
+        with profile_queries(
+            f"{scope['method']} {scope['path']}", QUERY_PROFILE_MAX_STATEMENTS
+        ) as profile:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    headers = [
+                        (b"server-timing", server_timing_header(profile).encode("latin-1"))
+                    ]
+                    # 다른 출처의 프론트엔드가 Resource Timing API로 값을 읽으려면 허용 출처가 필요함
+                    origin = dict(scope["headers"]).get(b"origin", b"").decode("latin-1")
+                    if origin in self.timing_allow_origins:
+                        headers.append((b"timing-allow-origin", origin.encode("latin-1")))
+                    message["headers"] = list(message.get("headers", [])) + headers
+                await send(message)
+
+            try:
+                await self.app(
+                    scope, receive, send_wrapper if SERVER_TIMING_ENABLED == "true" else send
+                )
+            finally:
+                if METRICS_ENABLED == "true":
+                    DB_QUERIES_PER_REQUEST.observe(profile.count, route_template(scope))
+                if profile.sampler is not None:
+                    await asyncio.to_thread(request_profiler.finish, profile.sampler)
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, HTTPException, Header
+from fastapi.responses import PlainTextResponse
+from backend.config import METRICS_BEARER_TOKEN
+from backend.monitoring.service.metrics import registry
+from starlette.status import (
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+)
+from backend.middleware import ProfiledRoute
+import hmac
+
+router = APIRouter(route_class=ProfiledRoute)
+
+# PlainTextResponse가 charset을 붙이므로 여기서는 넣지 않음
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics(authorization: str = Header(None)):
+    # 지표에는 경로별 지연 시간과 요청 제한 현황이 담기므로 토큰이 없으면 제공하지 않음
+    if not METRICS_BEARER_TOKEN:
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN,
+            detail="METRICS_BEARER_TOKEN이 설정되지 않아 지표를 제공하지 않습니다.",
+        )
+    # 수집기는 로그인 세션을 쓸 수 없으므로 Bearer 토큰으로 인증함
+    if not hmac.compare_digest(
+        authorization or "", f"Bearer {METRICS_BEARER_TOKEN}"
+    ):
+        raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="인증되지 않은 요청입니다.")
+    try:
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"지표를 불러오는 중 오류가 발생했습니다: {str(e)}",
+        )
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, HTTPException, Depends
+from backend.auth.service.session_manager import verify_admin_session
+from backend.config import SERVICE_METRICS_ENABLED
+from backend.monitoring.service.metrics import service_method_stats
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from backend.middleware import ProfiledRoute
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/service-methods")
+def get_service_method_stats(_: None = Depends(verify_admin_session)):
+    try:
+        # 분위수는 모든 워커의 히스토그램을 합친 뒤 계산함
+        return {
+            "enabled": SERVICE_METRICS_ENABLED == "true",
+            "methods": service_method_stats(),
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서비스 메서드 통계를 불러오는 중 오류가 발생했습니다: {str(e)}",
+        )
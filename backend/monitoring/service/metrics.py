@@ -0,0 +1,166 @@
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from backend.config import (
+    METRICS_ENABLED,
+    METRICS_DIR,
+    METRICS_STALE_SECONDS,
+    SLOW_QUERY_THRESHOLD_MS,
+)
+from backend.database.metrics_registry import (
+    MetricsRegistry,
+    bucket_percentile,
+    log_linear_buckets,
+)
+from backend.database.query_profiler import QueryProfiler
+from functools import wraps
+import time
+
+registry = MetricsRegistry(METRICS_DIR, stale_seconds=METRICS_STALE_SECONDS)
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "Number of HTTP requests by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+RATE_LIMIT_REJECTIONS = registry.counter(
+    "rate_limit_rejections_total",
+    "Number of requests rejected by RateLimitMiddleware.",
+)
+DB_POOL_CHECKOUTS = registry.counter(
+    "db_pool_checkouts_total",
+    "Number of connections checked out from the pool.",
+    ("pool",),
+)
+DB_POOL_CONNECTS = registry.counter(
+    "db_pool_connects_total",
+    "Number of new database connections opened by the pool, including overflow.",
+    ("pool",),
+)
+DB_POOL_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+DB_POOL_CHECKED_OUT = registry.gauge(
+    "db_pool_checked_out", "Connections currently checked out.", ("pool",)
+)
+DB_POOL_OVERFLOW = registry.gauge(
+    "db_pool_overflow", "Overflow connections currently open beyond pool_size.", ("pool",)
+)
+DB_POOL_SIZE = registry.gauge("db_pool_size", "Configured pool_size.", ("pool",))
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time.",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request",
+    "Number of SQL statements executed per HTTP request.",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+# 약 30µs부터 32초까지, 상대 오차 25% 이내
+SERVICE_METHOD_DURATION = registry.histogram(
+    "service_method_duration_seconds",
+    "Latency of BaseManager service methods.",
+    ("method",),
+    buckets=log_linear_buckets(-15, 5),
+)
+SERVICE_METHOD_EXCEPTIONS = registry.counter(
+    "service_method_exceptions_total",
+    "Exceptions raised by BaseManager service methods.",
+    ("method", "exception"),
+)
+
+query_profiler = QueryProfiler(
+    slow_query_seconds=SLOW_QUERY_THRESHOLD_MS / 1000,
+    on_query=(
+        (lambda pool_name, duration: DB_QUERY_DURATION.observe(duration, pool_name))
+        if METRICS_ENABLED == "true"
+        else None
+    ),
+)
+
+
+class TimedQueuePool(QueuePool):
+    """연결을 얻기까지 기다린 시간을 연결 정보에 남기는 QueuePool."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        record = super()._do_get()
+        record.info["pool_wait_seconds"] = time.perf_counter() - started
+        return record
+
+
+def instrument_engine(engine, pool_name: str):
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc(pool_name)
+        wait_seconds = connection_record.info.pop("pool_wait_seconds", None)
+        if wait_seconds is not None:
+            DB_POOL_WAIT.observe(wait_seconds, pool_name)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        DB_POOL_CONNECTS.inc(pool_name)
+
+    # engine.dispose()는 풀을 새로 만들므로 수집할 때마다 현재 풀을 읽음
+    if isinstance(engine.pool, QueuePool):
+        DB_POOL_CHECKED_OUT.add_callback(lambda: {(pool_name,): engine.pool.checkedout()})
+        DB_POOL_OVERFLOW.add_callback(lambda: {(pool_name,): max(engine.pool.overflow(), 0)})
+        DB_POOL_SIZE.add_callback(lambda: {(pool_name,): engine.pool.size()})
+
+
+def instrument_method(qualified_name: str, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            SERVICE_METHOD_EXCEPTIONS.inc(qualified_name, type(e).__name__)
+            raise
+        finally:
+            SERVICE_METHOD_DURATION.observe(time.perf_counter() - started, qualified_name)
+
+    return wrapper
+
+
+def service_method_stats() -> list[dict]:
+    merged = registry.merge(registry.read_snapshots())
+    durations = merged[SERVICE_METHOD_DURATION.name]
+    exceptions = {}
+    for (method, _), count in merged[SERVICE_METHOD_EXCEPTIONS.name]["samples"].items():
+        exceptions[method] = exceptions.get(method, 0) + count
+
+    stats = []
+    for (method,), (counts, total) in durations["samples"].items():
+        calls = sum(counts)
+        percentiles = {
+            f"p{int(quantile * 100)}_ms": round(
+                bucket_percentile(durations["buckets"], counts, quantile) * 1000, 3
+            )
+            for quantile in (0.5, 0.95, 0.99)
+        }
+        stats.append(
+            {
+                "method": method,
+                "calls": calls,
+                "exceptions": exceptions.get(method, 0),
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total * 1000 / calls, 3),
+                **percentiles,
+            }
+        )
+    return sorted(stats, key=lambda stat: stat["total_ms"], reverse=True)
+
+
+def write_metrics_snapshot():
+    registry.write_snapshot()
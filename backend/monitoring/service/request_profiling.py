@@ -0,0 +1,50 @@
+from fastapi import Request
+import asyncio
+from backend.config import (
+    REQUEST_PROFILE_DIR,
+    REQUEST_PROFILE_MAX_PER_WINDOW,
+    REQUEST_PROFILE_WINDOW_SECONDS,
+    REQUEST_PROFILE_INTERVAL_MS,
+    REQUEST_PROFILE_MAX_SECONDS,
+    REQUEST_PROFILE_MAX_FILES,
+)
+from backend.database.query_profiler import current_query_profile
+from backend.database.sampling_profiler import RequestProfiler
+import os
+
+PROFILE_HEADER = "X-Profile"
+
+request_profiler = RequestProfiler(
+    REQUEST_PROFILE_DIR,
+    max_profiles=REQUEST_PROFILE_MAX_PER_WINDOW,
+    window_seconds=REQUEST_PROFILE_WINDOW_SECONDS,
+    interval_seconds=REQUEST_PROFILE_INTERVAL_MS / 1000,
+    max_seconds=REQUEST_PROFILE_MAX_SECONDS,
+    max_files=REQUEST_PROFILE_MAX_FILES,
+)
+
+
+def wants_request_profile(request: Request) -> bool:
+    return (
+        request.headers.get(PROFILE_HEADER) == "1"
+        or request.query_params.get("profile") == "1"
+    )
+
+
+def start_request_profile(request: Request) -> str:
+    """현재 요청의 샘플링을 시작하고 응답 헤더에 넣을 결과(파일 이름 또는 거절 사유)를 반환함."""
+    profile = current_query_profile.get()
+    if profile is None:
+        return "unavailable"
+    # async 엔드포인트는 이벤트 루프 스레드에서 실행되어 다른 요청의 스택이 함께 샘플링되므로
+    # 스레드풀에서 실행되는 동기 엔드포인트만 프로파일링함
+    if asyncio.iscoroutinefunction(request.scope.get("endpoint")):
+        return "unsupported"
+    if profile.sampler is not None:
+        return os.path.basename(profile.sampler.path)
+    sampler = request_profiler.start(f"{request.method} {request.url.path}")
+    if sampler is None:
+        return "rate-limited"
+    # 엔드포인트가 실행되는 스레드는 ProfiledRoute가 샘플러에 등록함
+    profile.sampler = sampler
+    return os.path.basename(sampler.path)
@@ -1,4 +1,40 @@
 import sys
 import os
+import tempfile
+import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# backend.config는 import할 때 환경 변수를 읽으므로 테스트 모듈이 import되기 전에 설정함
+# 환경 변수로 MySQL 등 다른 데이터베이스를 지정하면 그 값을 그대로 사용함
+_test_dir = tempfile.mkdtemp(prefix="backend_tests_")
+for _name, _value in (
+    ("MYSQL_DATABASE_URI", f"sqlite:///{_test_dir}/main.db"),
+    ("SESSION_DATABASE_URI", f"sqlite:///{_test_dir}/session.db"),
+    ("DEFAULT_ROOT_ACCOUNT_ID", "root"),
+    ("DEFAULT_ROOT_ACCOUNT_PASSWORD", "root_password"),
+    ("DATA_DIR", _test_dir),
+    # 서비스 메서드 계측은 기본으로 꺼져 있으므로 계측 테스트를 위해 켬
+    ("SERVICE_METRICS_ENABLED", "true"),
+    ("AUDIT_SPOOL_DIR", os.path.join(_test_dir, "spool")),
+    ("OPERATION_LOG_ARCHIVE_DIR", os.path.join(_test_dir, "archive")),
+    ("METRICS_DIR", os.path.join(_test_dir, "metrics")),
+    ("REQUEST_PROFILE_DIR", os.path.join(_test_dir, "profiles")),
+    ("MAINTENANCE_LOCK_FILE", os.path.join(_test_dir, "maintenance.lock")),
+):
+    os.environ.setdefault(_name, _value)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from fastapi.testclient import TestClient
+    from backend.auth.service import session_manager as session_manager_module
+    from backend.main import app, session_manager, user_log_manager, user_manager
+
+    # 다른 테스트 모듈이 싱글턴의 get_session을 Mock으로 바꿔두므로 이 테스트 동안은 실제 DB를 사용함
+    for manager in (session_manager, user_manager, user_log_manager):
+        if "get_session" in vars(manager):
+            monkeypatch.delattr(manager, "get_session")
+    # 세션 연장 경로를 타지 않도록 만료 시간을 넉넉하게 잡음
+    monkeypatch.setattr(session_manager_module, "SESSION_EXPIRE_MINUTE", 600)
+    return TestClient(app)
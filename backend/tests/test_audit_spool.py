@@ -0,0 +1,76 @@
+import os
+from backend.log.service.audit_spool import AuditSpool
+
+
+def make_record(index):
+    return {
+        "user_id": f"spool_user_{index}",
+        "action": "로그인",
+        "success": False,
+        "error_code": 401,
+        "details": None,
+        "log_timestamp": "2024-01-01T00:00:00+09:00",
+    }
+
+
+# 1. 기록 후 봉인된 세그먼트를 재처리 대상으로 가져오는지 테스트
+def test_append_seal_and_claim(tmp_path):
+    spool = AuditSpool(str(tmp_path))
+    for index in range(3):
+        spool.append(make_record(index))
+    spool.seal()
+
+    claimed = list(spool.claim_segments())
+
+    assert len(claimed) == 1
+    claimed_path, records = claimed[0]
+    assert [record["user_id"] for record in records] == [
+        "spool_user_0",
+        "spool_user_1",
+        "spool_user_2",
+    ]
+    spool.complete(claimed_path)
+    assert os.listdir(tmp_path) == []
+
+
+# 2. 열려 있는 세그먼트는 재처리하지 않음
+def test_open_segment_is_not_claimed(tmp_path):
+    spool = AuditSpool(str(tmp_path))
+    spool.append(make_record(0))
+
+    assert list(spool.claim_segments()) == []
+
+
+# 3. 세그먼트 크기 초과 시 회전 테스트
+def test_segment_rotation(tmp_path):
+    spool = AuditSpool(str(tmp_path), segment_max_bytes=1)
+    spool.append(make_record(0))
+    spool.append(make_record(1))
+
+    claimed = list(spool.claim_segments())
+
+    assert len(claimed) == 2
+
+
+# 4. 재처리 실패 시 세그먼트를 되돌리는지 테스트
+def test_release_returns_segment(tmp_path):
+    spool = AuditSpool(str(tmp_path))
+    spool.append(make_record(0))
+    spool.seal()
+
+    claimed_path, _ = next(spool.claim_segments())
+    spool.release(claimed_path)
+
+    assert len(list(spool.claim_segments())) == 1
+
+
+# 5. 종료된 프로세스가 남긴 세그먼트와 잘린 마지막 줄 복구 테스트
+def test_recovers_orphaned_segment_with_torn_tail(tmp_path):
+    orphan = tmp_path / "audit-999999999-1.open"
+    orphan.write_bytes(b'{"user_id": "orphan"}\n{"user_id": "tor')
+
+    spool = AuditSpool(str(tmp_path))
+    claimed = list(spool.claim_segments())
+
+    assert len(claimed) == 1
+    assert claimed[0][1] == [{"user_id": "orphan"}]
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+from backend.database.count_cache import CountCache
+
+
+# 1. 필터 정규화 테스트
+def test_make_key_ignores_none_and_order():
+    key1 = CountCache.make_key(user_id="a", success=None, role="admin")
+    key2 = CountCache.make_key(role="admin", user_id="a")
+
+    assert key1 == key2
+    assert key1 == (("role", "admin"), ("user_id", "a"))
+
+
+# 2. TTL 내 재사용 테스트
+def test_get_or_compute_uses_cached_value():
+    cache = CountCache(ttl_seconds=60)
+    compute = MagicMock(return_value=42)
+
+    assert cache.get_or_compute(("k",), compute) == 42
+    assert cache.get_or_compute(("k",), compute) == 42
+    compute.assert_called_once()
+
+
+# 3. TTL 만료 테스트
+def test_expired_entry_is_recomputed():
+    cache = CountCache(ttl_seconds=-1)
+    cache.set(("k",), 1)
+
+    assert cache.get(("k",)) is None
+
+
+# 4. 쓰기 시 무효화 테스트
+def test_invalidate_with_predicate():
+    cache = CountCache(ttl_seconds=60)
+    cache.set(CountCache.make_key(user_id="alice"), 1)
+    cache.set(CountCache.make_key(user_id="bob"), 2)
+
+    cache.invalidate(lambda filters: filters.get("user_id") == "alice")
+
+    assert cache.get(CountCache.make_key(user_id="alice")) is None
+    assert cache.get(CountCache.make_key(user_id="bob")) == 2
+
+
+# 5. 계산 중 무효화된 값은 저장하지 않음
+def test_compute_racing_with_invalidate_is_not_stored():
+    cache = CountCache(ttl_seconds=60)
+
+    def compute():
+        cache.invalidate()
+        return 7
+
+    assert cache.get_or_compute(("k",), compute) == 7
+    assert cache.get(("k",)) is None
+
+
+# 6. 최대 항목 수 제한 테스트
+def test_max_entries_evicts_oldest():
+    cache = CountCache(ttl_seconds=60, max_entries=2)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    cache.set(("c",), 3)
+
+    assert cache.get(("a",)) is None
+    assert cache.get(("c",)) == 3
+
+
+# 7. 캐시된 개수 증감과 판단할 수 없는 항목 제거 테스트
+def test_adjust_updates_cached_counts():
+    cache = CountCache(ttl_seconds=60)
+    cache.set(CountCache.make_key(is_locked=True), 10)
+    cache.set(CountCache.make_key(is_locked=True, user_id="kim"), 1)
+    cache.set(CountCache.make_key(), 100)
+
+    cache.adjust(
+        lambda filters: None if "user_id" in filters else (1 if filters.get("is_locked") else 0)
+    )
+
+    assert cache.get(CountCache.make_key(is_locked=True)) == 11
+    assert cache.get(CountCache.make_key(is_locked=True, user_id="kim")) is None
+    assert cache.get(CountCache.make_key()) == 100
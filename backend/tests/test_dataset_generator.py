@@ -0,0 +1,44 @@
+import sqlite3
+import sys
+from backend.benchmarks import dataset_generator
+
+
+def generate(monkeypatch, path, *extra):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "dataset_generator",
+            "--database-uri", f"sqlite:///{path}",
+            "--users", "500",
+            "--sessions", "1000",
+            "--logs", "5000",
+            "--end-date", "2026-01-31",
+            *extra,
+        ],
+    )
+    dataset_generator.main()
+    connection = sqlite3.connect(path)
+    try:
+        return {
+            table: connection.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3").fetchall()
+            for table in ("user", "session", "user_log", "user_log_daily_rollup")
+        }
+    finally:
+        connection.close()
+
+
+# 1. 같은 시드로 생성하면 같은 데이터가 만들어지고 집계가 로그 수와 맞는지 테스트
+def test_dataset_is_deterministic(tmp_path, monkeypatch):
+    first = generate(monkeypatch, tmp_path / "first.db")
+    second = generate(monkeypatch, tmp_path / "second.db")
+    other = generate(monkeypatch, tmp_path / "other.db", "--seed", "7")
+
+    assert first == second
+    assert first["user"] != other["user"]
+    assert len(first["user"]) == 500 and len(first["session"]) == 1000
+    assert sum(row[-1] for row in first["user_log_daily_rollup"]) == 5000
+    connection = sqlite3.connect(tmp_path / "first.db")
+    (failures,) = connection.execute("SELECT COUNT(*) FROM user_log WHERE success = 0").fetchone()
+    connection.close()
+    assert 0 < failures < 5000 * 0.3
@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta
+from backend.log.service.log_archive import BloomFilter, LogArchive
+
+
+def make_rows(start, count, user_id="archive_user", step_minutes=30):
+    return [
+        {
+            "id": i,
+            "user_id": f"{user_id}{i % 3}",
+            "action": "로그인",
+            "success": i % 2 == 0,
+            "error_code": None if i % 2 == 0 else 401,
+            "details": "사용자가 성공적으로 로그인했습니다.",
+            "log_timestamp": start + timedelta(minutes=step_minutes * i),
+        }
+        for i in range(count)
+    ]
+
+
+# 1. 날짜별 세그먼트로 저장하고 최신순으로 조회하는지 테스트
+def test_write_and_search_newest_first(tmp_path):
+    archive = LogArchive(str(tmp_path), block_rows=4)
+    archive.write(make_rows(datetime(2024, 1, 1, 20, 0), 10))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2024-01-01", "2024-01-02"]
+
+    rows = archive.search()
+    assert [row["id"] for row in rows] == list(range(9, -1, -1))
+    assert rows[0]["log_timestamp"] == datetime(2024, 1, 2, 0, 30)
+
+    page = archive.search(offset=2, limit=3)
+    assert [row["id"] for row in page] == [7, 6, 5]
+
+
+# 2. 조건 필터와 개수 조회 테스트
+def test_search_and_count_with_filters(tmp_path):
+    archive = LogArchive(str(tmp_path), block_rows=4)
+    archive.write(make_rows(datetime(2024, 1, 1, 0, 0), 12))
+
+    start = datetime(2024, 1, 1, 1, 0)
+    end = datetime(2024, 1, 1, 4, 0)
+    assert archive.count() == 12
+    assert archive.count(start=start, end=end) == 7
+    assert archive.count(success=False, start=start, end=end) == 3
+
+    rows = archive.search(user_id="ARCHIVE_USER1", search_mode="exact")
+    assert [row["id"] for row in rows] == [10, 7, 4, 1]  # 대소문자를 구분하지 않음
+    assert archive.count(user_id="user2", search_mode="contains") == 4
+
+
+# 3. Bloom 필터로 해당 사용자가 없는 세그먼트는 읽지 않는지 테스트
+def test_exact_search_skips_segments_by_bloom_filter(tmp_path, monkeypatch):
+    archive = LogArchive(str(tmp_path))
+    archive.write(make_rows(datetime(2024, 1, 1), 5, user_id="first"))
+    archive.write(make_rows(datetime(2024, 1, 1, 12), 5, user_id="second"))
+
+    read_paths = []
+    original_read_block = archive._read_block
+    monkeypatch.setattr(
+        archive,
+        "_read_block",
+        lambda path, block: read_paths.append(path) or original_read_block(path, block),
+    )
+
+    rows = archive.search(user_id="second1", search_mode="exact")
+
+    assert [row["user_id"] for row in rows] == ["second1", "second1"]
+    assert len(set(read_paths)) == 1
+
+
+# 4. 보관 기간이 지난 날짜 삭제 및 기록 취소 테스트
+def test_purge_and_discard(tmp_path):
+    archive = LogArchive(str(tmp_path))
+    archive.write(make_rows(datetime(2024, 1, 1), 1))
+    written = archive.write(make_rows(datetime(2024, 1, 3), 1))
+
+    assert archive.purge_before(date(2024, 1, 2)) == 1
+    assert archive.count() == 1
+
+    archive.discard(written)
+    assert archive.count() == 0
+
+
+# 5. Bloom 필터 직렬화 테스트
+def test_bloom_filter_round_trip():
+    bloom = BloomFilter.for_capacity(100)
+    for i in range(100):
+        bloom.add(f"user{i}")
+
+    restored = BloomFilter.from_dict(bloom.to_dict())
+
+    assert all(f"user{i}" in restored for i in range(100))
+    assert sum(f"other{i}" in restored for i in range(1000)) < 50
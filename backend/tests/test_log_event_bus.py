@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from backend.log.service.log_event_bus import LogEventBus
+
+
+def make_event(user_id="stream_user", success=True):
+    return {
+        "id": 1,
+        "user_id": user_id,
+        "action": "로그인",
+        "success": success,
+        "error_code": None,
+        "details": None,
+        "log_timestamp": None,
+    }
+
+
+# 1. 구독 조건에 맞는 이벤트만 전달되는지 테스트
+def test_publish_delivers_matching_events():
+    async def scenario():
+        bus = LogEventBus()
+        subscription = bus.subscribe(user_id="stream", success=False)
+
+        bus.publish(make_event("stream_user", True))
+        bus.publish(make_event("other_user", False))
+        bus.publish(make_event("STREAM_user", False))
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event["user_id"] == "STREAM_user"
+        assert subscription.queue.empty()
+
+    asyncio.run(scenario())
+
+
+# 2. 다른 스레드에서 발행한 이벤트 전달 테스트
+def test_publish_from_worker_thread():
+    async def scenario():
+        bus = LogEventBus()
+        subscription = bus.subscribe()
+
+        thread = threading.Thread(target=bus.publish, args=(make_event(),))
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event["user_id"] == "stream_user"
+
+    asyncio.run(scenario())
+
+
+# 3. 버퍼가 가득 찬 느린 구독자는 종료 신호를 받고 더 이상 이벤트를 받지 않는지 테스트
+def test_slow_subscriber_is_dropped():
+    async def scenario():
+        bus = LogEventBus(max_queued=2)
+        slow = bus.subscribe()
+        for _ in range(3):
+            bus.publish(make_event())
+        await asyncio.sleep(0)
+
+        assert slow.dropped is True
+        assert await slow.get() is None
+
+        bus.publish(make_event())
+        await asyncio.sleep(0)
+        assert slow.queue.empty()
+
+        bus.unsubscribe(slow)
+        assert bus.subscriber_count() == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,63 @@
+import pytest
+from backend.log.database.log_templates import (
+    LOG_ACTIONS,
+    LOG_DETAIL_TEMPLATES,
+    compact_action,
+    compact_details,
+    render_action,
+    render_details,
+)
+from backend.log.database.models import UserLog
+
+
+# 1. 모든 상세 설명 템플릿이 저장 후 원문 그대로 복원되는지 테스트
+@pytest.mark.parametrize("template_id", sorted(LOG_DETAIL_TEMPLATES))
+def test_details_round_trip(template_id):
+    details = LOG_DETAIL_TEMPLATES[template_id].format(
+        user_id="kim`lee",
+        role="admin",
+        error="잘못된 요청입니다. {x}",
+        created=10,
+        duplicate=2,
+        invalid=0,
+        count=3,
+    )
+
+    stored_template, params, text = compact_details(details)
+
+    assert stored_template == template_id
+    assert text is None
+    assert render_details(stored_template, params, text) == details
+
+
+# 2. 템플릿에 없는 상세 설명은 원문으로 저장되는지 테스트
+def test_unknown_details_stored_as_text():
+    assert compact_details("임의의 설명") == (None, None, "임의의 설명")
+    assert compact_details(None) == (None, None, None)
+
+
+# 3. 작업명 코드 변환 테스트
+def test_action_codes():
+    for code, name in LOG_ACTIONS.items():
+        assert compact_action(name) == (code, None)
+        assert render_action(code, None) == name
+
+    assert compact_action("알 수 없는 작업") == (None, "알 수 없는 작업")
+    assert render_action(None, "알 수 없는 작업") == "알 수 없는 작업"
+
+
+# 4. 모델 속성으로 설정한 값이 압축되어 저장되고 그대로 읽히는지 테스트
+def test_user_log_properties():
+    log = UserLog(
+        user_id="kim",
+        action="사용자 생성",
+        success=True,
+        details="사용자 `kim`이(가) `admin` 권한으로 생성되었습니다.",
+    )
+
+    assert log.action_code == 5
+    assert log.action_text is None
+    assert log.details_template == 10
+    assert log.details_text is None
+    assert log.action == "사용자 생성"
+    assert log.details == "사용자 `kim`이(가) `admin` 권한으로 생성되었습니다."
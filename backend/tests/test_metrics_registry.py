@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+import time
+import pytest
+from fastapi import HTTPException
+from backend.database.metrics_registry import (
+    MetricsRegistry,
+    bucket_percentile,
+    log_linear_buckets,
+)
+from backend.monitoring.api import metrics as metrics_api
+
+
+# 1. 여러 스레드에서 올린 카운터 값이 수집할 때 합쳐지는지 테스트
+def test_counter_merges_thread_shards():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "요청 수", ("route",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("/api/login")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc("/api/user", amount=2)
+
+    samples = {tuple(labels): value for labels, value in counter.collect()}
+    assert samples == {("/api/login",): 4000, ("/api/user",): 2}
+
+
+# 2. 히스토그램이 누적 구간, 합계, 개수 형식으로 출력되는지 테스트
+def test_histogram_exposition():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "지연 시간", ("route",), buckets=(0.1, 1))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(3, "/a")
+
+    text = registry.render()
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_sum{route="/a"} 3.55' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+
+
+# 3. 다른 워커의 스냅샷을 합치고 오래된 스냅샷은 삭제하는지 테스트
+def test_render_aggregates_worker_snapshots(tmp_path):
+    registry = MetricsRegistry(str(tmp_path), stale_seconds=60)
+    counter = registry.counter("requests_total", "요청 수")
+    registry.gauge("spool_bytes", "스풀 크기", aggregate="max").add_callback(lambda: 10)
+    registry.gauge("checked_out", "사용 중인 연결").add_callback(lambda: 1)
+    counter.inc(amount=3)
+
+    other = {
+        "requests_total": {"type": "counter", "help": "요청 수", "labels": [], "samples": [[[], 4]]},
+        "spool_bytes": {
+            "type": "gauge", "help": "스풀 크기", "labels": [], "aggregate": "max",
+            "samples": [[[], 7]],
+        },
+        "checked_out": {
+            "type": "gauge", "help": "사용 중인 연결", "labels": [], "aggregate": "sum",
+            "samples": [[[], 2]],
+        },
+    }
+    (tmp_path / "99999991.json").write_text(json.dumps(other))
+    stale_path = tmp_path / "99999992.json"
+    stale_path.write_text(json.dumps(other))
+    old = time.time() - 120
+    os.utime(stale_path, (old, old))
+
+    text = registry.render()
+
+    assert "requests_total 7" in text
+    assert "spool_bytes 10" in text
+    assert "checked_out 3" in text
+    assert not stale_path.exists()
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+
+
+# 4. 레이블 값의 따옴표와 줄바꿈이 이스케이프되는지 테스트
+def test_label_values_escaped():
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "오류 수", ("detail",)).inc('a"b\nc')
+
+    assert 'errors_total{detail="a\\"b\\nc"} 1' in registry.render()
+
+
+# 5. HDR 방식 구간 경계와 분위수 추정 테스트
+def test_log_linear_buckets_and_percentile():
+    buckets = log_linear_buckets(-2, 1, sub_buckets=4)
+    assert buckets == (0.25, 0.3125, 0.375, 0.4375, 0.5, 0.625, 0.75, 0.875, 1, 1.25, 1.5, 1.75, 2)
+
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "지연 시간", buckets=buckets)
+    for value in [0.3] * 50 + [0.9] * 45 + [1.9] * 5:
+        histogram.observe(value)
+    [[_, counts, _]] = histogram.collect()
+
+    assert 0.25 < bucket_percentile(buckets, counts, 0.5) <= 0.3125
+    assert 0.875 < bucket_percentile(buckets, counts, 0.95) <= 1
+    assert 1.75 < bucket_percentile(buckets, counts, 0.99) <= 2
+    assert bucket_percentile(buckets, [0] * (len(buckets) + 1), 0.5) is None
+
+
+# 6. 토큰이 설정되지 않으면 /metrics를 제공하지 않고, 설정되면 토큰으로 인증하는지 테스트
+def test_metrics_endpoint_requires_token(monkeypatch):
+    with pytest.raises(HTTPException) as excinfo:
+        metrics_api.get_metrics(authorization=None)
+    assert excinfo.value.status_code == 403
+
+    monkeypatch.setattr(metrics_api, "METRICS_BEARER_TOKEN", "secret")
+    with pytest.raises(HTTPException) as excinfo:
+        metrics_api.get_metrics(authorization="Bearer wrong")
+    assert excinfo.value.status_code == 401
+
+    response = metrics_api.get_metrics(authorization="Bearer secret")
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
@@ -0,0 +1,40 @@
+import hashlib
+from backend.config import DEFAULT_ROOT_ACCOUNT_ID, DEFAULT_ROOT_ACCOUNT_PASSWORD
+from backend.database.query_profiler import assert_max_queries
+from backend.main import user_manager
+
+
+def login(client):
+    return client.post(
+        "/api/login",
+        json={
+            "user_id": DEFAULT_ROOT_ACCOUNT_ID,
+            "password": hashlib.sha256(DEFAULT_ROOT_ACCOUNT_PASSWORD.encode("utf-8")).hexdigest(),
+        },
+    )
+
+
+# 1. 로그인: 사용자 조회/갱신, 감사 로그와 집계, 세션 생성만 실행하는지 테스트
+def test_login_query_budget(client):
+    user_manager.user_cache.invalidate()
+    with assert_max_queries(6, label="POST /api/login (cold)"):
+        assert login(client).status_code == 200
+
+    # 캐시된 스냅샷으로 로그인하면 사용자 조회 없이 조건부 UPDATE 한 번만 실행함
+    with assert_max_queries(4, label="POST /api/login (cached)"):
+        assert login(client).status_code == 200
+
+
+# 2. 사용자 목록: 세션 확인, 개수, 목록 조회만 실행하는지 테스트
+def test_user_list_query_budget(client):
+    assert login(client).status_code == 200
+    user_manager.count_cache.invalidate()
+
+    with assert_max_queries(3, label="GET /api/user/"):
+        response = client.get("/api/user/", params={"per_page": 10})
+
+    assert response.status_code == 200
+
+    # 개수는 캐시되므로 두 번째 조회에서는 세션 확인과 목록 조회만 실행함
+    with assert_max_queries(2, label="GET /api/user/ (count cached)"):
+        assert client.get("/api/user/", params={"per_page": 10}).status_code == 200
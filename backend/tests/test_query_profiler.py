@@ -0,0 +1,156 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine, text
+from backend.database.query_profiler import (
+    QueryProfiler,
+    assert_max_queries,
+    mark_endpoint_finished,
+    normalize_statement,
+    profile_queries,
+    timed_stage,
+)
+from backend import middleware
+from backend.middleware import server_timing_header
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(text("INSERT INTO item (name) VALUES ('a'), ('b'), ('c')"))
+    yield engine
+    engine.dispose()
+
+
+# 1. 바인딩 변수, 리터럴, IN 목록이 정규화되는지 테스트
+def test_normalize_statement():
+    assert (
+        normalize_statement("SELECT *\n  FROM user\n WHERE id IN (%(id_1_1)s, %(id_1_2)s) LIMIT 25")
+        == "SELECT * FROM user WHERE id IN (?, ...) LIMIT ?"
+    )
+    assert (
+        normalize_statement("SELECT * FROM user_log WHERE user_id = 'kim' AND id > :id_1")
+        == "SELECT * FROM user_log WHERE user_id = ? AND id > ?"
+    )
+
+
+# 2. 실행된 SQL 문이 현재 기록에 실행 시간, 행 수와 함께 남는지 테스트
+def test_profile_records_statements(engine):
+    QueryProfiler(slow_query_seconds=0).instrument(engine, "test")
+
+    with profile_queries("GET /items") as profile:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM item WHERE id IN (1, 2)")).fetchall()
+            connection.execute(text("UPDATE item SET name = 'x' WHERE id < 3"))
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert profile.count == 2
+    summary = profile.summary()
+    assert summary[0]["statement"] == "SELECT * FROM item WHERE id IN (?, ...)"
+    assert summary[1]["rows"] == 2
+    assert all(entry["pool"] == "test" and entry["duration_ms"] >= 0 for entry in summary)
+
+
+# 3. 기준보다 느린 SQL 문이 요청 정보와 함께 느린 쿼리 로그에 남는지 테스트
+def test_slow_query_log(engine, capsys):
+    recorded = []
+    profiler = QueryProfiler(
+        slow_query_seconds=0.000001,
+        on_query=lambda pool_name, duration: recorded.append(pool_name),
+    )
+    profiler.instrument(engine, "test")
+
+    with profile_queries("POST /api/login"):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM item WHERE name = 'a'"))
+
+    output = capsys.readouterr().out
+    assert "[SlowQuery]" in output
+    assert "request=POST /api/login" in output
+    assert "SELECT * FROM item WHERE name = ?" in output
+    assert recorded == ["test"]
+
+
+# 4. 허용된 개수보다 많은 SQL 문이 실행되면 실행된 SQL 문과 함께 실패하는지 테스트
+def test_assert_max_queries(engine):
+    QueryProfiler(slow_query_seconds=0).instrument(engine, "test")
+
+    with assert_max_queries(1):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    with pytest.raises(AssertionError) as exc_info:
+        with assert_max_queries(1, label="items"):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+    assert "items executed 2 queries (max 1)" in str(exc_info.value)
+    assert "[test] SELECT ?" in str(exc_info.value)
+
+
+# 5. 단계 안에서 실행된 SQL 문은 db 단계에서 빠지고 Server-Timing 헤더에 단계별로 표시되는지 테스트
+def test_stages_and_server_timing(engine):
+    QueryProfiler(slow_query_seconds=0).instrument(engine, "test")
+
+    @timed_stage("audit")
+    def write_audit():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    with profile_queries("GET /items") as profile:
+        with timed_stage("session-check"):
+            pass
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM item"))
+        write_audit()
+        mark_endpoint_finished()
+        header = server_timing_header(profile)
+
+    assert profile.count == 2
+    assert profile.stages["db"] < profile.total_seconds
+    assert profile.stages["audit"] >= profile.total_seconds - profile.stages["db"]
+    names = [entry.split(";")[0] for entry in header.split(", ")]
+    assert names == ["session-check", "db", "audit", "serialize", "total"]
+    assert all(";dur=" in entry for entry in header.split(", "))
+
+    # 기록 중인 요청이 없으면 단계 시간을 재지 않음
+    with timed_stage("hash"):
+        pass
+    assert "hash" not in profile.stages
+
+
+# 6. 허용된 출처의 요청에만 Server-Timing을 읽을 수 있도록 Timing-Allow-Origin을 붙이는지 테스트
+def test_server_timing_allows_configured_origins(monkeypatch):
+    monkeypatch.setattr(middleware, "SERVER_TIMING_ENABLED", "true")
+
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    app = middleware.QueryProfileMiddleware(
+        endpoint, timing_allow_origins=["http://localhost:5173"]
+    )
+
+    def request(origin):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"origin", origin.encode("latin-1"))],
+        }
+        asyncio.run(app(scope, None, send))
+        return dict(messages[0]["headers"])
+
+    headers = request("http://localhost:5173")
+    assert headers[b"server-timing"].startswith(b"total;dur=")
+    assert headers[b"timing-allow-origin"] == b"http://localhost:5173"
+    assert b"timing-allow-origin" not in request("http://evil.example")
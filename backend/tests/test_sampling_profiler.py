@@ -0,0 +1,82 @@
+import hashlib
+import os
+import threading
+import time
+from backend.config import DEFAULT_ROOT_ACCOUNT_ID, DEFAULT_ROOT_ACCOUNT_PASSWORD
+from backend.database.sampling_profiler import RequestProfiler, StackSampler
+from backend.monitoring.service.request_profiling import request_profiler
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+# 1. 등록한 스레드의 호출 스택이 collapsed-stack 형식으로 모이는지 테스트
+def test_stack_sampler_collapsed(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,))
+    worker.start()
+    sampler = StackSampler(interval_seconds=0.001, path=str(tmp_path / "busy.collapsed"))
+    sampler.start()
+    sampler.track(worker.ident)
+    time.sleep(0.1)
+    sampler.untrack(worker.ident)
+    sampler.stop()
+    stop.set()
+    worker.join()
+    sampler.write()
+
+    lines = (tmp_path / "busy.collapsed").read_text().splitlines()
+    assert sampler.sample_count > 0
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == sampler.sample_count
+    assert any("busy_loop (" in line.split(";")[-1] for line in lines)
+
+
+# 2. 기간 안에 허용된 개수만큼만 프로파일링하고 오래된 파일은 정리하는지 테스트
+def test_request_profiler_rate_cap(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), max_profiles=2, window_seconds=60, max_files=3)
+
+    first = profiler.reserve("GET /api/user/")
+    second = profiler.reserve("GET /api/user/")
+    assert first and second and first != second
+    assert profiler.reserve("GET /api/user/") is None
+
+    # 기간이 지난 파일은 한도에서 빠지고, 보관 개수를 넘으면 가장 오래된 파일부터 삭제함
+    old = time.time() - 120
+    for path in (first, second):
+        os.utime(path, (old, old))
+    assert profiler.reserve("GET /api/user/") is not None
+    assert profiler.reserve("GET /api/user/") is not None
+    assert not os.path.exists(first)
+    assert len(os.listdir(tmp_path)) == 3
+
+
+# 3. 관리자가 동기 엔드포인트를 요청한 경우에만 요청을 프로파일링하고 파일 이름을 응답 헤더로 알려주는지 테스트
+def test_admin_request_profile(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(request_profiler, "directory", str(tmp_path))
+
+    assert client.get("/api/user/", params={"profile": "1"}).status_code != 200
+    assert not os.listdir(tmp_path)
+
+    response = client.post(
+        "/api/login",
+        json={
+            "user_id": DEFAULT_ROOT_ACCOUNT_ID,
+            "password": hashlib.sha256(DEFAULT_ROOT_ACCOUNT_PASSWORD.encode("utf-8")).hexdigest(),
+        },
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/user/", headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    name = response.headers["X-Profile"]
+    assert name.endswith(".collapsed")
+    assert os.listdir(tmp_path) == [name]
+
+    assert "X-Profile" not in client.get("/api/user/").headers
+
+    # async 엔드포인트는 이벤트 루프를 함께 쓰는 다른 요청이 섞이므로 프로파일링하지 않음
+    response = client.get("/api/log/user", headers={"X-Profile": "1"})
+    assert response.headers["X-Profile"] == "unsupported"
+    assert os.listdir(tmp_path) == [name]
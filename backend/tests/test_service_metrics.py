@@ -0,0 +1,54 @@
+import pytest
+from backend.database.base_database_manager import BaseManager
+from backend.monitoring.service.metrics import (
+    SERVICE_METHOD_DURATION,
+    SERVICE_METHOD_EXCEPTIONS,
+    service_method_stats,
+)
+
+
+class SampleManager(BaseManager):
+    def find(self, value):
+        return value
+
+    def fail(self):
+        raise ValueError("실패")
+
+    def _helper(self):
+        return "helper"
+
+
+def samples(metric, method):
+    return [sample for sample in metric.collect() if sample[0][0] == method]
+
+
+# 1. 공개 메서드의 호출 수, 지연 시간, 예외가 기록되는지 테스트
+def test_public_methods_instrumented():
+    manager = object.__new__(SampleManager)
+
+    assert manager.find(3) == 3
+    assert manager.find(4) == 4
+    with pytest.raises(ValueError):
+        manager.fail()
+
+    [[_, counts, total]] = samples(SERVICE_METHOD_DURATION, "SampleManager.find")
+    assert sum(counts) == 2
+    assert total >= 0
+    assert samples(SERVICE_METHOD_EXCEPTIONS, "SampleManager.fail") == [
+        [["SampleManager.fail", "ValueError"], 1]
+    ]
+    assert SampleManager.find.__name__ == "find"
+
+
+# 2. 내부 메서드는 감싸지 않고, 통계에 분위수가 포함되는지 테스트
+def test_private_methods_skipped_and_stats():
+    manager = object.__new__(SampleManager)
+
+    assert SampleManager._helper is SampleManager.__dict__["_helper"]
+    assert manager._helper() == "helper"
+    assert samples(SERVICE_METHOD_DURATION, "SampleManager._helper") == []
+
+    manager.find(1)
+    [stat] = [stat for stat in service_method_stats() if stat["method"] == "SampleManager.find"]
+    assert stat["calls"] >= 1
+    assert stat["p50_ms"] <= stat["p95_ms"] <= stat["p99_ms"]
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from fastapi import HTTPException, Response, Request
+from backend.auth.service import session_manager as session_manager_module
 from backend.auth.service.session_manager import SessionManager
 from backend.auth.database.models import SessionModel
 from datetime import datetime, timedelta
@@ -116,18 +117,27 @@ def test_delete_session_not_found(mock_db):
     mock_db.commit.assert_not_called()
 
 
-# 8. 만료된 세션 삭제 테스트
-def test_delete_expired_sessions(mock_db):
-    expired_sessions = [
-        MagicMock(session_id="expired_1"),
-        MagicMock(session_id="expired_2"),
+# 8. 만료된 세션을 배치마다 한 번의 DELETE로 지우고 검사, 삭제한 행 수를 알려주는지 테스트
+def test_delete_expired_sessions(mock_db, monkeypatch):
+    monkeypatch.setattr(session_manager_module, "SESSION_CLEANUP_BATCH_SIZE", 2)
+    mock_filter = mock_db.query.return_value.filter.return_value
+    mock_filter.limit.return_value.all.side_effect = [
+        [MagicMock(session_id="expired_1"), MagicMock(session_id="expired_2")],
+        [MagicMock(session_id="expired_3")],
     ]
-    mock_db.query().filter().all.return_value = expired_sessions
+    mock_filter.delete.side_effect = [2, 1]
+    stats = {}
 
-    session_manager.delete_expired_sessions()
+    try:
+        assert session_manager.delete_expired_sessions(stats=stats) == 3
 
-    assert mock_db.delete.call_count == len(expired_sessions)  # 만료된 세션 개수만큼 삭제 호출
-    mock_db.commit.assert_called()
+        assert stats == {"scanned": 3, "affected": 3}
+        assert mock_filter.delete.call_count == 2  # 세션마다가 아니라 배치마다 삭제
+        mock_db.delete.assert_not_called()
+        assert mock_db.commit.call_count == 2
+    finally:
+        mock_filter.limit.return_value.all.side_effect = None
+        mock_filter.delete.side_effect = None
 
 
 # 9. 어드민 권한 세션 검증 성공 테스트
@@ -161,11 +171,19 @@ def test_validate_admin_session_fail(mock_db):
 
 # 11. 모든 사용자 세션 삭제 테스트
 def test_delete_session_user_id(mock_db):
-    user_sessions = [MagicMock(session_id="session_1"), MagicMock(session_id="session_2")]
-
-    mock_db.query().filter().all.return_value = user_sessions
-
     session_manager.delete_session_user_id("test_user")
 
-    assert mock_db.delete.call_count == len(user_sessions)  # 사용자의 모든 세션 삭제
+    mock_db.query().filter().delete.assert_called_once_with(synchronize_session=False)
+    mock_db.delete.assert_not_called()  # 세션을 한 건씩 불러와 삭제하지 않음
     mock_db.commit.assert_called()
+
+
+# 12. 여러 사용자의 세션을 한 번에 삭제하는 테스트
+def test_delete_sessions_user_ids(mock_db):
+    mock_db.query().filter().delete.return_value = 3
+
+    deleted = session_manager.delete_sessions_user_ids(["user_1", "user_2"])
+
+    assert deleted == 3
+    assert session_manager.delete_sessions_user_ids([]) == 0
+    mock_db.commit.assert_called_once()
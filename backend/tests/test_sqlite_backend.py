@@ -0,0 +1,162 @@
+import hashlib
+import threading
+import uuid
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, String, func, insert, select, text
+from sqlalchemy.orm import declarative_base
+from backend.config import DEFAULT_ROOT_ACCOUNT_ID, DEFAULT_ROOT_ACCOUNT_PASSWORD
+from backend.database import base_database_manager
+from backend.database.base_database_manager import BaseManager
+from backend.database.query_profiler import profile_queries
+from backend.main import app
+
+ItemBase = declarative_base()
+
+
+class Item(ItemBase):
+    __tablename__ = "item"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(50), nullable=False)
+
+
+def sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+# 1. SQLite 파일 DB에 WAL 등 설정이 적용되고 여러 스레드에서 동시에 써도 실패하지 않는지 테스트
+def test_sqlite_file_database(tmp_path):
+    uri = f"sqlite:///{tmp_path}/nested/items.db"
+    manager = BaseManager(ItemBase, uri, uri, "false")
+
+    with manager.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+
+    errors = []
+
+    def write(worker):
+        try:
+            for index in range(50):
+                with manager.engine.begin() as connection:
+                    connection.execute(insert(Item), {"name": f"{worker}-{index}"})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with manager.engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(Item)).scalar() == 400
+    manager.engine.dispose()
+
+
+# 2. 같은 메모리 DB URI를 쓰는 매니저가 데이터를 공유하고 SQL 문이 한 번만 기록되는지 테스트
+def test_sqlite_memory_database_is_shared():
+    uri = f"sqlite:///file:items_{uuid.uuid4().hex}?mode=memory&uri=true"
+    first = BaseManager(ItemBase, uri, uri, "false")
+    second = BaseManager(ItemBase, uri, uri, "false")
+
+    session = first.get_session()
+    try:
+        session.add(Item(name="shared"))
+        session.commit()
+    finally:
+        session.close()
+
+    with profile_queries("items") as profile:
+        with second.engine.connect() as connection:
+            names = connection.execute(select(Item.name)).scalars().all()
+
+    assert second.engine is first.engine
+    assert names == ["shared"]
+    assert profile.count == 1
+
+
+# 3. Mock 없이 실제 SQL로 사용자 생성, 로그인, 권한 확인, 감사 로그 조회가 동작하는지 테스트
+def test_user_lifecycle_with_real_database(client):
+    user_id = f"sqlite_{uuid.uuid4().hex[:8]}"
+    response = client.post(
+        "/api/login",
+        json={"user_id": DEFAULT_ROOT_ACCOUNT_ID, "password": sha256(DEFAULT_ROOT_ACCOUNT_PASSWORD)},
+    )
+    assert response.status_code == 200
+
+    response = client.post(
+        "/api/user/",
+        json={
+            "user_id": user_id,
+            "password": sha256("password1234"),
+            "role": "user",
+            "request_user": DEFAULT_ROOT_ACCOUNT_ID,
+        },
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/user/", params={"user_id": user_id, "search_mode": "exact"})
+    assert [user["user_id"] for user in response.json()["users"]] == [user_id]
+
+    response = client.get(
+        "/api/log/user", params={"user_id": DEFAULT_ROOT_ACCOUNT_ID, "search_mode": "exact"}
+    )
+    assert any(
+        log["action"] == "사용자 생성" and user_id in log["details"]
+        for log in response.json()["logs"]
+    )
+
+    user_client = TestClient(app)
+    response = user_client.post(
+        "/api/login", json={"user_id": user_id, "password": sha256("password1234")}
+    )
+    assert response.status_code == 200
+    assert user_client.get("/api/session/role").json() == {"role": "user"}
+    assert user_client.get("/api/user/").status_code == 403
+
+
+# 4. 여러 워커가 동시에 스키마를 만들거나 다른 워커가 먼저 컬럼, 인덱스를 추가해도 시작에 실패하지 않는지 테스트
+def test_concurrent_schema_creation(tmp_path, monkeypatch):
+    uri = f"sqlite:///{tmp_path}/schema.db"
+    BaseManager(ItemBase, uri, uri, "false").engine.dispose()
+
+    WideBase = declarative_base()
+
+    class WideItem(WideBase):
+        __tablename__ = "item"
+
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        name = Column(String(50), nullable=False)
+        note = Column(String(50), nullable=True, index=True)
+
+    errors = []
+
+    def start_worker():
+        try:
+            BaseManager(WideBase, uri, uri, "false").engine.dispose()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=start_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    # 컬럼 목록을 읽은 뒤 다른 워커가 같은 컬럼을 추가한 경우
+    manager = BaseManager(WideBase, uri, uri, "false")
+    stale_columns = [{"name": "id"}, {"name": "name"}]
+    monkeypatch.setattr(
+        base_database_manager,
+        "inspect",
+        lambda engine: SimpleNamespace(get_columns=lambda table_name: stale_columns),
+    )
+    manager.create_missing_columns(WideBase)
+    with manager.engine.connect() as connection:
+        columns = [row[1] for row in connection.execute(text("PRAGMA table_info(item)"))]
+    assert columns.count("note") == 1
+    manager.engine.dispose()
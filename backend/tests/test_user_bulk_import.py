@@ -0,0 +1,56 @@
+import asyncio
+import pytest
+from backend.auth.service.user_bulk_import import BulkUserParser, iter_lines
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def collect_lines(*parts):
+    async def collect():
+        return [line async for line in iter_lines(chunks(*parts))]
+
+    return asyncio.run(collect())
+
+
+# 1. 청크 경계에서 나뉜 줄과 멀티바이트 문자를 올바르게 합치는지 테스트
+def test_iter_lines_across_chunks():
+    body = '{"user_id": "김철수"}\r\n{"user_id": "lee"}'.encode("utf-8")
+
+    lines = collect_lines(body[:5], body[5:17], body[17:])
+
+    assert lines == ['{"user_id": "김철수"}', '{"user_id": "lee"}']
+
+
+# 2. NDJSON 파싱 및 잘못된 줄 처리 테스트
+def test_parse_ndjson():
+    parser = BulkUserParser("ndjson")
+
+    first = parser.parse_line('{"user_id": " kim ", "password": "pw", "role": "admin"}')
+    assert parser.parse_line("") is None
+    broken = parser.parse_line("{not json")
+
+    assert first == {
+        "line": 1,
+        "error": None,
+        "user_id": "kim",
+        "password": "pw",
+        "role": "admin",
+    }
+    assert broken["line"] == 3
+    assert broken["error"] is not None
+
+
+# 3. CSV 헤더 처리 및 필수 컬럼 누락 테스트
+def test_parse_csv():
+    parser = BulkUserParser("csv")
+
+    assert parser.parse_line("user_id,password") is None
+    entry = parser.parse_line("park,pw")
+    assert entry["user_id"] == "park"
+    assert entry["role"] is None
+
+    with pytest.raises(ValueError):
+        BulkUserParser("csv").parse_line("user_id,role")
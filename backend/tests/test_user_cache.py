@@ -0,0 +1,53 @@
+from backend.auth.service.user_cache import UserCache, UserSnapshot
+
+
+def make_snapshot(user_id="kim", is_locked=False):
+    return UserSnapshot(
+        id=user_id,
+        role="user",
+        password="hashed",
+        salt="salt",
+        is_locked=is_locked,
+        logins_before_rehash=0,
+    )
+
+
+# 1. 저장한 스냅샷 조회와 대소문자가 다른 ID 조회 테스트
+def test_get_returns_snapshot_for_exact_id():
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    cache.set(make_snapshot("Kim"))
+
+    assert cache.get("Kim") == make_snapshot("Kim")
+    assert cache.get("kim") is None  # DB의 비교 규칙에 맡기도록 캐시를 사용하지 않음
+    assert cache.get("lee") is None
+
+
+# 2. 최대 개수를 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트
+def test_least_recently_used_entry_is_evicted():
+    cache = UserCache(max_entries=2, ttl_seconds=60)
+    cache.set(make_snapshot("a"))
+    cache.set(make_snapshot("b"))
+    cache.get("a")
+    cache.set(make_snapshot("c"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+# 3. TTL 만료와 무효화 테스트
+def test_expired_and_invalidated_entries_are_removed():
+    expired_cache = UserCache(max_entries=10, ttl_seconds=-1)
+    assert not expired_cache.enabled
+
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    cache.set(make_snapshot("a"))
+    cache.set(make_snapshot("b"))
+    cache.set(make_snapshot("c"))
+
+    cache.invalidate("A")
+    assert cache.get("a") is None
+    cache.invalidate(["b"])
+    assert cache.get("b") is None
+    cache.invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Query
+from backend.auth.database.models import User
+from backend.database.base_database_manager import BaseManager
+from backend.database.user_id_search import user_id_condition, user_id_matches
+
+
+def compile_mysql(condition):
+    return str(
+        condition.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+# 1. 기본 검색 방식은 인덱스를 사용할 수 있는 접두사 검색
+def test_prefix_condition_is_index_friendly():
+    sql = compile_mysql(user_id_condition(User.id, "adm"))
+
+    assert "LIKE 'adm%%'" in sql or "LIKE 'adm%'" in sql
+    assert "'%adm" not in sql
+
+
+# 2. LIKE 와일드카드 문자 이스케이프 테스트
+def test_like_wildcards_are_escaped():
+    sql = compile_mysql(user_id_condition(User.id, "a_b%", "contains"))
+
+    assert "a\\\\_b\\\\%" in sql or "a\\_b\\%" in sql
+
+
+# 3. 전문 인덱스가 있을 때 MATCH ... AGAINST 사용
+def test_fulltext_condition_uses_match():
+    sql = compile_mysql(user_id_condition(User.id, "min", "fulltext", fulltext=True))
+
+    assert "MATCH(`user`.`id`)" in sql
+    assert "LIKE" in sql
+
+
+# 4. 전문 인덱스가 없으면 부분 문자열 검색으로 대체
+def test_fulltext_falls_back_to_contains():
+    sql = compile_mysql(user_id_condition(User.id, "min", "fulltext", fulltext=False))
+
+    assert "MATCH" not in sql
+    assert "'%%min%%'" in sql or "'%min%'" in sql
+
+
+# 5. 지원하지 않는 검색 방식 테스트
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        user_id_condition(User.id, "a", "regex")
+
+
+# 6. 캐시 무효화용 매칭 테스트
+def test_user_id_matches():
+    assert user_id_matches("Adm", "admin", "prefix")
+    assert not user_id_matches("min", "admin", "prefix")
+    assert user_id_matches("min", "admin", "contains")
+    assert user_id_matches("admin", "ADMIN", "exact")
+
+
+# 7. 실행 계획 추정에서 검색어가 SQL에 섞이지 않고 바인딩 값으로 전달되는지 테스트
+def test_estimate_query_rows_binds_search_term():
+    session = MagicMock()
+    session.get_bind.return_value.dialect = mysql.dialect(paramstyle="pyformat")
+    execute = session.connection.return_value.exec_driver_sql
+    execute.return_value.mappings.return_value.first.return_value = {"rows": 40, "filtered": 50}
+    query = Query(User).filter(user_id_condition(User.id, "a:b%c", "contains"))
+
+    assert BaseManager.estimate_query_rows(None, session, query) == 20
+
+    statement, params = execute.call_args.args
+    assert statement.startswith("EXPLAIN SELECT")
+    assert "a:b" not in statement
+    assert "%a:b\\%c%" in params.values()
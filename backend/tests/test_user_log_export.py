@@ -0,0 +1,55 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from backend.log.service.user_log_export import encode_user_logs
+
+
+def make_rows(count):
+    return [
+        {
+            "id": i,
+            "user_id": f"export_user_{i}",
+            "action": "로그인",
+            "success": i % 2 == 0,
+            "error_code": None if i % 2 == 0 else 401,
+            "details": "사용자가 성공적으로 로그인했습니다.",
+            "log_timestamp": datetime(2024, 1, 1, 12, 0, i % 60),
+            "occurrence_count": 1,
+            "first_seen_at": None,
+        }
+        for i in range(count)
+    ]
+
+
+# 1. NDJSON 내보내기 테스트
+def test_encode_ndjson():
+    body = b"".join(encode_user_logs(iter(make_rows(3)), "ndjson"))
+    lines = body.decode("utf-8").splitlines()
+
+    assert len(lines) == 3
+    first = json.loads(lines[0])
+    assert first["user_id"] == "export_user_0"
+    assert first["action"] == "로그인"
+    assert first["log_timestamp"] == "2024-01-01T12:00:00"
+
+
+# 2. CSV 내보내기 테스트
+def test_encode_csv():
+    body = b"".join(encode_user_logs(iter(make_rows(2)), "csv"))
+    reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+    rows = list(reader)
+
+    assert len(rows) == 2
+    assert rows[1]["error_code"] == "401"
+    assert rows[1]["success"] == "False"
+
+
+# 3. gzip 압축 및 여러 청크로 나누어 전송하는지 테스트
+def test_encode_gzip_in_chunks():
+    chunks = list(encode_user_logs(iter(make_rows(5000)), "ndjson", use_gzip=True))
+    body = gzip.decompress(b"".join(chunks)).decode("utf-8")
+
+    assert len(chunks) > 1
+    assert len(body.splitlines()) == 5000
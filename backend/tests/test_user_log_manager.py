@@ -1,8 +1,15 @@
 import pytest
+import uuid
 from unittest.mock import MagicMock, patch
 from backend.log.service.user_log_manager import UserLogManager
-from backend.log.database.models import UserLog
-from datetime import datetime
+from backend.log.database.models import UserLog, UserLogDailyRollup
+from backend.log.service.audit_spool import AuditSpool
+from backend.log.service.log_archive import LogArchive
+from backend.config import OPERATION_LOG_RETENTION_PERIOD
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 
 @pytest.fixture
@@ -16,6 +23,8 @@ def user_log_manager(mock_session):
     """UserLogManager 인스턴스 생성 및 get_session 메서드 Mocking"""
     user_log_manager = UserLogManager()
     user_log_manager.get_session = MagicMock(return_value=mock_session)
+    user_log_manager.get_write_session = MagicMock(return_value=mock_session)
+    user_log_manager.log_archive = None  # 아카이브는 필요한 테스트에서만 임시 디렉터리로 설정
     return user_log_manager
 
 
@@ -156,12 +165,299 @@ def test_get_user_logs_pagination(user_log_manager, mock_session):
 # 6. 만료된 로그 삭제 테스트
 def test_delete_expired_logs(user_log_manager, mock_session):
     mock_session.reset_mock()
-    expired_log = UserLog(user_id="expired_log_user", action="LOGIN", success=True)
-
-    mock_session.query.return_value.filter.return_value.all.return_value = [expired_log]
+    mock_filter = mock_session.query.return_value.filter.return_value
+    mock_filter.order_by.return_value.limit.return_value.all.return_value = [
+        MagicMock(id=1),
+        MagicMock(id=2),
+    ]
+    mock_filter.delete.return_value = 2
 
-    user_log_manager.delete_expired_logs()
+    deleted = user_log_manager.delete_expired_logs()
 
-    mock_session.query.return_value.filter.assert_called()
-    mock_session.delete.assert_called_with(expired_log)
+    assert deleted == 2
+    mock_filter.delete.assert_called_with(synchronize_session=False)
+    mock_session.delete.assert_not_called()  # ORM 객체를 하나씩 삭제하지 않음
     mock_session.commit.assert_called()
+
+
+# 6-1. 만료된 로그를 배치 단위로 나누어 삭제하는지 테스트
+def test_delete_expired_logs_in_batches(user_log_manager, mock_session):
+    mock_session.reset_mock()
+    mock_filter = mock_session.query.return_value.filter.return_value
+    mock_filter.order_by.return_value.limit.return_value.all.side_effect = [
+        [MagicMock(id=1), MagicMock(id=2)],
+        [MagicMock(id=3)],
+    ]
+    mock_filter.delete.side_effect = [2, 1]
+
+    with patch(
+        "backend.log.service.user_log_manager.OPERATION_LOG_PURGE_BATCH_SIZE", 2
+    ):
+        deleted = user_log_manager.delete_expired_logs()
+
+    assert deleted == 3
+    assert mock_session.commit.call_count == 2  # 배치마다 짧은 트랜잭션으로 커밋
+
+
+# 6-2. 한 번의 실행에서 삭제하는 배치 수를 제한하는지 테스트
+def test_delete_expired_logs_max_batches(user_log_manager, mock_session):
+    mock_session.reset_mock()
+    mock_filter = mock_session.query.return_value.filter.return_value
+    mock_filter.order_by.return_value.limit.return_value.all.return_value = [
+        MagicMock(id=1),
+        MagicMock(id=2),
+    ]
+    mock_filter.delete.return_value = 2
+
+    with patch(
+        "backend.log.service.user_log_manager.OPERATION_LOG_PURGE_BATCH_SIZE", 2
+    ):
+        deleted = user_log_manager.delete_expired_logs(max_batches=3)
+
+    assert deleted == 6  # 남은 로그는 다음 실행에서 이어서 삭제함
+    assert mock_session.commit.call_count == 3
+
+
+# 7. 총 개수 캐시 테스트
+def test_get_user_logs_count_is_cached(user_log_manager, mock_session):
+    mock_session.reset_mock()
+    user_log_manager.count_cache.invalidate()
+
+    mock_filter = MagicMock()
+    mock_session.query.return_value.filter.return_value = mock_filter
+    mock_filter.order_by.return_value = mock_filter
+    mock_filter.count.return_value = 3
+    mock_filter.all.return_value = []
+
+    _, total1 = user_log_manager.get_user_logs(user_id="count_cache_user")
+    _, total2 = user_log_manager.get_user_logs(user_id="count_cache_user")
+
+    assert total1 == total2 == 3
+    mock_filter.count.assert_called_once()
+
+
+# 8. 로그 저장 시 일치하는 캐시 무효화 테스트
+def test_save_user_log_invalidates_matching_counts(user_log_manager, mock_session):
+    user_log_manager.count_cache.invalidate()
+    matching = user_log_manager.count_cache.make_key(user_id="cache_user")
+    other = user_log_manager.count_cache.make_key(user_id="other")
+    user_log_manager.count_cache.set(matching, 10)
+    user_log_manager.count_cache.set(other, 20)
+
+    user_log_manager.save_user_log("cache_user_1", "LOGIN", True)
+
+    assert user_log_manager.count_cache.get(matching) is None
+    assert user_log_manager.count_cache.get(other) == 20
+
+
+# 9. 로그 저장 시 일별 통계 갱신 테스트
+def test_save_user_log_updates_rollup(user_log_manager, mock_session):
+    mock_session.reset_mock()
+    mock_session.get_bind.return_value.dialect.name = "unknown"
+    mock_session.query.return_value.filter.return_value.update.return_value = 0
+
+    user_log_manager.save_user_log("rollup_user", "LOGIN", False, 401, "failed")
+
+    added = [call.args[0] for call in mock_session.add.call_args_list]
+    rollup = next(obj for obj in added if isinstance(obj, UserLogDailyRollup))
+    assert rollup.action == "LOGIN"
+    assert rollup.success is False
+    assert rollup.count == 1
+    mock_session.commit.assert_called_once()  # 로그와 통계를 같은 트랜잭션에서 커밋
+
+
+# 10. 잘못된 날짜로 통계 조회 시 예외 테스트
+def test_get_log_rollups_invalid_date(user_log_manager):
+    with pytest.raises(ValueError):
+        user_log_manager.get_log_rollups("2024/01/01", "2024-01-31")
+
+
+# 11. DB 장애 시 로컬 스풀로 대체 저장 후 재처리 테스트
+def test_save_user_log_spools_when_database_fails(user_log_manager, mock_session, tmp_path):
+    mock_session.reset_mock()
+    original_spool = user_log_manager.audit_spool
+    user_log_manager.audit_spool = AuditSpool(str(tmp_path))
+    mock_session.commit.side_effect = OperationalError("INSERT", {}, Exception("down"))
+
+    try:
+        user_log_manager.save_user_log("spool_user", "LOGIN", False, 401, "failed")
+        user_log_manager.save_user_log("spool_user", "LOGIN", True)  # 재시도 시간 전에는 DB를 건너뜀
+
+        assert mock_session.commit.call_count == 1
+        mock_session.rollback.assert_called()
+
+        mock_session.commit.side_effect = None
+        mock_session.get_bind.return_value.dialect.name = "unknown"
+        replayed = user_log_manager.replay_spooled_logs()
+
+        assert replayed == 2
+        inserted_rows = mock_session.execute.call_args_list[0].args[1]
+        assert [row["user_id"] for row in inserted_rows] == ["spool_user", "spool_user"]
+        assert user_log_manager.audit_db_retry_at == 0
+        assert user_log_manager.audit_spool.pending_bytes() == 0
+    finally:
+        user_log_manager.audit_spool = original_spool
+        user_log_manager.audit_db_retry_at = 0
+
+
+# 12. 만료된 로그를 아카이브한 뒤 삭제하고, 오래된 기간 조회 시 함께 반환하는지 테스트
+def test_expired_logs_are_archived_and_queried(user_log_manager, mock_session, tmp_path):
+    mock_session.reset_mock()
+    user_log_manager.count_cache.invalidate()
+    user_log_manager.log_archive = LogArchive(str(tmp_path))
+    expired_at = datetime.now().replace(microsecond=0) - timedelta(
+        days=OPERATION_LOG_RETENTION_PERIOD + 1
+    )
+    mock_filter = mock_session.query.return_value.filter.return_value
+    mock_filter.order_by.return_value.limit.return_value.all.return_value = [
+        SimpleNamespace(
+            id=1,
+            user_id="archived_user",
+            action_code=None,
+            action_text="LOGIN",
+            success=True,
+            error_code=None,
+            details_template=None,
+            details_params=None,
+            details_text="User logged in",
+            log_timestamp=expired_at,
+            occurrence_count=1,
+            first_seen_at=None,
+        )
+    ]
+    mock_filter.delete.return_value = 1
+
+    assert user_log_manager.delete_expired_logs() == 1
+    assert user_log_manager.log_archive.count() == 1
+
+    mock_session.reset_mock()
+    mock_filter = MagicMock()
+    mock_session.query.return_value.filter.return_value = mock_filter
+    mock_filter.filter.return_value = mock_filter
+    mock_filter.order_by.return_value = mock_filter
+    mock_filter.limit.return_value.offset.return_value.all.return_value = []
+    mock_filter.count.return_value = 0
+
+    logs, total = user_log_manager.get_user_logs(
+        user_id="archived_user",
+        start_date=(expired_at - timedelta(days=1)).strftime("%Y-%m-%d"),
+        page=1,
+        per_page=10,
+    )
+
+    assert total == 1
+    assert [(log.id, log.action, log.details) for log in logs] == [
+        (1, "LOGIN", "User logged in")
+    ]
+    assert logs[0].log_timestamp == expired_at
+
+
+# 13. 반복되는 같은 실패는 한 행으로 묶고 발생 횟수만 반영하는지 테스트
+def test_repeated_failures_are_collapsed(user_log_manager, mock_session, monkeypatch):
+    published = []
+    monkeypatch.setattr(user_log_manager.event_bus, "publish", published.append)
+    mock_session.reset_mock()
+    mock_session.get_bind.return_value.dialect.name = "mysql"
+    mock_session.flush.side_effect = lambda: setattr(
+        mock_session.add.call_args_list[0].args[0], "id", 42
+    )
+    user_log_manager.log_bursts.clear()
+
+    try:
+        for _ in range(3):
+            user_log_manager.save_user_log("burst_user", "로그인", False, 401, "failed")
+        user_log_manager.save_user_log("burst_user", "로그인", False, 403, "locked")
+
+        assert mock_session.add.call_count == 2  # 에러 코드가 다른 실패는 따로 기록
+        first_log = mock_session.add.call_args_list[0].args[0]
+        assert first_log.first_seen_at == first_log.log_timestamp
+        # 묶인 실패는 새 로그가 아니라 기존 행의 발생 횟수 갱신으로 알림
+        assert [(event.get("type"), event["id"]) for event in published[:3]] == [
+            (None, 42),
+            ("occurrence", 42),
+            ("occurrence", 42),
+        ]
+        assert [event.get("occurrence_count") for event in published[1:3]] == [2, 3]
+
+        mock_session.reset_mock()
+        flushed = user_log_manager.flush_log_bursts()
+
+        assert flushed == 2
+        mock_session.query.return_value.filter.return_value.update.assert_called_once()
+        mock_session.commit.assert_called_once()
+        assert user_log_manager.flush_log_bursts() == 0
+    finally:
+        mock_session.flush.side_effect = None
+        user_log_manager.log_bursts.clear()
+
+
+# 14. 묶인 실패가 있어도 집계 재구성 후 일별 집계 수가 달라지지 않는지 테스트
+def test_rebuild_rollups_counts_collapsed_failures(monkeypatch):
+    manager = UserLogManager()
+    # 이 모듈의 fixture가 싱글턴의 세션을 Mock으로 바꿔두므로 이 테스트 동안은 실제 DB를 사용함
+    for name in ("get_session", "get_write_session"):
+        if name in vars(manager):
+            monkeypatch.delattr(manager, name)
+    monkeypatch.setattr(manager, "audit_db_retry_at", 0)
+    action = f"burst_{uuid.uuid4().hex[:8]}"
+    manager.log_bursts.clear()
+
+    def rollup_count():
+        session = manager.get_session()
+        try:
+            return (
+                session.query(func.sum(UserLogDailyRollup.count))
+                .filter(UserLogDailyRollup.action == action)
+                .scalar()
+            )
+        finally:
+            session.close()
+
+    try:
+        for _ in range(3):
+            manager.save_user_log("burst_user", action, False, 401, "failed")
+        manager.flush_log_bursts()
+        assert rollup_count() == 3
+
+        manager.rebuild_log_rollups()
+
+        assert rollup_count() == 3
+    finally:
+        manager.log_bursts.clear()
+
+
+# 15. 로그 내보내기에 목록 조회와 같이 보관된 로그가 오래된 순서로 먼저 포함되는지 테스트
+def test_stream_user_logs_includes_archive(user_log_manager, tmp_path, monkeypatch):
+    user_log_manager.log_archive = LogArchive(str(tmp_path), block_rows=1)
+    expired_at = datetime.now().replace(microsecond=0) - timedelta(
+        days=OPERATION_LOG_RETENTION_PERIOD + 1
+    )
+    user_log_manager.log_archive.write(
+        [
+            {
+                "id": log_id,
+                "user_id": "archived_user",
+                "action": "LOGIN",
+                "success": True,
+                "error_code": None,
+                "details": None,
+                "log_timestamp": expired_at + timedelta(minutes=log_id),
+                "occurrence_count": 1,
+                "first_seen_at": None,
+            }
+            for log_id in (1, 2, 3)
+        ]
+    )
+    live_rows = [{"id": 4}]
+    monkeypatch.setattr(
+        user_log_manager, "_iterate_stream", lambda statement, batch_size: iter(live_rows)
+    )
+
+    rows = user_log_manager.stream_user_logs(
+        user_id="archived_user",
+        start_date=(expired_at - timedelta(days=1)).strftime("%Y-%m-%d"),
+    )
+
+    assert [row["id"] for row in rows] == [1, 2, 3, 4]
+    # 날짜 조건이 없으면 목록 조회와 마찬가지로 아카이브는 읽지 않음
+    assert list(user_log_manager.stream_user_logs(user_id="archived_user")) == live_rows
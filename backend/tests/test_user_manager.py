@@ -2,8 +2,13 @@ import pytest
 from unittest.mock import MagicMock, patch
 from backend.auth.service.user_manager import UserManager
 from backend.auth.database.models import User
+from backend.auth.service.user_cache import UserSnapshot
 from fastapi import HTTPException
 from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from backend.auth.service.session_manager import verify_admin_session
+from backend.config import DEFAULT_ROOT_ACCOUNT_ID
+from backend.main import app
 
 # Mock 객체 생성
 mock_session = MagicMock()
@@ -19,6 +24,7 @@ user_manager.get_session = MagicMock(return_value=mock_session)
 def mock_db_session():
     """각 테스트 실행 전 세션 초기화"""
     mock_session.reset_mock()
+    user_manager.user_cache.invalidate()
     yield mock_session
 
 
@@ -59,7 +65,7 @@ def test_login_success(mock_db_session):
 
     result = user_manager.login("test_user", "correct_password")
 
-    assert result == mock_user
+    assert result == UserSnapshot.from_user(mock_user)
     assert mock_user.failed_attempts == 0
     mock_db_session.commit.assert_called()
 
@@ -170,4 +176,163 @@ def test_change_password_fail_same_password(mock_db_session):
         user_manager.change_password("test_user", "old_password", "old_password")
 
     assert excinfo.value.status_code == 401
-    assert "새 비밀번호는 현재 비밀번호와 같을 수 없습니다." in str(excinfo.value.detail)
\ No newline at end of file
+    assert "새 비밀번호는 현재 비밀번호와 같을 수 없습니다." in str(excinfo.value.detail)
+
+
+# 11. 커서 기반 사용자 목록 조회 테스트
+def test_get_paginated_users_with_cursor(mock_db_session):
+    mock_query = mock_db_session.query.return_value
+    cursor_query = mock_query.filter.return_value.order_by.return_value
+    cursor_query.limit.return_value.all.return_value = [
+        MagicMock(id="user_011"),
+        MagicMock(id="user_012"),
+    ]
+
+    users, total = user_manager.get_paginated_users(
+        per_page=2, after="user_010", with_total=False
+    )
+
+    assert [user.id for user in users] == ["user_011", "user_012"]
+    assert total is None
+    query_columns = mock_db_session.query.call_args.args
+    assert User.password not in query_columns  # 응답에 필요한 컬럼만 조회
+    assert str(mock_query.filter.call_args.args[0]) == str(User.id > "user_010")
+    mock_query.offset.assert_not_called()
+
+
+# 12. 사용자 일괄 생성 시 중복과 잘못된 요청을 걸러내고 한 번에 삽입하는지 테스트
+def test_create_users_bulk(mock_db_session):
+    user_manager.hash_passwords = MagicMock(
+        side_effect=lambda passwords: [("salt", f"hashed_{p}") for p in passwords]
+    )
+    mock_db_session.query.return_value.filter.return_value.all.return_value = [
+        MagicMock(id="Existing")
+    ]
+
+    def entry(line, user_id, password="pw", role=None):
+        return {
+            "line": line,
+            "error": None,
+            "user_id": user_id,
+            "password": password,
+            "role": role,
+        }
+
+    results = user_manager.create_users_bulk(
+        [
+            entry(1, "new_user"),
+            entry(2, "existing"),
+            entry(3, "NEW_USER"),
+            entry(4, "bad_role", role="owner"),
+            entry(5, "admin_user", role="admin"),
+        ],
+        set(),
+    )
+
+    assert [result["status"] for result in results] == [
+        "created",
+        "duplicate",
+        "duplicate",
+        "invalid",
+        "created",
+    ]
+    inserted = mock_db_session.execute.call_args.args[1]
+    assert [(row["id"], row["role"]) for row in inserted] == [
+        ("new_user", "user"),
+        ("admin_user", "admin"),
+    ]
+    mock_db_session.commit.assert_called_once()
+
+
+# 13. 사용자 일괄 잠금이 대상 ID를 한 번 조회한 뒤 한 번의 UPDATE로 처리되는지 테스트
+def test_lock_accounts_bulk(mock_db_session):
+    mock_query = mock_db_session.query.return_value
+    target_query = mock_query.filter.return_value.filter.return_value.filter.return_value
+    target_query.all.return_value = [MagicMock(id="user_1"), MagicMock(id="user_2")]
+
+    locked_user_ids = user_manager.lock_accounts(user_ids=["user_1", "user_2", "user_3"])
+
+    assert locked_user_ids == ["user_1", "user_2"]
+    mock_query.filter.return_value.update.assert_called_once_with(
+        {User.is_locked: True, User.failed_attempts: 0}, synchronize_session=False
+    )
+    mock_db_session.commit.assert_called_once()
+
+    with pytest.raises(HTTPException) as excinfo:
+        user_manager.delete_users()
+
+    assert excinfo.value.status_code == 400
+
+
+# 14. 캐시된 사용자는 조회 없이 조건부 UPDATE 한 번으로 로그인되는지 테스트
+def test_login_uses_cached_snapshot(mock_db_session):
+    snapshot = UserSnapshot(
+        id="cached_user",
+        role="user",
+        password="hashed_password",
+        salt="test_salt",
+        is_locked=False,
+        logins_before_rehash=0,
+    )
+    user_manager.user_cache.set(snapshot)
+    user_manager.verify_password = MagicMock(return_value=True)
+    mock_db_session.query().filter().update.return_value = 1
+
+    result = user_manager.login("cached_user", "correct_password")
+
+    assert result.id == "cached_user"
+    assert result.logins_before_rehash == 1
+    mock_db_session.query().filter().one_or_none.assert_not_called()
+
+    # 다른 워커에서 변경되어 갱신된 행이 없으면 캐시를 버리고 DB에서 다시 읽음
+    mock_db_session.query().filter().update.return_value = 0
+    mock_user.is_locked = True
+    mock_db_session.query().filter().one_or_none.return_value = mock_user
+
+    with pytest.raises(HTTPException) as excinfo:
+        user_manager.login("cached_user", "correct_password")
+
+    assert excinfo.value.status_code == 403
+    assert user_manager.user_cache.get("cached_user") is None
+
+
+# 15. 계정 잠금 시 잠긴 사용자 수를 다시 세지 않고 캐시에서 증가시키는지 테스트
+def test_lock_account_adjusts_locked_count(mock_db_session):
+    mock_user.is_locked = False
+    mock_user.role = "user"
+    mock_db_session.query().filter().one_or_none.return_value = mock_user
+    mock_db_session.query().filter().count.return_value = 7
+    mock_db_session.query().filter().filter().count.return_value = 7
+    user_manager.count_cache.invalidate()
+
+    assert user_manager.count_users(is_locked=True) == (7, False)
+    assert user_manager.count_users(is_locked=True, role="admin") == (7, False)
+
+    user_manager.lock_account("test_user")
+
+    assert user_manager.count_users(is_locked=True) == (8, False)
+    assert user_manager.count_users(is_locked=True, role="admin") == (7, False)
+    mock_db_session.query().filter().count.assert_called_once()  # 잠금 후 다시 세지 않음
+
+
+# 16. 일괄 작업 요청의 미접속 기간과 권한을 검증하고 요청한 관리자 계정은 대상에서 제외하는지 테스트
+def test_bulk_targets_validation_and_self_exclusion(mock_db_session):
+    app.dependency_overrides[verify_admin_session] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/api/user/lock/bulk", json={"request_user": "admin_user", "inactive_days": 0}
+        )
+        assert response.status_code == 422
+        response = client.post(
+            "/api/user/lock/bulk", json={"request_user": "admin_user", "role": "root"}
+        )
+        assert response.status_code == 422
+    finally:
+        app.dependency_overrides.pop(verify_admin_session)
+
+    user_manager.delete_users(role="admin", exclude_user_id="admin_user")
+
+    filters = [call.args[0] for call in mock_db_session.mock_calls if call[0].endswith("filter")]
+    assert any(f.compare(User.id != DEFAULT_ROOT_ACCOUNT_ID) for f in filters)
+    assert any(f.compare(User.id != "admin_user") for f in filters)